@@ -0,0 +1,25 @@
+""" Benchmarks of PetSi on a set of reference models.
+
+.. rubric:: Synopsis
+
+.. code-block:: shell
+
+    python -m benchmarks --build both --output results.json
+    python -m benchmarks --quick
+
+The reference models are defined in :mod:`benchmarks.models`:
+
+- the loopback net of ``examples/01-Simple loopback.ipynb``,
+- an M/M/c queue,
+- a fork-join queue,
+- a polling system and
+- randomly generated nets of 10\\ :sup:`2` to 10\\ :sup:`5` nodes.
+
+For each model :mod:`benchmarks.runner` measures the time to build the net, the cost of registering the meter plugins,
+the firings per second without meters, the overhead of each meter and the peak memory used.
+The results are written as JSON, one record per measurement, with the build of PetSi (``pure`` Python or
+``compiled`` Cython extension modules) they were measured with.
+
+The pure Python build is measured by loading the ``.py`` source of the modules that have a Cython extension module,
+see :mod:`benchmarks.builds`. Each build is measured in a process of its own.
+"""
@@ -0,0 +1,79 @@
+""" The command line interface of the benchmarks, see ``python -m benchmarks --help``."""
+import json
+import os
+import subprocess
+import sys
+from argparse import ArgumentParser
+from tempfile import TemporaryDirectory
+
+from .builds import PURE, COMPILED, force_pure_python
+
+CURRENT = "current"
+BOTH = "both"
+
+# The directory to run the benchmarks of the individual builds from, so that the benchmarks package is found
+_ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main(argv=None):
+    parser = ArgumentParser(prog="python -m benchmarks", description="Benchmark PetSi on the reference models.")
+    parser.add_argument("--build", choices=(CURRENT, PURE, COMPILED, BOTH), default=CURRENT,
+                        help="The build of PetSi to measure; 'current' is the one imported by default.")
+    parser.add_argument("--output", default="-", help="The JSON file to write the results to, '-' for stdout.")
+    parser.add_argument("--models", nargs="*", default=None, help="The canonical models to measure (default: all).")
+    parser.add_argument("--sizes", nargs="*", type=int, default=None,
+                        help="The number of nodes of the random nets to measure.")
+    parser.add_argument("--firings", type=int, default=None, help="The number of firings per measurement.")
+    parser.add_argument("--repeat", type=int, default=None, help="The number of repetitions to take the best of.")
+    parser.add_argument("--quick", action="store_true", help="Measure small nets with few firings, once.")
+    args = parser.parse_args(argv)
+
+    if args.build == BOTH:
+        runs = list()
+
+        with TemporaryDirectory() as directory:
+            for build in (PURE, COMPILED):
+                output = os.path.join(directory, f"{build}.json")
+                command = [sys.executable, "-m", "benchmarks"] + list(sys.argv[1:] if argv is None else argv) + \
+                    ["--build", build, "--output", output]
+
+                if subprocess.run(command, cwd=_ROOT_DIRECTORY).returncode != 0:
+                    print(f"The {build} build could not be measured", file=sys.stderr)
+                    continue
+
+                with open(output) as file:
+                    runs.extend(json.load(file)["runs"])
+
+        _write(runs, args.output)
+        return
+
+    if args.build == PURE:
+        force_pure_python()
+
+    from .builds import current_build
+    from .runner import RANDOM_NET_SIZES, run
+
+    if args.build == COMPILED and current_build() != COMPILED:
+        sys.exit("The Cython extension modules of petsi are not built")
+
+    parameters = dict(sizes=(100, 1000) if args.quick else RANDOM_NET_SIZES,
+                      firings=10000 if args.quick else 100000,
+                      repeat=1 if args.quick else 3)
+    parameters.update((name, value) for name, value in
+                      dict(models=args.models, sizes=args.sizes, firings=args.firings, repeat=args.repeat).items()
+                      if value is not None)
+    _write([run(**parameters)], args.output)
+
+
+def _write(runs, output: str):
+    from .runner import write_runs
+
+    if output == "-":
+        write_runs(runs, sys.stdout)
+    else:
+        with open(output, "w") as file:
+            write_runs(runs, file)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+""" Selecting the build of PetSi to benchmark.
+
+PetSi ships its performance-critical modules both as Python source and as Cython extension modules.
+When both are present, the import system loads the extension modules. :func:`force_pure_python` makes it load
+the Python source instead; it has to be called before ``petsi`` is imported.
+"""
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from typing import Optional
+
+PURE = "pure"
+COMPILED = "compiled"
+
+_PACKAGE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "petsi")
+
+
+class _PurePythonFinder:
+    """ A meta path finder loading the Python source of the PetSi modules that have a ``.pxd`` file."""
+
+    @staticmethod
+    def find_spec(name: str, path=None, target=None) -> Optional[importlib.machinery.ModuleSpec]:
+        if not name.startswith("petsi."):
+            return None
+
+        file_name = os.path.join(_PACKAGE_DIRECTORY, *name.split(".")[1:])
+
+        if os.path.exists(file_name + ".pxd") and os.path.exists(file_name + ".py"):
+            return importlib.util.spec_from_file_location(name, file_name + ".py")
+
+        return None
+
+
+def force_pure_python():
+    """ Load the Python source of the modules of PetSi, even if their extension modules are built.
+
+    :raise RuntimeError: ``petsi`` is already imported.
+    """
+    if "petsi" in sys.modules:
+        raise RuntimeError("The build must be selected before importing petsi")
+
+    sys.meta_path.insert(0, _PurePythonFinder())
+
+
+def current_build() -> str:
+    """ Tell if the modules of PetSi are loaded from the Python source or from the extension modules."""
+    from petsi import _structure
+    return PURE if _structure.__file__.endswith(".py") else COMPILED
@@ -0,0 +1,152 @@
+""" The reference models of the benchmarks.
+
+Each model is a function creating a :class:`~petsi.Simulator` with the net of the model. The nets keep firing
+forever, so they can be run for any number of firings. The timed transitions draw their durations from
+:mod:`petsi.distributions` objects, seeded by the ``seed`` of the simulator.
+
+As the firing rules require, no timed transition is disabled by the firing of another transition:
+choices are made by immediate transitions.
+"""
+from random import Random
+from typing import Callable, Dict
+
+from petsi import Simulator
+from petsi.distributions import Exponential, Uniform
+
+
+def _add_initial_tokens(simulator: Simulator, places: Dict[str, int]):
+    """ Add an immediate transition firing once at the start, creating ``places[place]`` tokens at each place."""
+    simulator.add_place("started")
+    simulator.add_immediate_transition("start up", priority=100)
+    simulator.add_inhibitor("only once", "started", "start up")
+    simulator.add_constructor("starting", "start up", "started")
+
+    for place, count in places.items():
+        for i in range(count):
+            simulator.add_constructor(f"initial token #{i} at {place}", "start up", place)
+
+
+def loopback(initial_work: int = 100, utilization: float = 0.75, repeat: int = 1, seed=0) -> Simulator:
+    """ The net of ``examples/01-Simple loopback.ipynb``.
+
+    A single server works on ``initial_work`` tokens. A finished token vanishes, or loops back with ``repeat``
+    tokens, such that the server is busy in ``utilization`` of the loop-backs and vanishings.
+    """
+    simulator = Simulator("loopback", seed)
+    simulator.add_place("ToDo")
+    simulator.add_place("Done")
+
+    simulator.add_immediate_transition("start", priority=1)
+    simulator.add_inhibitor("is idle", "ToDo", "start")
+    for i in range(initial_work):
+        simulator.add_constructor(f"initial token #{i}", "start", "ToDo")
+
+    simulator.add_timed_transition("doing", Uniform(0.0, 1.0))
+    simulator.add_transfer("do", "ToDo", "doing", "Done")
+
+    simulator.add_immediate_transition("repeat", priority=2, weight=1.0)
+    simulator.add_transfer("repeat", "Done", "repeat", "ToDo")
+    for i in range(repeat - 1):
+        simulator.add_constructor(f"more-to-do #{i + 1}", "repeat", "ToDo")
+
+    simulator.add_immediate_transition("vanish", priority=2, weight=max(1.0, repeat - 1.0) / utilization)
+    simulator.add_destructor("end", "Done", "vanish")
+    return simulator
+
+
+def mmc(servers: int = 4, utilization: float = 0.8, seed=0) -> Simulator:
+    """ An M/M/c queue with ``servers`` servers, each serving at rate 1."""
+    simulator = Simulator("M/M/c", seed)
+    simulator.add_place("waiting")
+    simulator.add_timed_transition("arrival", Exponential(servers * utilization))
+    simulator.add_constructor("arrivals", "arrival", "waiting")
+
+    for i in range(servers):
+        simulator.add_place(f"idle {i}")
+        simulator.add_place(f"busy {i}")
+        simulator.add_immediate_transition(f"start {i}", priority=1)
+        simulator.add_destructor(f"enter {i}", "waiting", f"start {i}")
+        simulator.add_transfer(f"seize {i}", f"idle {i}", f"start {i}", f"busy {i}")
+        simulator.add_timed_transition(f"service {i}", Exponential(1.0))
+        simulator.add_transfer(f"release {i}", f"busy {i}", f"service {i}", f"idle {i}")
+
+    _add_initial_tokens(simulator, {f"idle {i}": 1 for i in range(servers)})
+    return simulator
+
+
+def fork_join(branches: int = 4, utilization: float = 0.8, seed=0) -> Simulator:
+    """ Jobs forking into ``branches`` tasks, each served by a server of its own, and joining when all are done."""
+    simulator = Simulator("fork-join", seed)
+    simulator.add_place("arrived")
+    simulator.add_timed_transition("arrival", Exponential(utilization))
+    simulator.add_constructor("arrivals", "arrival", "arrived")
+    simulator.add_immediate_transition("fork", priority=1)
+    simulator.add_destructor("forking", "arrived", "fork")
+    simulator.add_immediate_transition("join", priority=1)
+
+    for i in range(branches):
+        simulator.add_place(f"queue {i}")
+        simulator.add_place(f"done {i}")
+        simulator.add_constructor(f"task {i}", "fork", f"queue {i}")
+        simulator.add_timed_transition(f"service {i}", Exponential(1.0))
+        simulator.add_transfer(f"serving {i}", f"queue {i}", f"service {i}", f"done {i}")
+        simulator.add_destructor(f"joining {i}", f"done {i}", "join")
+
+    return simulator
+
+
+def polling(queues: int = 4, utilization: float = 0.6, switchover: float = 0.1, seed=0) -> Simulator:
+    """ A server visiting ``queues`` queues cyclically, serving each until it is empty."""
+    simulator = Simulator("polling", seed)
+
+    for i in range(queues):
+        simulator.add_place(f"queue {i}")
+        simulator.add_place(f"server at {i}")
+        simulator.add_place(f"serving {i}")
+        simulator.add_place(f"switching {i}")
+
+    for i in range(queues):
+        simulator.add_timed_transition(f"arrival {i}", Exponential(utilization / queues))
+        simulator.add_constructor(f"arrivals {i}", f"arrival {i}", f"queue {i}")
+
+        simulator.add_immediate_transition(f"select {i}", priority=2)
+        simulator.add_destructor(f"selected {i}", f"queue {i}", f"select {i}")
+        simulator.add_transfer(f"seize {i}", f"server at {i}", f"select {i}", f"serving {i}")
+        simulator.add_timed_transition(f"service {i}", Exponential(1.0))
+        simulator.add_transfer(f"release {i}", f"serving {i}", f"service {i}", f"server at {i}")
+
+        simulator.add_immediate_transition(f"leave {i}", priority=1)
+        simulator.add_inhibitor(f"exhausted {i}", f"queue {i}", f"leave {i}")
+        simulator.add_transfer(f"leaving {i}", f"server at {i}", f"leave {i}", f"switching {i}")
+        simulator.add_timed_transition(f"switchover {i}", Exponential(1.0 / switchover))
+        simulator.add_transfer(f"moving {i}", f"switching {i}", f"switchover {i}", f"server at {(i + 1) % queues}")
+
+    _add_initial_tokens(simulator, {"server at 0": 1})
+    return simulator
+
+
+def random_net(nodes: int = 1000, token_density: float = 0.1, seed=0) -> Simulator:
+    """ A random net of about ``nodes`` nodes, half of them places and half timed transitions.
+
+    Each place feeds a transition of its own, which moves the tokens either to the next place or to a random one.
+    The places start with ``token_density`` tokens per place, spread evenly.
+    """
+    simulator = Simulator("random", seed)
+    random = Random(seed)
+    places = max(2, nodes // 2)
+
+    for i in range(places):
+        simulator.add_place(f"p{i}")
+
+    for i in range(places):
+        target = (i + 1) % places if random.random() < 0.5 else random.randrange(places)
+        simulator.add_timed_transition(f"t{i}", Exponential(random.uniform(0.5, 2.0)))
+        simulator.add_transfer(f"arc {i}", f"p{i}", f"t{i}", f"p{target}")
+
+    tokens = max(1, int(places * token_density))
+    _add_initial_tokens(simulator, {f"p{i * places // tokens}": 1 for i in range(tokens)})
+    return simulator
+
+
+#: The canonical models, by name
+MODELS: Dict[str, Callable[..., Simulator]] = dict(loopback=loopback, mmc=mmc, fork_join=fork_join, polling=polling)
@@ -0,0 +1,155 @@
+""" Measuring the reference models.
+
+The measurements of a model are:
+
+- ``build_time``: the time to create the simulator with the net of the model,
+- ``register_plugin_time``: the time to register a meter plugin with the net, averaged over the meters,
+- ``firings_per_second``: the speed of firing the transitions, without meters,
+- ``meter_overhead.<stream>``: the relative increase of the time of firing the transitions, with the meter of
+  the observation stream registered (``0.5`` means 50% slower) and
+- ``peak_memory``: the peak of the memory allocated while building the net and firing the transitions with all
+  the meters registered, as traced by :mod:`tracemalloc`.
+
+The times are the best of a number of repetitions, each on a freshly created simulator.
+"""
+import gc
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO
+
+from petsi import Simulator
+
+from .builds import current_build
+from .models import MODELS, random_net
+
+#: The observation streams whose meters are measured
+STREAMS = ("token_visits", "place_population", "transition_firing")
+
+#: The number of nodes of the random nets measured by default
+RANDOM_NET_SIZES = (100, 1000, 10000, 100000)
+
+
+@dataclass(frozen=True)
+class Result:
+    """ A measurement of a model."""
+    model: str      #: The name of the model
+    nodes: int      #: The number of places and transitions in the net of the model
+    build: str      #: The build of PetSi measured, ``pure`` or ``compiled``
+    metric: str     #: The name of the measurement
+    value: float
+    unit: str
+
+
+def _best_of(repeat: int, measure: Callable[[], float]) -> float:
+    return min(measure() for _ in range(repeat))
+
+
+def benchmark_model(model: str, create: Callable[[], Simulator], firings: int, repeat: int) -> List[Result]:
+    """ Measure a model.
+
+    :param model: The name of the model, recorded in the results.
+    :param create: Creates a simulator with the net of the model.
+    :param firings: The number of transitions to fire when measuring the speed of firing.
+    :param repeat: The number of repetitions to take the best time of.
+    """
+    build = current_build()
+    net = create().net
+    nodes = len(net.places) + len(net.transitions)
+    results: List[Result] = list()
+
+    def record(metric: str, value: float, unit: str):
+        results.append(Result(model, nodes, build, metric, value, unit))
+
+    def measure_build() -> float:
+        start = perf_counter()
+        create()
+        return perf_counter() - start
+
+    def measure_registration() -> float:
+        simulator = create()
+        start = perf_counter()
+        simulator.observe(**{stream: firings for stream in STREAMS})
+        return (perf_counter() - start) / len(STREAMS)
+
+    def measure_firing(*streams: str) -> float:
+        simulator = create()
+        simulator.observe(**{stream: firings for stream in streams})
+        start = perf_counter()
+        simulator.fire_repeatedly(firings)
+        return perf_counter() - start
+
+    record("build_time", _best_of(repeat, measure_build), "s")
+    record("register_plugin_time", _best_of(repeat, measure_registration), "s")
+
+    firing_time = _best_of(repeat, measure_firing)
+    record("firings_per_second", firings / firing_time, "1/s")
+
+    for stream in STREAMS:
+        record(f"meter_overhead.{stream}", _best_of(repeat, lambda: measure_firing(stream)) / firing_time - 1.0, "")
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        simulator = create()
+        simulator.observe(**{stream: firings for stream in STREAMS})
+        simulator.fire_repeatedly(firings)
+        record("peak_memory", tracemalloc.get_traced_memory()[1], "B")
+    finally:
+        tracemalloc.stop()
+
+    return results
+
+
+def run_benchmarks(models: Optional[Iterable[str]] = None, sizes: Iterable[int] = RANDOM_NET_SIZES,
+                   firings: int = 100000, repeat: int = 3) -> List[Result]:
+    """ Measure the canonical models and the random nets.
+
+    :param models: The names of the canonical models to measure (see :data:`~benchmarks.models.MODELS`),
+            or ``None`` for all.
+    :param sizes: The numbers of nodes of the random nets to measure.
+    :param firings: The number of transitions to fire when measuring the speed of firing.
+    :param repeat: The number of repetitions to take the best time of.
+    """
+    results: List[Result] = list()
+
+    for model in MODELS if models is None else models:
+        results.extend(benchmark_model(model, MODELS[model], firings, repeat))
+
+    for size in sizes:
+        results.extend(benchmark_model("random", lambda: random_net(size), firings, repeat))
+
+    return results
+
+
+def metadata(**parameters: Any) -> Dict[str, Any]:
+    """ Describe the circumstances of the measurements.
+
+    :param parameters: The parameters of the run to record.
+    """
+    return dict(time=datetime.now(timezone.utc).isoformat(),
+                build=current_build(),
+                python=sys.version,
+                implementation=platform.python_implementation(),
+                platform=platform.platform(),
+                machine=platform.machine(),
+                processor=platform.processor(),
+                cpu_count=os.cpu_count(),
+                parameters=parameters)
+
+
+def write_runs(runs: List[Dict[str, Any]], file: TextIO):
+    """ Write the results of runs as JSON, ``{"runs": [{"metadata": {...}, "results": [{...}, ...]}, ...]}``."""
+    json.dump(dict(runs=runs), file, indent=1)
+    file.write("\n")
+
+
+def run(**parameters: Any) -> Dict[str, Any]:
+    """ :func:`Run the benchmarks <run_benchmarks>` and describe them as a run of :func:`write_runs`."""
+    results = run_benchmarks(**parameters)
+    return dict(metadata=metadata(**parameters), results=[asdict(result) for result in results])
@@ -0,0 +1,82 @@
+import cython
+from ._distributions cimport Distribution
+
+
+cdef class CompiledNet:
+    cdef readonly basestring name
+    cdef readonly double current_time
+
+    cdef list _place_names             # List[str]
+    cdef list _transition_names        # List[str]
+    cdef list _samplers                # List[Distribution]
+    cdef Distribution _uniform         # Random numbers for choosing among conflicting immediate transitions
+
+    cdef int _num_places
+    cdef int _num_transitions
+    cdef int _num_levels
+
+    # Incidence tables
+    cdef int[::1] _flow_start
+    cdef int[::1] _flow_place
+    cdef int[::1] _flow_delta
+    cdef int[::1] _dependent_start
+    cdef int[::1] _dependent
+    cdef int[::1] _initial_disabled_arc_count
+    cdef double[::1] _weight
+    cdef int[::1] _level_of
+    cdef int[::1] _level_start
+
+    # Marking related state
+    cdef long long[::1] _marking
+    cdef int[::1] _disabled_arc_count
+    cdef unsigned long long[::1] _firing_count
+    cdef int[::1] _level_size
+    cdef int[::1] _level_members
+    cdef int[::1] _member_position
+    cdef int[::1] _heap
+    cdef int[::1] _heap_position
+    cdef double[::1] _deadline
+    cdef long long[::1] _sequence
+    cdef int _heap_size
+    cdef long long _next_sequence
+
+    @cython.locals(p=cython.int, t=cython.int, level=cython.int)
+    cpdef reset(self)
+
+    @cython.locals(fired=cython.ulonglong)
+    cpdef unsigned long long fire_repeatedly(self, unsigned long long count_of_firings) except? 0
+
+    @cython.locals(fired=cython.ulonglong)
+    cpdef unsigned long long fire_until(self, double end_time) except? 0
+
+    @cython.locals(level=cython.int, t=cython.int)
+    cdef bint _fire_next(self) except -1
+
+    @cython.locals(i=cython.int, p=cython.int)
+    cdef _fire(self, int t)
+
+    @cython.locals(i=cython.int, d=cython.int, t=cython.int)
+    cdef _report_presence(self, int p, bint has_tokens)
+
+    @cython.locals(level=cython.int, position=cython.int)
+    cdef _enable(self, int t)
+
+    @cython.locals(level=cython.int, position=cython.int, last=cython.int)
+    cdef _disable(self, int t)
+
+    @cython.locals(start=cython.int, end=cython.int, i=cython.int, total_weight=cython.double, threshold=cython.double)
+    cdef int _select_on_level(self, int level) except -1
+
+    @cython.locals(sampler=Distribution)
+    cdef _schedule(self, int t)
+
+    @cython.locals(position=cython.int, last=cython.int)
+    cdef _unschedule(self, int t)
+
+    cdef bint _precedes(self, int a, int b)
+
+    @cython.locals(t=cython.int, parent_position=cython.int, parent=cython.int)
+    cdef _sift_up(self, int position)
+
+    @cython.locals(t=cython.int, child_position=cython.int, child=cython.int)
+    cdef _sift_down(self, int position)
@@ -0,0 +1,391 @@
+# cython: language_level=3
+# cython: profile=False
+
+# You may compile this file as:
+#    cythonize --3str -a -f -i petsi/_compiled.py
+
+""" A Cython module executing frozen Petri nets on integer arrays.
+
+    The object model of :mod:`petsi._structure` is convenient for building nets and for observing them
+    with plugins, but firing a transition there means walking arcs, places, presence observers and tokens,
+    and notifying the observer sets attached to each of them.
+
+    A :class:`CompiledNet` is a snapshot of the structure of a :class:`~petsi._structure.Net` taken by
+    :meth:`Net.compile() <petsi._structure.Net.compile>`. The snapshot consists of
+
+    - a marking vector holding the number of tokens at each place,
+    - incidence tables listing the token flows (place, +1/-1) of each transition, in arc order,
+    - dependency tables listing the arcs whose enablement changes when a place becomes empty or non-empty.
+
+    Firing a transition is then a handful of integer updates. The firing rules are the same as the ones
+    implemented by :mod:`petsi.plugins.autofire._autofire`:
+
+    - Immediate transitions on the highest priority level are fired first, chosen randomly with probability
+      proportional to their weights.
+    - When there is no enabled immediate transition, the timed transition with the earliest deadline is fired
+      and the simulation time is advanced to its deadline.
+
+    Tokens have no identity in a compiled net and plugins are not notified.
+    A compiled net is therefore suited for runs that need the marking process and the firing counts only.
+    Changes made to the source net after compilation are not reflected in the compiled net.
+"""
+
+from array import array
+from typing import TYPE_CHECKING
+
+import cython
+
+from ._distributions import Uniform
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List
+    from ._structure import Net as TNet
+
+
+class CompiledNet:
+    """ A frozen, array-backed copy of a Petri net that can fire transitions without observers."""
+
+    def __init__(self, net: "TNet", generator: "Any" = None):
+        """ Build the incidence and dependency tables of ``net``.
+
+        :param net: The :class:`~petsi._structure.Net` to compile.
+        :param generator: The :class:`numpy.random.Generator` or :class:`random.Random` instance to use for
+                        choosing among conflicting immediate transitions. A new one is created if omitted.
+        """
+        # Avoid a circular import: _structure imports this module lazily, in Net.compile()
+        from ._structure import ConstructorArc, DestructorArc, TransferArc, TestArc, InhibitorArc
+
+        places = list(net.places)
+        transitions = list(net.transitions)
+
+        self.name = net.name
+        self._place_names = [p.name for p in places]
+        self._transition_names = [t.name for t in transitions]
+        self._samplers = [t.sampler for t in transitions]
+
+        num_places = len(places)
+        num_transitions = len(transitions)
+
+        flow_start = array('i', [0])
+        flow_place = array('i')
+        flow_delta = array('i')
+        dependencies: "List[List[int]]" = [list() for _ in places]
+
+        for t in transitions:
+            for arc in t.arcs:
+                # InhibitorArc is a TestArc, so it must be checked first
+                if isinstance(arc, InhibitorArc):
+                    dependencies[arc.input_place.ordinal].append(~t.ordinal)
+                elif isinstance(arc, TestArc):
+                    dependencies[arc.input_place.ordinal].append(t.ordinal)
+                elif isinstance(arc, (DestructorArc, TransferArc)):
+                    dependencies[arc.input_place.ordinal].append(t.ordinal)
+                    flow_place.append(arc.input_place.ordinal)
+                    flow_delta.append(-1)
+
+                if isinstance(arc, (ConstructorArc, TransferArc)):
+                    flow_place.append(arc.output_place.ordinal)
+                    flow_delta.append(+1)
+
+            flow_start.append(len(flow_place))
+
+        # Dependent transitions are encoded as the ordinal of the transition;
+        # the one's complement (~ordinal) of it marks an inhibitor arc.
+        dependent_start = array('i', [0])
+        dependent = array('i')
+        for place_dependencies in dependencies:
+            dependent.extend(place_dependencies)
+            dependent_start.append(len(dependent))
+
+        # The initial number of disabled arcs, i.e. for the empty marking: all arcs except the inhibitors
+        initial_disabled_arc_count = array('i', [0] * num_transitions)
+        for d in dependent:
+            if d >= 0:
+                initial_disabled_arc_count[d] += 1
+
+        # Priority levels: level 0 is the highest priority. Timed transitions are not on any level.
+        priorities = sorted({t.priority for t in transitions if not t.is_timed}, reverse=True)
+        level_of_priority = {priority: level for level, priority in enumerate(priorities)}
+        level_of = array('i', [-1 if t.is_timed else level_of_priority[t.priority] for t in transitions])
+        level_capacity = [0] * len(priorities)
+        for level in level_of:
+            if level >= 0:
+                level_capacity[level] += 1
+        level_start = array('i', [0])
+        for capacity in level_capacity:
+            level_start.append(level_start[-1] + capacity)
+
+        self._num_places = num_places
+        self._num_transitions = num_transitions
+        self._num_levels = len(priorities)
+        self._flow_start = flow_start
+        self._flow_place = flow_place
+        self._flow_delta = flow_delta
+        self._dependent_start = dependent_start
+        self._dependent = dependent
+        self._initial_disabled_arc_count = initial_disabled_arc_count
+        self._weight = array('d', [t.weight for t in transitions])
+        self._level_of = level_of
+        self._level_start = level_start
+
+        # Marking related state, (re-)initialized by reset()
+        self._marking = array('q', [0] * num_places)
+        self._disabled_arc_count = array('i', initial_disabled_arc_count)
+        self._firing_count = array('Q', [0] * num_transitions)
+        self._level_size = array('i', [0] * len(priorities))
+        self._level_members = array('i', [0] * level_start[-1])
+        self._member_position = array('i', [-1] * num_transitions)
+        self._heap = array('i', [0] * num_transitions)
+        self._heap_position = array('i', [-1] * num_transitions)
+        self._deadline = array('d', [0.0] * num_transitions)
+        self._sequence = array('q', [0] * num_transitions)
+        self._heap_size = 0
+        self._next_sequence = 0
+        self.current_time = 0.0
+        self._uniform = Uniform(0.0, 1.0, generator)
+
+        self.reset()
+
+    @property
+    def place_names(self) -> "List[str]":
+        """ The names of the places, indexed by the ordinal of the place."""
+        return list(self._place_names)
+
+    @property
+    def transition_names(self) -> "List[str]":
+        """ The names of the transitions, indexed by the ordinal of the transition."""
+        return list(self._transition_names)
+
+    @property
+    def marking(self) -> "Dict[str, int]":
+        """ The number of tokens at each place, keyed by the name of the place."""
+        return {name: self._marking[i] for i, name in enumerate(self._place_names)}
+
+    @property
+    def firing_counts(self) -> "Dict[str, int]":
+        """ The number of firings of each transition since the last :meth:`reset`, keyed by transition name."""
+        return {name: self._firing_count[i] for i, name in enumerate(self._transition_names)}
+
+    def set_generator(self, generator):
+        """ Choose among conflicting immediate transitions with ``generator`` from now on."""
+        self._uniform.set_generator(generator)
+
+    def reset(self):
+        """ Remove all tokens, reset the simulation time and the firing counts."""
+        self.current_time = 0.0
+        self._heap_size = 0
+        self._next_sequence = 0
+
+        for p in range(self._num_places):
+            self._marking[p] = 0
+
+        for level in range(self._num_levels):
+            self._level_size[level] = 0
+
+        for t in range(self._num_transitions):
+            self._firing_count[t] = 0
+            self._member_position[t] = -1
+            self._heap_position[t] = -1
+            self._disabled_arc_count[t] = self._initial_disabled_arc_count[t]
+
+        for t in range(self._num_transitions):
+            if self._disabled_arc_count[t] == 0:
+                self._enable(t)
+
+    def fire_repeatedly(self, count_of_firings) -> int:
+        """ Fire ``count_of_firings`` transitions.
+
+        Firing stops earlier if the enabled transitions are exhausted.
+
+        :return: The number of firings performed.
+        """
+        fired = 0
+
+        while fired < count_of_firings and self._fire_next():
+            fired += 1
+
+        return fired
+
+    def fire_until(self, end_time) -> int:
+        """ Keep firing transitions until the simulation time reaches or exceeds ``end_time``.
+
+        Firing stops earlier if the enabled transitions are exhausted.
+
+        :return: The number of firings performed.
+        """
+        fired = 0
+
+        while self.current_time < end_time and self._fire_next():
+            fired += 1
+
+        return fired
+
+    def _fire_next(self):
+        level = 0
+
+        while level < self._num_levels and self._level_size[level] == 0:
+            level += 1
+
+        if level < self._num_levels:
+            t = self._select_on_level(level)
+        elif self._heap_size > 0:
+            t = self._heap[0]
+            self.current_time = self._deadline[t]
+            self._unschedule(t)
+        else:
+            return False
+
+        self._fire(t)
+
+        # A fired timed transition that is still enabled needs a new deadline.
+        if self._level_of[t] < 0 and self._disabled_arc_count[t] == 0 and self._heap_position[t] < 0:
+            self._schedule(t)
+
+        return True
+
+    def _fire(self, t):
+        self._firing_count[t] += 1
+
+        for i in range(self._flow_start[t], self._flow_start[t + 1]):
+            p = self._flow_place[i]
+
+            if self._flow_delta[i] > 0:
+                self._marking[p] += 1
+                if self._marking[p] == 1:
+                    self._report_presence(p, True)
+            else:
+                self._marking[p] -= 1
+                if self._marking[p] == 0:
+                    self._report_presence(p, False)
+
+    def _report_presence(self, p, has_tokens):
+        for i in range(self._dependent_start[p], self._dependent_start[p + 1]):
+            d = self._dependent[i]
+
+            # Inhibitor arcs get disabled by the presence of tokens
+            if (d >= 0) == has_tokens:
+                t = d if d >= 0 else ~d
+                self._disabled_arc_count[t] -= 1
+                if self._disabled_arc_count[t] == 0:
+                    self._enable(t)
+            else:
+                t = d if d >= 0 else ~d
+                self._disabled_arc_count[t] += 1
+                if self._disabled_arc_count[t] == 1:
+                    self._disable(t)
+
+    def _enable(self, t):
+        level = self._level_of[t]
+
+        if level < 0:
+            if self._heap_position[t] < 0:
+                self._schedule(t)
+        else:
+            position = self._level_start[level] + self._level_size[level]
+            self._level_members[position] = t
+            self._member_position[t] = position
+            self._level_size[level] += 1
+
+    def _disable(self, t):
+        level = self._level_of[t]
+
+        if level < 0:
+            if self._heap_position[t] >= 0:
+                self._unschedule(t)
+        else:
+            # Move the last member of the level into the place of the removed one
+            position = self._member_position[t]
+            self._level_size[level] -= 1
+            last = self._level_members[self._level_start[level] + self._level_size[level]]
+            self._level_members[position] = last
+            self._member_position[last] = position
+            self._member_position[t] = -1
+
+    def _select_on_level(self, level):
+        start = self._level_start[level]
+        end = start + self._level_size[level]
+        total_weight = 0.0
+
+        for i in range(start, end):
+            total_weight += self._weight[self._level_members[i]]
+
+        threshold = self._uniform.sample() * total_weight
+
+        for i in range(start, end - 1):
+            threshold -= self._weight[self._level_members[i]]
+            if threshold < 0.0:
+                return self._level_members[i]
+
+        return self._level_members[end - 1]
+
+    # The timed transitions are kept in a binary heap of transition ordinals, ordered by (deadline, sequence).
+    # The sequence number makes the order of transitions with equal deadlines deterministic.
+    # _heap_position tracks the position of each transition in the heap, allowing removal in O(log n).
+
+    def _schedule(self, t):
+        sampler = self._samplers[t]
+        self._deadline[t] = self.current_time + sampler.sample()
+        self._sequence[t] = self._next_sequence
+        self._next_sequence += 1
+        self._heap[self._heap_size] = t
+        self._heap_position[t] = self._heap_size
+        self._heap_size += 1
+        self._sift_up(self._heap_size - 1)
+
+    def _unschedule(self, t):
+        position = self._heap_position[t]
+        self._heap_size -= 1
+        self._heap_position[t] = -1
+
+        if position < self._heap_size:
+            last = self._heap[self._heap_size]
+            self._heap[position] = last
+            self._heap_position[last] = position
+            self._sift_down(position)
+            self._sift_up(self._heap_position[last])
+
+    def _precedes(self, a, b):
+        return self._deadline[a] < self._deadline[b] or \
+            (self._deadline[a] == self._deadline[b] and self._sequence[a] < self._sequence[b])
+
+    def _sift_up(self, position):
+        t = self._heap[position]
+
+        while position > 0:
+            parent_position = (position - 1) >> 1
+            parent = self._heap[parent_position]
+
+            if not self._precedes(t, parent):
+                break
+
+            self._heap[position] = parent
+            self._heap_position[parent] = position
+            position = parent_position
+
+        self._heap[position] = t
+        self._heap_position[t] = position
+
+    def _sift_down(self, position):
+        t = self._heap[position]
+
+        while True:
+            child_position = 2 * position + 1
+
+            if child_position >= self._heap_size:
+                break
+
+            if child_position + 1 < self._heap_size and \
+                    self._precedes(self._heap[child_position + 1], self._heap[child_position]):
+                child_position += 1
+
+            child = self._heap[child_position]
+
+            if not self._precedes(child, t):
+                break
+
+            self._heap[position] = child
+            self._heap_position[child] = position
+            position = child_position
+
+        self._heap[position] = t
+        self._heap_position[t] = position
@@ -0,0 +1,52 @@
+import cython
+
+
+cdef class Distribution:
+    cdef int _block_size
+    cdef object _generator          # numpy.random.Generator or random.Random
+    cdef bint _uses_numpy
+    cdef double[::1] _samples
+    cdef Py_ssize_t _position
+    cdef readonly bint has_own_generator
+
+    cpdef double sample(self) except? -999
+    cdef _refill(self)
+
+
+cdef class Exponential(Distribution):
+    cdef readonly double rate
+
+
+cdef class Deterministic(Distribution):
+    cdef readonly double value
+
+    cpdef double sample(self) except? -999
+
+
+cdef class Uniform(Distribution):
+    cdef readonly double low
+    cdef readonly double high
+
+
+cdef class Gamma(Distribution):
+    cdef readonly double shape
+    cdef readonly double scale
+
+
+cdef class Erlang(Gamma):
+    pass
+
+
+cdef class LogNormal(Distribution):
+    cdef readonly double mu
+    cdef readonly double sigma
+
+
+cdef class Empirical(Distribution):
+    cdef readonly tuple values
+
+
+cdef class FunctionDistribution(Distribution):
+    cdef readonly object function
+
+    cpdef double sample(self) except? -999
@@ -0,0 +1,382 @@
+# cython: language_level=3
+# cython: profile=False
+
+# You may compile this file as:
+#    cythonize --3str -a -f -i petsi/_distributions.py
+
+""" A Cython module with probability distributions for the firing delay of timed transitions.
+
+    Timed transitions accept any ``Callable[[], float]`` as their distribution. Calling back into Python
+    for every enablement is however a significant part of the cost of a firing. The distributions
+    defined here are callables too, but the transitions and the compiled nets sample them through
+    the C-level :meth:`Distribution.sample` method.
+
+    Samples are drawn in blocks into a per-distribution buffer. If NumPy is installed, the blocks are filled by
+    a :class:`numpy.random.Generator`, otherwise by a :class:`random.Random` instance, one sample at a time.
+    Any other callable passed as a distribution is wrapped into a :class:`FunctionDistribution`, which
+    calls the function for each sample.
+"""
+
+from array import array
+from random import Random
+from typing import TYPE_CHECKING
+
+import cython
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, List
+
+DEFAULT_BLOCK_SIZE = 1024
+
+
+def default_generator() -> "Any":
+    """ Create a random generator for the distributions.
+
+    :return: A :class:`numpy.random.Generator` if NumPy is installed, otherwise a :class:`random.Random` instance.
+    """
+    return numpy.random.default_rng() if numpy is not None else Random()
+
+
+class RandomStreams:
+    """ A source of statistically independent random generators, derived from a single seed.
+
+    With NumPy installed, the generators are created from the children of a :class:`numpy.random.SeedSequence`,
+    which guarantees independent streams. Without NumPy, each :class:`random.Random` generator is seeded with
+    128 random bits taken from a root generator.
+
+    Creating the generators in the same order from the same seed reproduces the same streams.
+
+    :param seed: An integer seed, a :class:`numpy.random.SeedSequence` or ``None`` for a fresh seed
+        from the operating system.
+    """
+
+    def __init__(self, seed=None):
+        if numpy is not None:
+            self._seed_sequence = seed if isinstance(seed, numpy.random.SeedSequence) \
+                else numpy.random.SeedSequence(seed)
+        else:
+            self._root = Random(seed)
+
+    def generator(self) -> "Any":
+        """ Create a new generator, independent of all the others created by this object or its spawns."""
+        if numpy is not None:
+            return numpy.random.default_rng(self._seed_sequence.spawn(1)[0])
+        else:
+            return Random(self._root.getrandbits(128))
+
+    def spawn(self, n: int) -> "List[RandomStreams]":
+        """ Create ``n`` independent child sources, e.g. one for each replication of a simulation."""
+        if numpy is not None:
+            return [RandomStreams(seed_sequence) for seed_sequence in self._seed_sequence.spawn(n)]
+        else:
+            return [RandomStreams(self._root.getrandbits(128)) for _ in range(n)]
+
+
+@cython.cclass
+class Distribution:
+    """ The base class of the distributions sampled in blocks.
+
+    Derived classes implement :meth:`_draw_with_numpy` and :meth:`_draw_with_random`.
+
+    :param generator: The random generator to draw the samples with, either a :class:`numpy.random.Generator`
+        or a :class:`random.Random` instance. A new one is created by :func:`default_generator` if omitted;
+        a :class:`~petsi.simulation.Simulator` will replace that with one of its own random streams.
+    :param block_size: The number of samples to draw at once.
+    """
+
+    def __init__(self, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError(f"The block size must be a positive integer, found {block_size}")
+
+        self._block_size = block_size
+        self.has_own_generator = generator is not None
+        self.set_generator(default_generator() if generator is None else generator)
+
+    def __call__(self):
+        return self.sample()
+
+    def set_generator(self, generator):
+        """ Draw the subsequent samples with ``generator``, discarding the samples buffered so far."""
+        self._generator = generator
+        self._uses_numpy = numpy is not None and isinstance(generator, numpy.random.Generator)
+        self._samples = array('d')
+        self._position = 0
+
+    def get_state(self) -> "Any":
+        """ Capture the state of the generator and the samples buffered but not taken yet, for :meth:`set_state`."""
+        generator_state = self._generator.bit_generator.state if self._uses_numpy else self._generator.getstate()
+        return generator_state, array('d', self._samples[self._position:])
+
+    def set_state(self, state):
+        """ Restore the state of the generator and the buffered samples, as captured by :meth:`get_state`."""
+        generator_state, samples = state
+
+        if self._uses_numpy:
+            self._generator.bit_generator.state = generator_state
+        else:
+            self._generator.setstate(generator_state)
+
+        self._samples = array('d', samples)
+        self._position = 0
+
+    def sample(self):
+        """ Take the next sample, refilling the buffer if it is exhausted."""
+        if self._position == len(self._samples):
+            self._refill()
+
+        self._position += 1
+        return float(self._samples[self._position - 1])
+
+    def _refill(self):
+        self._samples = self._draw_with_numpy(self._block_size) if self._uses_numpy \
+            else self._draw_with_random(self._block_size)
+        self._position = 0
+
+    def _draw_with_numpy(self, n):
+        """ Return ``n`` samples as a NumPy array of doubles, drawn with the ``numpy.random.Generator``."""
+        raise NotImplementedError
+
+    def _draw_with_random(self, n):
+        """ Return ``n`` samples as an ``array('d')``, drawn with the ``random.Random`` generator."""
+        raise NotImplementedError
+
+    def to_spec(self) -> "Dict[str, Any]":
+        """ Describe the distribution as a JSON-compatible dictionary, see :func:`distribution_from_spec`.
+
+        The generator and the block size are not part of the description.
+        """
+        raise NotImplementedError
+
+
+@cython.cclass
+class Exponential(Distribution):
+    """ The exponential distribution.
+
+    :param rate: The rate (the reciprocal of the mean) of the distribution.
+    """
+
+    def __init__(self, rate, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        if rate <= 0:
+            raise ValueError(f"The rate of the exponential distribution must be positive, found {rate}")
+
+        super().__init__(generator, block_size)
+        self.rate = rate
+
+    def _draw_with_numpy(self, n):
+        return self._generator.exponential(1.0 / self.rate, n)
+
+    def _draw_with_random(self, n):
+        expovariate = self._generator.expovariate
+        return array('d', [expovariate(self.rate) for _ in range(n)])
+
+    def to_spec(self):
+        return dict(type="exponential", rate=self.rate)
+
+
+@cython.cclass
+class Deterministic(Distribution):
+    """ A distribution returning the same value all the time.
+
+    :param value: The value to return.
+    """
+
+    def __init__(self, value, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        super().__init__(generator, block_size)
+        self.value = value
+
+    def sample(self):
+        return self.value
+
+    def _draw_with_numpy(self, n):
+        return numpy.full(n, self.value)
+
+    def _draw_with_random(self, n):
+        return array('d', [self.value]) * n
+
+    def to_spec(self):
+        return dict(type="deterministic", value=self.value)
+
+
+@cython.cclass
+class Uniform(Distribution):
+    """ The continuous uniform distribution on the interval [``low``, ``high``).
+
+    :param low: The lower bound of the interval.
+    :param high: The upper bound of the interval.
+    """
+
+    def __init__(self, low, high, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        if high < low:
+            raise ValueError(f"The interval of the uniform distribution is empty: [{low}, {high})")
+
+        super().__init__(generator, block_size)
+        self.low = low
+        self.high = high
+
+    def _draw_with_numpy(self, n):
+        return self._generator.uniform(self.low, self.high, n)
+
+    def _draw_with_random(self, n):
+        uniform = self._generator.uniform
+        return array('d', [uniform(self.low, self.high) for _ in range(n)])
+
+    def to_spec(self):
+        return dict(type="uniform", low=self.low, high=self.high)
+
+
+@cython.cclass
+class Gamma(Distribution):
+    """ The gamma distribution.
+
+    :param shape: The shape parameter (k) of the distribution.
+    :param scale: The scale parameter (theta) of the distribution.
+    """
+
+    def __init__(self, shape, scale, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        if shape <= 0 or scale <= 0:
+            raise ValueError(f"The parameters of the gamma distribution must be positive, "
+                             f"found shape={shape}, scale={scale}")
+
+        super().__init__(generator, block_size)
+        self.shape = shape
+        self.scale = scale
+
+    def _draw_with_numpy(self, n):
+        return self._generator.gamma(self.shape, self.scale, n)
+
+    def _draw_with_random(self, n):
+        gammavariate = self._generator.gammavariate
+        return array('d', [gammavariate(self.shape, self.scale) for _ in range(n)])
+
+    def to_spec(self):
+        return dict(type="gamma", shape=self.shape, scale=self.scale)
+
+
+@cython.cclass
+class Erlang(Gamma):
+    """ The Erlang distribution, i.e. the sum of ``k`` independent exponential variables with the same rate.
+
+    :param k: The number of the exponential phases.
+    :param rate: The rate of each phase.
+    """
+
+    def __init__(self, k, rate, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        if not isinstance(k, int) or k < 1:
+            raise ValueError(f"The number of phases of the Erlang distribution must be a positive integer, found {k}")
+
+        if rate <= 0:
+            raise ValueError(f"The rate of the Erlang distribution must be positive, found {rate}")
+
+        super().__init__(k, 1.0 / rate, generator, block_size)
+
+    def to_spec(self):
+        return dict(type="erlang", k=int(self.shape), rate=1.0 / self.scale)
+
+
+@cython.cclass
+class LogNormal(Distribution):
+    """ The log-normal distribution.
+
+    :param mu: The mean of the underlying normal distribution.
+    :param sigma: The standard deviation of the underlying normal distribution.
+    """
+
+    def __init__(self, mu, sigma, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        if sigma < 0:
+            raise ValueError(f"The sigma of the log-normal distribution must not be negative, found {sigma}")
+
+        super().__init__(generator, block_size)
+        self.mu = mu
+        self.sigma = sigma
+
+    def _draw_with_numpy(self, n):
+        return self._generator.lognormal(self.mu, self.sigma, n)
+
+    def _draw_with_random(self, n):
+        lognormvariate = self._generator.lognormvariate
+        return array('d', [lognormvariate(self.mu, self.sigma) for _ in range(n)])
+
+    def to_spec(self):
+        return dict(type="lognormal", mu=self.mu, sigma=self.sigma)
+
+
+@cython.cclass
+class Empirical(Distribution):
+    """ An empirical distribution, choosing uniformly from a set of observed values.
+
+    :param values: The observed values. Repeated values are chosen proportionally more often.
+    """
+
+    def __init__(self, values, generator=None, block_size=DEFAULT_BLOCK_SIZE):
+        if len(values) == 0:
+            raise ValueError("The empirical distribution needs at least one value")
+
+        super().__init__(generator, block_size)
+        self.values = tuple(float(value) for value in values)
+
+    def _draw_with_numpy(self, n):
+        return self._generator.choice(numpy.array(self.values), n)
+
+    def _draw_with_random(self, n):
+        return array('d', self._generator.choices(self.values, k=n))
+
+    def to_spec(self):
+        return dict(type="empirical", values=list(self.values))
+
+
+@cython.cclass
+class FunctionDistribution(Distribution):
+    """ Wraps an arbitrary callable returning samples.
+
+    This is the slow path: the function is called from :meth:`sample` for each sample.
+
+    :param function: The callable returning a sample.
+    """
+
+    def __init__(self, function):
+        # The function draws its own random numbers, so the generator is never used.
+        super().__init__(Random(0), 1)
+        self.function = function
+
+    def sample(self):
+        return self.function()
+
+    def to_spec(self):
+        raise ValueError(f"The function {self.function!r} cannot be described declaratively; "
+                         f"use a distribution from petsi.distributions instead")
+
+
+def as_distribution(distribution: "Callable[[], float]") -> Distribution:
+    """ Return ``distribution`` if it is a :class:`Distribution`, otherwise wrap it into a
+    :class:`FunctionDistribution`."""
+    return distribution if isinstance(distribution, Distribution) else FunctionDistribution(distribution)
+
+
+_distribution_types = dict(exponential=Exponential, deterministic=Deterministic, uniform=Uniform, gamma=Gamma,
+                           erlang=Erlang, lognormal=LogNormal, empirical=Empirical)
+
+
+def distribution_from_spec(spec: "Dict[str, Any]", generator=None) -> Distribution:
+    """ Create a distribution from its description returned by :meth:`Distribution.to_spec`.
+
+    :param spec: A dictionary with the name of the distribution under the ``"type"`` key
+        and the parameters of its constructor under the remaining keys.
+    :param generator: The generator for the distribution, see :class:`Distribution`.
+    :return: The distribution created.
+    :raise ValueError: The type of the distribution is unknown.
+    """
+    parameters = dict(spec)
+    type_name = parameters.pop("type")
+
+    try:
+        distribution_type = _distribution_types[type_name]
+    except KeyError:
+        raise ValueError(f"Unknown distribution type: '{type_name}'; "
+                         f"valid values are {', '.join(_distribution_types)}")
+
+    return distribution_type(generator=generator, **parameters)
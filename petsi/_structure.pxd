@@ -1,7 +1,9 @@
 import cython
+from ._distributions cimport Distribution
 
-# Forward declaration
+# Forward declarations
 cdef class Place
+cdef class Token
 
 
 cdef class Transition:
@@ -10,10 +12,11 @@ cdef class Transition:
     cdef readonly int priority  #: int #= cython.declare(cython.int, visibility='readonly')
     cdef readonly double weight    # : float #= cython.declare(cython.double, visibility='readonly')
     cdef object _distribution  #: "Callable[[], float]"
+    cdef Distribution _sampler
 
     cdef int _disabled_arc_count   #: int = cython.declare(cython.int)
     cdef dict _arcs    # : "Dict[str, Arc]" = cython.declare(dict)
-    cdef readonly set _transition_observers   #: "Set[Plugins.AbstractTransitionObserver]" = cython.declare(set, visibility="readonly")
+    cdef readonly tuple _transition_observers   #: "Tuple[Plugins.AbstractTransitionObserver, ...]"
 
 
     cdef double get_duration(self) except? -999
@@ -28,27 +31,35 @@ cdef class TokenType:
     cdef readonly basestring _name
     cdef readonly unsigned int ordinal
     cdef object _net   # Net
+    cdef list _free_tokens  # List[Token]
+
+    @cython.locals(token=Token)
+    cpdef Token new_token(self)
+    cpdef Token blank_token(self)
+    cpdef recycle(self, Token token)
 
 
 cdef class Token:
     # cdef readonly unsigned long long token_id
-    cdef object _typ            # : TokenType
-    cdef set _token_observers   # : "Set[Plugins.AbstractTokenObserver]" = cython.declare(set)
-    cdef dict tags              #: "Dict[str, Any]"
+    cdef TokenType _typ
+    cdef tuple _token_observers   # : "Tuple[Plugins.AbstractTokenObserver, ...]"
+    cdef dict _tags             #: "Optional[Dict[str, Any]]", created on first use
 
-    cdef attach_observer(self, object plugin)
+    cpdef attach_observers(self)
+    cpdef attach_observer(self, object plugin)
     cdef deposit_at(self, Place place)
     cdef remove_from(self, Place place)
     cdef delete(self)
+    cpdef clear(self)
 
 
 cdef class Place:
     cdef readonly basestring _name
     cdef readonly unsigned int ordinal
-    cdef object _typ  # :  TokenType
+    cdef TokenType _typ
     cdef object _tokens  # : "Deque[Token]" # = cython.declare(_collections.deque)
-    cdef readonly set _place_observers  #: "Set[Plugins.AbstractPlaceObserver]" = cython.declare(set, visibility="readonly")
-    cdef readonly set _presence_observers  #: "Set[PresenceObserver]" = cython.declare(set, visibility="readonly")
+    cdef readonly tuple _place_observers  #: "Tuple[Plugins.AbstractPlaceObserver, ...]"
+    cdef readonly tuple _presence_observers  #: "Tuple[PresenceObserver, ...]"
 
     cdef readonly object _status    #: _Status = cython.declare(object, visibility="readonly")
 
@@ -62,4 +73,23 @@ cdef class Place:
 
     cdef Token _pop(self)
 
-    cdef _push(self, Token token)
\ No newline at end of file
+    cdef _push(self, Token token)
+
+
+cdef class CounterPlace(Place):
+    cdef unsigned long long _count
+    cdef bint _is_counting
+    cdef bint _is_lifo
+
+    cpdef materialize(self)
+
+    @cython.locals(token=Token, presence_observer=PresenceObserver,)
+    cdef Token pop(self)
+
+    # The locals must match those of Place.push(), as they include the type of the argument
+    @cython.locals(token=Token, presence_observer=PresenceObserver, was_empty=cython.bint)
+    cdef push(self,  token )
+
+    cdef bint _is_empty(self) except -123
+
+    cdef _push(self, Token token)
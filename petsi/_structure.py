@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING, TypeVar, Callable, Any, Iterable
 from more_itertools import flatten
 import cython
 
+from ._distributions import Distribution, as_distribution, distribution_from_spec
+
 
 # mypy: mypy_path=..
 
@@ -22,7 +24,8 @@ if TYPE_CHECKING:
     from .plugins.interface import AbstractPlugin, \
         AbstractTokenObserver, AbstractTransitionObserver, AbstractPlaceObserver
 
-    from typing import Any, Set, Dict, Deque, Callable, ValuesView, Iterator
+    from typing import Any, Dict, Deque, Callable, ValuesView, Iterator, List, Optional, Tuple
+    from ._compiled import CompiledNet
 
 
 class Net:
@@ -33,6 +36,8 @@ class Net:
     _transitions: "Dict[str, Transition]"
     _observers: "Dict[str, AbstractPlugin]"
     _queuing_policies: "Dict[str, Callable[[str, int, TokenType], Place]]"
+    _queueing_policy_of_place: "Dict[str, str]"
+    _counts_black_dots: bool
 
     def __init__(self, name: str):
         """ Create a Petri net.
@@ -45,8 +50,12 @@ class Net:
         self._transitions = dict()
         self._observers = dict()
         self._queuing_policies = dict(FIFO=FIFOPlace, LIFO=LIFOPlace)
+        self._queueing_policy_of_place = dict()
         self._black_dot = self.add_type("black dot")
 
+        # Black dot places are backed by counters until a plugin wants to observe black dot tokens
+        self._counts_black_dots = True
+
     def accept(self, visitor: "APetsiVisitor") -> "APetsiVisitor":
         """ Accept a :class:`PetsiVisitor`.
 
@@ -72,6 +81,21 @@ class Net:
     def observers(self) -> "ValuesView[AbstractPlugin]":
         return self._observers.values()
 
+    @property
+    def types(self) -> "ValuesView[TokenType]":
+        """ The token types of the net, in the order of their ordinals."""
+        return self._types.values()
+
+    @property
+    def places(self) -> "ValuesView[Place]":
+        """ The places of the net, in the order of their ordinals."""
+        return self._places.values()
+
+    @property
+    def transitions(self) -> "ValuesView[Transition]":
+        """ The transitions of the net, in the order of their ordinals."""
+        return self._transitions.values()
+
     def register_plugin(self, plugin: "AbstractPlugin"):
         """ Register the given plugin.
 
@@ -87,11 +111,20 @@ class Net:
         if plugin.name in self._observers:
             raise ValueError(f"An observer with name '{plugin.name}' is already registered.")
 
+        if self._counts_black_dots and any(isinstance(p, CounterPlace) for p in self._places.values()) \
+                and plugin.observes_tokens_of(self._black_dot):
+            self._counts_black_dots = False
+            foreach(lambda p: p.materialize(),
+                    filter(lambda p: isinstance(p, CounterPlace), self._places.values()))
+
         self._observers[plugin.name] = plugin
         foreach(lambda t: t.attach_observer(plugin), self._transitions.values())
         foreach(lambda p: p.attach_observer(plugin), self._places.values())
+        # The places still counting hold black dot tokens, which the plugin does not observe
         foreach(lambda t: t.attach_observer(plugin),
-                flatten(map(lambda p: p.tokens, self._places.values())))
+                flatten(map(lambda p: p.tokens,
+                            filter(lambda p: not (isinstance(p, CounterPlace) and p.is_counting),
+                                   self._places.values()))))
 
     # All arcs connected to a place must have the type of the place
     def add_type(self, type_name: str) -> "TokenType":
@@ -123,6 +156,9 @@ class Net:
     def add_place(self, name, type_name: str = "black dot", queueing_policy_name: str = "FIFO") -> "Place":
         """ Add a place to the Petri-net with the given name, type and queueing policy.
 
+        Places of the ``"black dot"`` type with the ``FIFO`` or ``LIFO`` policy are created as
+        :class:`CounterPlace` instances if no registered plugin observes black dot tokens.
+
         :param name: The name of the place to add.
         :param type_name: The type of the place to add. Defaults to ``"black dot"``.
         :param queueing_policy_name:
@@ -140,7 +176,20 @@ class Net:
             raise ValueError(f"Unknown queueing policy: '{queueing_policy_name}'; "
                              f"valid values are { ', '.join(self._queuing_policies.keys()) }")
         else:
-            place = self._places[name] = klass(name, len(self._places), self._types[type_name])
+            typ = self._types[type_name]
+            is_black_dot_queue = typ is self._black_dot and klass in (FIFOPlace, LIFOPlace)
+
+            # A plugin registered before the first counter place may observe black dot tokens
+            if is_black_dot_queue and self._counts_black_dots \
+                    and any(o.observes_tokens_of(typ) for o in self._observers.values()):
+                self._counts_black_dots = False
+
+            if is_black_dot_queue and self._counts_black_dots:
+                place = self._places[name] = CounterPlace(name, len(self._places), typ, klass is LIFOPlace)
+            else:
+                place = self._places[name] = klass(name, len(self._places), typ)
+
+            self._queueing_policy_of_place[name] = queueing_policy_name
             foreach(lambda o: place.attach_observer(o),
                     self._observers.values())
 
@@ -198,6 +247,8 @@ class Net:
         :param name: The name of the transition.
         :param distribution: A callable returning a sample from the probability distribution of the time
                                 between the transition becoming enabled and its firing.
+                                The distributions in :mod:`petsi.distributions` are sampled without calling
+                                back into Python; any other callable is called for each sample.
                                 By constraints on constructing the Petri net it is guaranteed that once a
                                 timed transition is enabled, the only way to disable it is to fire it.
         :return: The transition created.
@@ -310,17 +361,156 @@ class Net:
         for observer in self._observers.values():
             observer.reset()
 
+    def get_marking(self) -> "Dict[str, Any]":
+        """ Capture the marking of the net, for :meth:`set_marking`.
+
+        :return: The marking of each place (see :meth:`Place.get_marking`), keyed by the name of the place.
+        """
+        return {name: place.get_marking() for name, place in self._places.items()}
+
+    def set_marking(self, marking: "Dict[str, Any]"):
+        """ Put the tokens captured by :meth:`get_marking` into the empty net.
+
+        The tokens are created with the observers of the registered plugins, like any new token, then the tags of
+        the tokens and the state of their observers are restored. The observers of the places and the transitions
+        are notified about the arrivals as usual; their state is expected to be restored by their plugins afterwards.
+
+        :param marking: The marking of each place, keyed by the name of the place.
+        :raise ValueError: The net is not empty.
+        :raise KeyError: An unknown place.
+        """
+        if not all(place.is_empty for place in self._places.values()):
+            raise ValueError(f"The marking of net '{self.name}' can only be set while the net is empty")
+
+        for name, place_marking in marking.items():
+            self._places[name].set_marking(place_marking)
+
+    def to_spec(self) -> "Dict[str, Any]":
+        """ Describe the structure of the net as a JSON-compatible dictionary.
+
+        The description lists the token types, the places and the transitions in the order of their ordinals,
+        each transition with its arcs. It can be pickled or saved as JSON, and turned back into a net by
+        :meth:`from_spec`. Plugins and tokens are not part of the description.
+
+        :return: The description of the net.
+        :raise ValueError: The distribution of a timed transition is not one of :mod:`petsi.distributions`.
+        """
+        def arc_spec(arc: "Arc") -> "Dict[str, str]":
+            # InhibitorArc is a TestArc, so it must be checked first
+            if isinstance(arc, InhibitorArc):
+                return dict(kind="inhibitor", name=arc.name, place=arc.input_place.name)
+            elif isinstance(arc, TestArc):
+                return dict(kind="test", name=arc.name, place=arc.input_place.name)
+            elif isinstance(arc, DestructorArc):
+                return dict(kind="destructor", name=arc.name, input_place=arc.input_place.name)
+            elif isinstance(arc, TransferArc):
+                return dict(kind="transfer", name=arc.name, input_place=arc.input_place.name,
+                            output_place=arc.output_place.name)
+            else:
+                return dict(kind="constructor", name=arc.name, output_place=arc.output_place.name)
+
+        def transition_spec(t: "Transition") -> "Dict[str, Any]":
+            spec: "Dict[str, Any]" = dict(name=t.name)
+
+            if t.is_timed:
+                spec.update(distribution=t.sampler.to_spec())
+            else:
+                spec.update(priority=t.priority, weight=t.weight)
+
+            spec.update(arcs=[arc_spec(arc) for arc in t.arcs])
+            return spec
+
+        return dict(name=self.name,
+                    types=[typ.name for typ in self._types.values() if typ is not self._black_dot],
+                    places=[dict(name=p.name, type=p.typ.name,
+                                 queueing_policy=self._queueing_policy_of_place[p.name])
+                            for p in self._places.values()],
+                    transitions=[transition_spec(t) for t in self._transitions.values()],
+                    )
+
+    @classmethod
+    def from_spec(cls, spec: "Dict[str, Any]") -> "Net":
+        """ Create a net from the description returned by :meth:`to_spec`.
+
+        :param spec: The description of the net.
+        :return: The net created.
+        """
+        net = cls(spec["name"])
+        build_from_spec(net, spec)
+        return net
+
+    def compile(self, generator: "Any" = None) -> "CompiledNet":
+        """ Freeze the structure of the net into a :class:`~petsi._compiled.CompiledNet`.
+
+        The compiled net fires transitions on integer incidence tables and an integer marking vector,
+        without notifying plugins. Changes made to the net after the call are not reflected
+        in the compiled net.
+
+        :param generator: The :class:`numpy.random.Generator` or :class:`random.Random` instance to use for
+                        choosing among conflicting immediate transitions. A new one is created if omitted.
+        :return: The compiled net, with an empty marking.
+        """
+        # Imported here, as _compiled depends on the arc classes of this module
+        from ._compiled import CompiledNet
+        return CompiledNet(self, generator)
+
+
+def build_from_spec(builder: "Any", spec: "Dict[str, Any]"):
+    """ Add the elements described by ``spec`` to an empty net.
+
+    :param builder: A :class:`Net` or any object with the same ``add_...()`` methods,
+                    e.g. a :class:`~petsi.simulation.Simulator`.
+    :param spec: The description of the net, as returned by :meth:`Net.to_spec`.
+    """
+    foreach(builder.add_type, spec["types"])
+
+    for place in spec["places"]:
+        builder.add_place(place["name"], place["type"], place["queueing_policy"])
+
+    for transition in spec["transitions"]:
+        if "distribution" in transition:
+            builder.add_timed_transition(transition["name"], distribution_from_spec(transition["distribution"]))
+        else:
+            builder.add_immediate_transition(transition["name"], transition["priority"], transition["weight"])
+
+    # Arcs are added after all transitions are in place, in the order of the transitions
+    for transition in spec["transitions"]:
+        transition_name = transition["name"]
+
+        for arc in transition["arcs"]:
+            kind = arc["kind"]
+
+            if kind == "constructor":
+                builder.add_constructor(arc["name"], transition_name, arc["output_place"])
+            elif kind == "destructor":
+                builder.add_destructor(arc["name"], arc["input_place"], transition_name)
+            elif kind == "transfer":
+                builder.add_transfer(arc["name"], arc["input_place"], transition_name, arc["output_place"])
+            elif kind == "test":
+                builder.add_test(arc["name"], arc["place"], transition_name)
+            elif kind == "inhibitor":
+                builder.add_inhibitor(arc["name"], arc["place"], transition_name)
+            else:
+                raise ValueError(f"Unknown arc kind: '{kind}'")
+
 
 class TokenType:
-    """ Represents a token type."""
+    """ Represents a token type.
+
+    Each token type keeps a free list of destroyed tokens. :meth:`new_token` takes tokens from the free list
+    before allocating new ones, so that an open net with a high turnover of tokens does not keep
+    allocating and garbage collecting :class:`Token` objects.
+    """
     _name: str
     ordinal: int
     _net: Net
+    _free_tokens: "List[Token]"
 
     def __init__(self, name: str, ordinal: int, net: Net):
         self._name = name
         self.ordinal = ordinal
         self._net = net
+        self._free_tokens = list()
 
     @property
     def name(self): return self._name
@@ -331,26 +521,55 @@ class TokenType:
     def __str__(self):
         return f"{self.__class__.__name__}('{self.name}')"
 
+    def new_token(self) -> "Token":
+        """ Create a token of this type, reusing a recycled one if possible.
+
+        The observers of the registered plugins are attached to the token either way.
+        """
+        token: Token = self.blank_token()
+        token.attach_observers()
+        return token
+
+    def blank_token(self) -> "Token":
+        """ Create a token of this type without attaching any observers, reusing a recycled one if possible."""
+        return self._free_tokens.pop() if self._free_tokens else Token(self)
+
+    def recycle(self, token):
+        """ Put ``token`` on the free list of the type, for reuse by :meth:`new_token`.
+
+        The observers and tags of the token are dropped without notifying the observers.
+        The caller must not keep any reference to the recycled token.
+        """
+        token.clear()
+        self._free_tokens.append(token)
+
 
 class Token:
-    """ A typed token in a Petri net. """
+    """ A typed token in a Petri net.
+
+    The :attr:`tags` dictionary is only created when it is first needed.
+    """
     _typ: TokenType
-    _token_observers: "Set[AbstractTokenObserver]"
-    tags: "Dict[str, Any]"
+    _token_observers: "Tuple[AbstractTokenObserver, ...]"
+    _tags: "Optional[Dict[str, Any]]"
 
     def __init__(self, typ: TokenType):
+        """ Create a token without observers. Use :meth:`TokenType.new_token` to create observed tokens."""
         self._typ = typ
-        self._token_observers = set()
-        self.tags = dict()
-        for of in self.typ.net.observers:
+        self._token_observers = ()
+        self._tags = None
+
+    def attach_observers(self):
+        """ Attach the observers of all plugins registered with the net of the token."""
+        for of in self._typ.net.observers:
             self.attach_observer(of)
 
-    def attach_observer(self, plugin: AbstractPlugin):
+    def attach_observer(self, plugin: "AbstractPlugin"):
         """ Request a new observer from ``plugin`` and add it to the set of observers to notify about token events."""
         observer = plugin.observe_token(self)
 
         if observer is not None:
-            self._token_observers.add(observer)
+            self._token_observers += (observer, )
             observer.report_construction()
 
     @property
@@ -358,6 +577,14 @@ class Token:
         """ The type of the token."""
         return self._typ
 
+    @property
+    def tags(self) -> "Dict[str, Any]":
+        """ A dictionary for attaching arbitrary data to the token."""
+        if self._tags is None:
+            self._tags = dict()
+
+        return self._tags
+
     def deposit_at(self, place):  # : "Place"
         """ Notify the observers about the arrival of the token at the given place."""
         for to in self._token_observers:
@@ -372,7 +599,33 @@ class Token:
         """ Notify the observers about the destruction of the token."""
         for to in self._token_observers:
             to.report_destruction()
-        self._token_observers.clear()
+        self.clear()
+
+    def clear(self):
+        """ Drop the observers and the tags of the token, without notifying the observers."""
+        self._token_observers = ()
+        self._tags = None
+
+    def get_state(self) -> "Any":
+        """ Capture the tags of the token and the state of its observers, for :meth:`set_state`."""
+        return (None if self._tags is None else dict(self._tags),
+                [observer.get_state() for observer in self._token_observers])
+
+    def set_state(self, state):
+        """ Restore the tags of the token and the state of its observers, as captured by :meth:`get_state`.
+
+        :raise ValueError: The token has a different number of observers than the one captured.
+        """
+        tags, observer_states = state
+
+        if len(observer_states) != len(self._token_observers):
+            raise ValueError(f"The state of {len(observer_states)} observers cannot be restored into a token with "
+                             f"{len(self._token_observers)} observers")
+
+        self._tags = None if tags is None else dict(tags)
+
+        for observer, observer_state in zip(self._token_observers, observer_states):
+            observer.set_state(observer_state)
 
 
 # @dataclass
@@ -388,10 +641,11 @@ class Transition:
     priority: int
     weight: float
     _distribution: "Callable[[], float]"
+    _sampler: Distribution
 
     _disabled_arc_count: int
     _arcs: "Dict[str, Arc]"
-    _transition_observers: "Set[AbstractTransitionObserver]"
+    _transition_observers: "Tuple[AbstractTransitionObserver, ...]"
 
     def __init__(self, name: str, ordinal: int, priority: int, weight: float, distribution: "Callable[[], float]"):
         self._name = name
@@ -399,9 +653,10 @@ class Transition:
         self.priority = priority
         self.weight = weight
         self._distribution = distribution
+        self._sampler = as_distribution(distribution)
         self._disabled_arc_count = 0
         self._arcs = dict()
-        self._transition_observers = set()
+        self._transition_observers = ()
 
     @property
     def name(self) -> str: return self._name
@@ -416,14 +671,32 @@ class Transition:
         for arc in self._arcs.values():
             visitor.visit(arc)
 
+    @property
+    def distribution(self) -> "Callable[[], float]":
+        """ The callable sampling the firing delay of the transition."""
+        return self._distribution
+
+    @property
+    def arcs(self) -> "Iterator[Arc]":
+        """ The arcs controlled by the transition, in the order they were added."""
+        return iter(self._arcs.values())
+
+    @property
+    def sampler(self) -> Distribution:
+        """ The :class:`~petsi._distributions.Distribution` sampling the firing delay of the transition.
+
+        This is :attr:`distribution` itself or, if that is a plain callable, a wrapper around it.
+        """
+        return self._sampler
+
     def get_duration(self):
-        return self._distribution()
+        return self._sampler.sample()
 
     def attach_observer(self, plugin: "AbstractPlugin"):
         observer = plugin.observe_transition(self)
 
         if observer is not None:
-            self._transition_observers.add(observer)
+            self._transition_observers += (observer, )
 
             if self.is_enabled:
                 observer.got_enabled()
@@ -608,7 +881,7 @@ class ConstructorArc(Arc, ):  # TokenPlacer
     @cython.cfunc
     @cython.locals(token=Token)
     def flow(self):
-        token = Token(self._output_place.typ)
+        token = self._output_place._typ.new_token()
         self._output_place.push(token)
 
     @property
@@ -634,6 +907,7 @@ class DestructorArc(TokenConsumer, ):
     def flow(self):
         token = self._input_place.pop()
         token.delete()
+        self._input_place._typ.recycle(token)
 
 
 @cython.cclass
@@ -684,8 +958,8 @@ class Place:
     ordinal: int
     _typ:  TokenType
     _tokens: "Deque[Token]"
-    _place_observers: "Set[AbstractPlaceObserver]"
-    _presence_observers: "Set[PresenceObserver]"
+    _place_observers: "Tuple[AbstractPlaceObserver, ...]"
+    _presence_observers: "Tuple[PresenceObserver, ...]"
 
     _Status = Enum("_Status", "UNDEFINED STABLE TRANSIENT ERROR")
 
@@ -740,8 +1014,8 @@ class Place:
         self._typ = typ
         self._status = self._Status.UNDEFINED
         self._tokens = collections.deque()
-        self._place_observers = set()
-        self._presence_observers = set()
+        self._place_observers = ()
+        self._presence_observers = ()
 
     @property
     def name(self): return self._name
@@ -769,17 +1043,39 @@ class Place:
 
     def reset(self):
         while not self.is_empty:
-            self.pop()
+            self._typ.recycle(self.pop())
+
+    def get_marking(self) -> "Any":
+        """ Capture the state of the tokens at the place, in the order they leave the place, for :meth:`set_marking`."""
+        return [token.get_state() for token in self._tokens]
+
+    def set_marking(self, marking):
+        """ Put new tokens into the place and restore their state, as captured by :meth:`get_marking`.
+
+        :param marking: The states of the tokens, or the number of tokens to put into the place, without state.
+        """
+        states = [None] * marking if isinstance(marking, int) else marking
+
+        for state in self._in_push_order(states):
+            token: Token = self._typ.new_token()
+            self.push(token)
+
+            if state is not None:
+                token.set_state(state)
+
+    def _in_push_order(self, states):
+        """ Order the states of the tokens, listed in the order they leave the place, in the order to push them."""
+        return states
 
     def attach_observer(self, plugin: "AbstractPlugin"):
         observer = plugin.observe_place(self)
 
         if observer is not None:
-            foreach(observer.report_arrival_of, self.tokens)
-            self._place_observers.add(observer)
+            foreach(observer.report_arrival_of, self._tokens)
+            self._place_observers += (observer, )
 
     def attach_presence_observer(self, o: PresenceObserver):
-        self._presence_observers.add(o)
+        self._presence_observers += (o, )
 
         if self.is_empty:
             o.report_no_token()
@@ -841,6 +1137,110 @@ class LIFOPlace(Place):
     def _push(self, t: Token):
         self._tokens.appendleft(t)
 
+    def _in_push_order(self, states):
+        return states[::-1]
+
+
+@cython.cclass
+class CounterPlace(Place):
+    """ A place of black dot tokens that keeps only the number of tokens it holds.
+
+    Black dot tokens carry no information, so as long as no plugin observes them,
+    :meth:`push` and :meth:`pop` can simply increment and decrement a counter. The place and presence
+    observers are notified as for any other place. Popped tokens are blank tokens of the free list of the type
+    and pushed tokens are recycled.
+
+    :class:`Net` calls :meth:`materialize` on all counter places when a plugin observing
+    black dot tokens is registered. Accessing :attr:`tokens` materializes the place as well, so that
+    the tokens listed agree with :attr:`is_empty`. From then on the place holds tokens like a :class:`Place`.
+    """
+    _count: int
+    _is_counting: bool
+    _is_lifo: bool
+
+    def __init__(self, name: str, ordinal: int, typ:  TokenType, is_lifo: bool = False, **kwargs):
+        super().__init__(name, ordinal, typ, **kwargs)
+        self._count = 0
+        self._is_counting = True
+        self._is_lifo = is_lifo
+
+    @property
+    def is_counting(self) -> bool:
+        """ ``True`` until the place starts holding token objects"""
+        return self._is_counting
+
+    def materialize(self):
+        """ Replace the counter with the same number of tokens and hold tokens from now on."""
+        if self._is_counting:
+            self._is_counting = False
+
+            while self._count > 0:
+                self._tokens.append(self._typ.new_token())
+                self._count -= 1
+
+    @property
+    def tokens(self) -> "Iterator[Token]":
+        """ The tokens at the place, materializing the place if it is still counting."""
+        self.materialize()
+        return iter(self._tokens)
+
+    def get_marking(self) -> "Any":
+        """ Capture the number of tokens at the place while counting, otherwise the state of the tokens."""
+        return self._count if self._is_counting else Place.get_marking(self)
+
+    def set_marking(self, marking):
+        if not self._is_counting:
+            Place.set_marking(self, marking)
+            return
+
+        # Tokens pushed are recycled, so they have no state to restore
+        for _ in range(marking if isinstance(marking, int) else len(marking)):
+            self.push(self._typ.blank_token())
+
+    def _in_push_order(self, states):
+        return states[::-1] if self._is_lifo else states
+
+    def pop(self) -> Token:
+        if not self._is_counting:
+            return Place.pop(self)
+
+        token: Token = self._typ.blank_token()
+        self._count -= 1
+
+        for place_observer in self._place_observers:
+            place_observer.report_departure_of(token)
+
+        if self._count == 0:
+            for presence_observer in self._presence_observers:
+                presence_observer.report_no_token()
+
+        return token
+
+    def push(self, token):   # "Token"
+        if not self._is_counting:
+            Place.push(self, token)
+            return
+
+        self._count += 1
+
+        for place_observer in self._place_observers:
+            place_observer.report_arrival_of(token)
+
+        if self._count == 1:
+            for presence_observer in self._presence_observers:
+                presence_observer.report_some_token()
+
+        self._typ.recycle(token)
+
+    def _is_empty(self):
+        return self._count == 0 if self._is_counting else len(self._tokens) == 0
+
+    def _push(self, t):   # : Token
+        if self._is_lifo:
+            self._tokens.appendleft(t)
+        else:
+            self._tokens.append(t)
+
 
 _ForeachArgumentType = TypeVar("_ForeachArgumentType")
 
@@ -0,0 +1,34 @@
+""" Probability distributions for the firing delay of timed transitions.
+
+.. rubric:: Synopsis
+
+.. code-block:: python
+
+    from petsi.distributions import Exponential
+
+    simulator.add_timed_transition("arrival", Exponential(rate=0.8))
+
+The distributions are callables returning a sample, so they can be used wherever a
+``Callable[[], float]`` is expected. Timed transitions sample them without calling back into Python,
+drawing the samples in blocks. If NumPy is installed (``pip install petsi[numpy]``), the blocks are
+drawn with a :class:`numpy.random.Generator`; otherwise with a :class:`random.Random` instance.
+
+A :class:`~petsi.simulation.Simulator` created with a ``seed`` draws all the random numbers it needs,
+including the ones of the distributions created without an explicit generator,
+from the independent streams of a :class:`RandomStreams` object.
+
+.. rubric:: Internal submodules
+
+.. autosummary::
+    :template: module_reference.rst
+    :recursive:
+    :toctree:
+
+    petsi._distributions
+"""
+
+from ._distributions import Distribution, Exponential, Deterministic, Uniform, Gamma, Erlang, LogNormal, \
+    Empirical, FunctionDistribution, RandomStreams, default_generator, distribution_from_spec
+
+__all__ = ["Distribution", "Exponential", "Deterministic", "Uniform", "Gamma", "Erlang", "LogNormal",
+           "Empirical", "FunctionDistribution", "RandomStreams", "default_generator", "distribution_from_spec"]
@@ -0,0 +1,361 @@
+""" A single-file, columnar format for storing observations.
+
+.. rubric:: Synopsis
+
+.. code-block:: python
+
+    from petsi.observations import save_columnar, load_columnar
+
+    save_columnar("visits.petsi", get_token_visits(), net=simulator.net, parameters=dict(seed=42))
+
+    with load_columnar("visits.petsi", columns=["place", "duration"]) as observations:
+        durations = observations.columns["duration"]     # a memoryview mapped from the file
+        place_names = observations.names["places"]
+
+A file consists of
+
+#. an 8 byte magic string, ``PETSIOBS``,
+#. the format version and the length of the header, as little-endian 32 and 64 bit unsigned integers,
+#. the header: a UTF-8 encoded JSON object with the schema of the columns, the byte order of the machine
+   writing the file, the name tables of the net and the run parameters,
+#. the columns, each starting at an offset aligned to 64 bytes.
+
+Loading maps the file into memory; the columns are exposed as memory views (or NumPy arrays) over the mapping,
+without copying them.
+
+Observations of several runs, e.g. of the replications of a simulation, can be collected into
+:class:`ChunkedObservations` without copying them, and concatenated with a single copy when needed.
+"""
+import json
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .util import export
+
+if TYPE_CHECKING:
+    from ._structure import Net
+
+# A column of observations, or a part of it: an array or a memory view cast to the type code of the column
+Column = Union[array, memoryview]
+
+MAGIC = b"PETSIOBS"
+VERSION = 1
+
+_PREAMBLE = struct.Struct("<8sIQ")   # magic, version, header length
+_ALIGNMENT = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+@export
+def net_name_tables(net: "Net") -> Dict[str, List[str]]:
+    """ Get the names of the places, transitions and token types of ``net``, indexed by their ordinals.
+
+    The observations refer to these elements by their ordinals; the tables allow translating them to names.
+    """
+    return dict(places=[p.name for p in net.places],
+                transitions=[t.name for t in net.transitions],
+                types=[typ.name for typ in net.types],
+                )
+
+
+@export
+def save_columnar(file_name: str,
+                  observations: Dict[str, array],
+                  net: "Optional[Net]" = None,
+                  parameters: Optional[Dict[str, Any]] = None,
+                  ):
+    """ Save observations into a single file, in the columnar format.
+
+    :param file_name: The name of the file to create or overwrite.
+    :param observations: The columns to save, as returned by the callables of
+                        :meth:`~petsi.simulation.Simulator.observe`.
+    :param net: The net the observations were made on. Its name tables are saved with the observations.
+    :param parameters: JSON-serializable parameters of the run to save with the observations.
+    :raise ValueError: The columns have different lengths.
+    """
+    lengths = {len(column) for column in observations.values()}
+
+    if len(lengths) > 1:
+        raise ValueError(f"The columns must have the same length, found {sorted(lengths)}")
+
+    schema = list()
+    offset = 0
+
+    for column_name, column in observations.items():
+        schema.append(dict(name=column_name, typecode=column.typecode, itemsize=column.itemsize,
+                           length=len(column), offset=offset))
+        offset = _aligned(offset + len(column) * column.itemsize)
+
+    header = json.dumps(dict(columns=schema,
+                             byteorder=sys.byteorder,
+                             names=net_name_tables(net) if net is not None else dict(),
+                             parameters=parameters if parameters is not None else dict(),
+                             )).encode("utf-8")
+    data_start = _aligned(_PREAMBLE.size + len(header))
+
+    with open(file_name, "wb") as file:
+        file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        file.write(header)
+
+        for column_schema, column in zip(schema, observations.values()):
+            file.seek(data_start + column_schema["offset"])
+            column.tofile(file)
+
+        file.truncate(data_start + offset)
+
+
+@export
+class ColumnarObservations:
+    """ Observations loaded from a file in the columnar format.
+
+    The columns are views over a read-only memory mapping of the file. The object can be used as a context manager;
+    the views must not be used after :meth:`close`.
+
+    .. attribute:: columns
+        :type: Dict[str, memoryview]
+
+        The loaded columns, cast to their type codes, keyed by name.
+
+    .. attribute:: names
+        :type: Dict[str, List[str]]
+
+        The name tables of the net (``places``, ``transitions`` and ``types``), if they were saved.
+
+    .. attribute:: parameters
+        :type: Dict[str, Any]
+
+        The run parameters saved with the observations.
+    """
+    columns: Dict[str, memoryview]
+    names: Dict[str, List[str]]
+    parameters: Dict[str, Any]
+    version: int
+
+    def __init__(self, file_name: str, columns: Optional[Iterable[str]] = None):
+        with open(file_name, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._load(file_name, columns)
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _load(self, file_name: str, columns: Optional[Iterable[str]]):
+        if len(self._mmap) < _PREAMBLE.size:
+            raise ValueError(f"{file_name} is not a PetSi observation file")
+
+        magic, self.version, header_length = _PREAMBLE.unpack_from(self._mmap)
+
+        if magic != MAGIC:
+            raise ValueError(f"{file_name} is not a PetSi observation file")
+
+        if self.version > VERSION:
+            raise ValueError(f"{file_name} has format version {self.version}; "
+                             f"this version of PetSi reads versions up to {VERSION}")
+
+        header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_length].decode("utf-8"))
+
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{file_name} was written on a {header['byteorder']} endian machine")
+
+        schema = {column_schema["name"]: column_schema for column_schema in header["columns"]}
+        selected = list(schema) if columns is None else list(columns)
+        unknown = [column_name for column_name in selected if column_name not in schema]
+
+        if unknown:
+            raise KeyError(f"No such columns in {file_name}: {', '.join(unknown)}")
+
+        data_start = _aligned(_PREAMBLE.size + header_length)
+        buffer = memoryview(self._mmap)
+        self.columns = dict()
+
+        for column_name in selected:
+            column_schema = schema[column_name]
+            typecode = column_schema["typecode"]
+
+            if array(typecode).itemsize != column_schema["itemsize"]:
+                raise ValueError(f"The item size of column '{column_name}' in {file_name} does not match "
+                                 f"the item size of type code '{typecode}' on this machine")
+
+            start = data_start + column_schema["offset"]
+            end = start + column_schema["length"] * column_schema["itemsize"]
+            self.columns[column_name] = buffer[start:end].cast(typecode)
+
+        buffer.release()
+        self.names = header["names"]
+        self.parameters = header["parameters"]
+
+    def to_numpy(self) -> "Dict[str, Any]":
+        """ Wrap the columns into NumPy arrays, without copying them.
+
+        :return: Read-only NumPy arrays over the mapped columns, keyed by name.
+        """
+        import numpy
+        return {column_name: numpy.frombuffer(column, dtype=column.format)
+                for column_name, column in self.columns.items()}
+
+    def to_arrays(self) -> Dict[str, array]:
+        """ Copy the columns into :class:`arrays <array.array>`."""
+        arrays = dict()
+
+        for column_name, column in self.columns.items():
+            arrays[column_name] = a = array(column.format)
+            a.frombytes(column.cast('B'))
+
+        return arrays
+
+    def close(self):
+        """ Release the views and unmap the file."""
+        for column in self.columns.values():
+            column.release()
+
+        self.columns = dict()
+        self._mmap.close()
+
+    def __enter__(self) -> "ColumnarObservations":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+@export
+def load_columnar(file_name: str, columns: Optional[Iterable[str]] = None) -> ColumnarObservations:
+    """ Map a file in the columnar format into memory.
+
+    :param file_name: The name of the file.
+    :param columns: The names of the columns to load; all columns are loaded if ``None``.
+                    The pages of the other columns are never read from the disk.
+    :return: The loaded observations.
+    :raise ValueError: The file is not in the columnar format or is not readable on this machine.
+    :raise KeyError: A requested column is not in the file.
+    """
+    return ColumnarObservations(file_name, columns)
+
+
+def _typecode(column: Column) -> str:
+    return column.typecode if isinstance(column, array) else column.format
+
+
+@export
+class ChunkedColumn:
+    """ A read-only, concatenated view of a sequence of column chunks.
+
+    The chunks are referenced, not copied. Indexing locates the chunk of the item by a binary search;
+    :meth:`materialize` copies the chunks into one preallocated array.
+
+    :param typecode: The type code of the column.
+    """
+    typecode: str
+    _chunks: List[Column]
+    _ends: List[int]        # The index just past the last item of each chunk
+
+    def __init__(self, typecode: str):
+        self.typecode = typecode
+        self._chunks = list()
+        self._ends = list()
+
+    def append(self, chunk: Column):
+        """ Append a chunk to the end of the column.
+
+        :param chunk: An array or a 1-dimensional memory view with the type code of the column.
+        :raise ValueError: The type code of the chunk does not match that of the column.
+        """
+        if _typecode(chunk) != self.typecode:
+            raise ValueError(f"Cannot append a chunk of type code '{_typecode(chunk)}' "
+                             f"to a column of type code '{self.typecode}'")
+
+        self._chunks.append(chunk)
+        self._ends.append(len(self) + len(chunk))
+
+    @property
+    def chunks(self) -> List[Column]:
+        """ The chunks of the column, in order."""
+        return list(self._chunks)
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+
+        chunk_index = bisect_right(self._ends, index)
+        start = self._ends[chunk_index - 1] if chunk_index > 0 else 0
+        return self._chunks[chunk_index][index - start]
+
+    def __iter__(self) -> Iterator:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def materialize(self) -> array:
+        """ Copy the chunks into a new array, allocated once with the total length of the column."""
+        result = array(self.typecode, [0]) * len(self)
+
+        if len(result) > 0:
+            result_bytes = memoryview(result).cast('B')
+            item_size = result.itemsize
+
+            for start, end, chunk in zip([0] + self._ends, self._ends, self._chunks):
+                result_bytes[start * item_size:end * item_size] = memoryview(chunk).cast('B')
+
+        return result
+
+
+@export
+class ChunkedObservations:
+    """ The observations of a stream, collected from several batches without copying them.
+
+    Each batch is a dictionary of columns with the same names, as returned by the callables of
+    :meth:`~petsi.simulation.Simulator.observe`. The batches are neither copied nor modified; they must not
+    change while they are referenced by this object.
+
+    .. attribute:: columns
+        :type: Dict[str, ChunkedColumn]
+
+        The concatenated views of the columns, keyed by name.
+    """
+    columns: Dict[str, ChunkedColumn]
+
+    def __init__(self, batches: Iterable[Dict[str, Column]] = ()):
+        self.columns = dict()
+
+        for batch in batches:
+            self.append(batch)
+
+    def append(self, batch: Dict[str, Column]):
+        """ Append a batch of observations.
+
+        :raise ValueError: The batch has different columns than the previous ones.
+        """
+        if self.columns and set(batch) != set(self.columns):
+            raise ValueError(f"The batch has columns {sorted(batch)}, "
+                             f"expected {sorted(self.columns)}")
+
+        for column_name, chunk in batch.items():
+            if column_name not in self.columns:
+                self.columns[column_name] = ChunkedColumn(_typecode(chunk))
+
+            self.columns[column_name].append(chunk)
+
+    def __len__(self) -> int:
+        """ The number of observations."""
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def materialize(self) -> Dict[str, array]:
+        """ Copy the columns into new arrays, each allocated once.
+
+        :return: The concatenated columns, keyed by name.
+        """
+        return {column_name: column.materialize() for column_name, column in self.columns.items()}
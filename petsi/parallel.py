@@ -0,0 +1,255 @@
+""" Running independent replications of a simulation on a pool of processes.
+
+.. rubric:: Synopsis
+
+.. code-block:: python
+
+    from petsi import Simulator
+    from petsi.parallel import run_replications
+
+    def create_simulator() -> Simulator:
+        simulator = Simulator("my net")
+        ...
+        simulator.observe(transition_firing=10000, transitions=['start'])
+        return simulator
+
+    observations = run_replications(create_simulator, 64, seed=12345)
+    intervals = observations["transition_firing"]["interval"]
+
+Each worker process builds the simulator once, by calling the model factory. The replications assigned to the
+worker then reseed the simulator with an independent random stream and run :meth:`Simulator.simulate()
+<petsi.simulation.Simulator.simulate>`. The observations of the replications are merged with
+:class:`~petsi.observations.ChunkedObservations`, in the order of the replications, copying each column once.
+
+With ``warm_up`` the transient of the simulation is simulated only once, in the calling process,
+by :meth:`Simulator.warm_up() <petsi.simulation.Simulator.warm_up>`. The checkpoint of the state reached is
+handed over to the workers, and each replication :meth:`restores <petsi.simulation.Simulator.restore>` it,
+reseeds the simulator and resumes the simulation from there, with empty collectors. The replications thus
+share the state at the end of the warm-up period, including the deadlines of the timed transitions enabled
+at that time, but draw their random numbers from independent streams afterwards.
+
+With ``shared_memory=True`` the workers hand over their observations in :class:`SharedObservations`
+blocks instead of pickling them. The parent copies the columns straight from the shared memory into the merged
+arrays.
+
+The model factory must be picklable, i.e. a function defined at the top level of a module.
+The distributions of the timed transitions should be the ones in :mod:`petsi.distributions`,
+created without an explicit generator; callables drawing from the global :mod:`random` module
+would make the replications neither reproducible nor independent.
+"""
+from array import array
+from collections import defaultdict
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .util import export
+from ._distributions import RandomStreams
+from .observations import ChunkedObservations, Column
+from .simulation import Simulator
+
+# The simulator of the worker process, the way it hands over observations and the checkpoint to start
+# the replications from, set by _initialize_worker()
+_simulator: Optional[Simulator] = None
+_shared_memory: bool = False
+_checkpoint: Optional[bytes] = None
+
+# Column offsets in shared memory blocks are aligned to this many bytes
+_ALIGNMENT = 8
+
+
+@export
+class SharedObservations:
+    """ The observations of a stream, copied into a :class:`~multiprocessing.shared_memory.SharedMemory` block.
+
+    Pickling a ``SharedObservations`` object only pickles the name of the block and the layout of the columns,
+    so it can be passed to another process cheaply. That process can then map the columns without copying them.
+
+    The block is owned by the receiving side: it must call :meth:`release` once the columns are not needed any more.
+    """
+    _name: str
+    _layout: List[Tuple[str, str, int, int]]    # (column name, type code, offset, size in bytes)
+    _shared_memory: Optional[SharedMemory]
+
+    def __init__(self, name: str, layout: List[Tuple[str, str, int, int]]):
+        self._name = name
+        self._layout = layout
+        self._shared_memory = None
+
+    @classmethod
+    def share(cls, observations: Dict[str, array]) -> "SharedObservations":
+        """ Copy ``observations`` into a new shared memory block.
+
+        :param observations: The columns of the observations, as returned by
+                            :meth:`~petsi.plugins.meters.MeterPlugin.get_observations`.
+        :return: The object describing the block, with the block closed in this process.
+        """
+        layout = list()
+        size = 0
+
+        for column_name, column in observations.items():
+            offset = -(-size // _ALIGNMENT) * _ALIGNMENT
+            nbytes = len(column) * column.itemsize
+            layout.append((column_name, column.typecode, offset, nbytes))
+            size = offset + nbytes
+
+        shared_memory = SharedMemory(create=True, size=max(size, 1))
+
+        for (_, _, offset, nbytes), column in zip(layout, observations.values()):
+            shared_memory.buf[offset:offset + nbytes] = memoryview(column).cast('B')
+
+        shared_memory.close()
+        return cls(shared_memory.name, layout)
+
+    def __getstate__(self):
+        return self._name, self._layout
+
+    def __setstate__(self, state):
+        self._name, self._layout = state
+        self._shared_memory = None
+
+    def attach(self) -> Dict[str, memoryview]:
+        """ Map the columns of the observations.
+
+        :return: Read-only memory views of the columns, cast to their type codes, keyed by column name.
+                 The views must not be used after :meth:`release`.
+        """
+        return {column_name: view.cast(typecode)
+                for column_name, (typecode, view) in self._byte_views().items()}
+
+    def to_arrays(self) -> Dict[str, array]:
+        """ Copy the columns of the observations into :class:`arrays <array.array>`."""
+        columns = dict()
+
+        for column_name, (typecode, view) in self._byte_views().items():
+            columns[column_name] = column = array(typecode)
+            column.frombytes(view)
+
+        return columns
+
+    def release(self):
+        """ Free the shared memory block. The views returned by :meth:`attach` must have been released before."""
+        if self._shared_memory is None:
+            self._shared_memory = SharedMemory(self._name)
+
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+
+    def _byte_views(self) -> Dict[str, Tuple[str, memoryview]]:
+        if self._shared_memory is None:
+            self._shared_memory = SharedMemory(self._name)
+
+        buffer = self._shared_memory.buf.toreadonly()
+        return {column_name: (typecode, buffer[offset:offset + nbytes])
+                for column_name, typecode, offset, nbytes in self._layout}
+
+
+def _initialize_worker(model_factory: Callable[[], Simulator], shared_memory: bool, checkpoint: Optional[bytes]):
+    global _simulator, _shared_memory, _checkpoint
+    _simulator = model_factory()
+    _shared_memory = shared_memory
+    _checkpoint = checkpoint
+
+
+def _run_replication(random_streams: RandomStreams) \
+        -> Dict[str, Union[Dict[str, array], SharedObservations]]:
+    assert _simulator is not None, "The worker was not initialized"
+
+    if _checkpoint is None:
+        _simulator.reseed(random_streams)
+        _simulator.simulate()
+    else:
+        # Reseeding after the restore replaces the random generators of the checkpoint
+        _simulator.restore(_checkpoint)
+        _simulator.reseed(random_streams)
+        _simulator.simulate(resume=True)
+
+    observations = _simulator.get_observations()
+
+    if _shared_memory:
+        return {stream: SharedObservations.share(columns) for stream, columns in observations.items()}
+    else:
+        return observations
+
+
+@export
+def run_replications(model_factory: Callable[[], Simulator],
+                     n: int,
+                     seed: Any = None,
+                     processes: Optional[int] = None,
+                     shared_memory: bool = False,
+                     warm_up: Optional[float] = None,
+                     ) -> Dict[str, Dict[str, array]]:
+    """ Run ``n`` independent replications of a simulation and merge their observations.
+
+    :param model_factory: A picklable callable returning a :class:`~petsi.simulation.Simulator` with the
+                    observation streams already set up by :meth:`~petsi.simulation.Simulator.observe`.
+    :param n:       The number of replications.
+    :param seed:    The seed to derive the random streams of the replications from, see
+                    :class:`~petsi.distributions.RandomStreams`. The results do not depend on ``processes``,
+                    except for the token ids in the ``token_visits`` stream, which are numbered per worker.
+    :param processes: The number of worker processes; defaults to the number of CPUs.
+                    With ``processes=1`` the replications run in the calling process.
+    :param shared_memory: Hand over the observations from the workers in shared memory instead of pickling them.
+    :param warm_up: The simulated time to run the simulation for once, before starting all the replications
+                    from the state reached. The warm-up period draws its random numbers from a stream of its own,
+                    so the streams of the replications are the same as without warm-up.
+    :return:        The merged observations of each stream, keyed by the stream type.
+    :raise ValueError: ``n`` or ``processes`` is not positive, or ``warm_up`` is negative.
+    """
+    if n < 1:
+        raise ValueError(f"The number of replications must be positive, found {n}")
+
+    if processes is not None and processes < 1:
+        raise ValueError(f"The number of processes must be positive, found {processes}")
+
+    if warm_up is not None and warm_up < 0:
+        raise ValueError(f"The warm-up period must not be negative, found {warm_up}")
+
+    # The first n streams of spawn(n + 1) are the same as the ones of spawn(n)
+    random_streams = RandomStreams(seed).spawn(n + 1)
+    warm_up_streams = random_streams.pop()
+    checkpoint = None
+
+    if warm_up is not None:
+        simulator = model_factory()
+        simulator.reseed(warm_up_streams)
+        checkpoint = simulator.warm_up(warm_up)
+
+    if processes == 1:
+        _initialize_worker(model_factory, False, checkpoint)
+        return _merge([_run_replication(streams) for streams in random_streams])
+
+    if shared_memory:
+        # Workers must register their blocks with the tracker of this process; a tracker of their own
+        # would destroy the blocks when the worker exits.
+        resource_tracker.ensure_running()
+
+    with Pool(processes, initializer=_initialize_worker, initargs=(model_factory, shared_memory, checkpoint)) as pool:
+        replications = pool.map(_run_replication, random_streams)
+
+    if not shared_memory:
+        return _merge(replications)
+
+    attached = [{stream: shared_observations.attach() for stream, shared_observations in replication.items()}
+                for replication in replications]
+
+    try:
+        return _merge(attached)
+    finally:
+        for replication, views in zip(replications, attached):
+            for stream, shared_observations in replication.items():
+                for view in views[stream].values():
+                    view.release()
+
+                shared_observations.release()
+
+
+def _merge(replications: List[Dict[str, Dict[str, Column]]]) -> Dict[str, Dict[str, array]]:
+    observations_by_stream: Dict[str, ChunkedObservations] = defaultdict(ChunkedObservations)
+
+    for replication in replications:
+        for stream, observations in replication.items():
+            observations_by_stream[stream].append(observations)
+
+    return {stream: observations.materialize() for stream, observations in observations_by_stream.items()}
@@ -16,6 +16,18 @@
     from .plugins import TransitionIntervalPlugin
     plugin = TransitionIntervalPlugin(...)
 
+    from .plugins import BatchMeansPlugin
+    plugin = BatchMeansPlugin(...)
+
+    from .plugins import ProfilerPlugin
+    plugin = ProfilerPlugin(...)
+
+    from .plugins import TracePlugin
+    plugin = TracePlugin(...)
+
+    from .plugins import Buckets
+    buckets = Buckets(0.001, 1000.0, 60, logarithmic=True)
+
 .. autodata:: AutoFirePlugin
     :noindex:
 
@@ -36,6 +48,26 @@
 
     For the interface documentation, refer to :class:`~.transitioninterval.TransitionIntervalPlugin`.
 
+.. autodata:: BatchMeansPlugin
+    :noindex:
+
+    For the interface documentation, refer to :class:`~.batchmeans.BatchMeansPlugin`.
+
+.. autodata:: ProfilerPlugin
+    :noindex:
+
+    For the interface documentation, refer to :class:`~.profiler.ProfilerPlugin`.
+
+.. autodata:: TracePlugin
+    :noindex:
+
+    For the interface documentation, refer to :class:`~.trace.TracePlugin`.
+
+.. autodata:: Buckets
+    :noindex:
+
+    For the interface documentation, refer to :class:`~._summary.Buckets`.
+
 .. rubric:: Internal submodules
 
 .. autosummary::
@@ -44,9 +76,15 @@
     :toctree:
 
     petsi.plugins._meters
+    petsi.plugins._summary
+    petsi.plugins.profiler
 """
 
 from .autofire import AutoFirePlugin
 from .sojourntime import SojournTimePlugin
 from .tokencounter import TokenCounterPlugin
 from .transitioninterval import TransitionIntervalPlugin
+from .batchmeans import BatchMeansPlugin
+from .profiler import ProfilerPlugin
+from .trace import TracePlugin
+from ._summary import Buckets
@@ -1,11 +1,30 @@
 # This file is needed because GenericCollector is a base class for extension classes.
 
 from cpython.array cimport array
+from ._summary cimport SummaryTable
+from .autofire._autofire cimport Termination
 
 cdef class GenericCollector:
-    cdef public int required_observations
+    cdef public long long required_observations
     cdef dict _arrays      #: Dict[str, array]
     cdef array _any_array
+    cdef object _sink      #: Optional[Callable[[Dict[str, array]], None]]
+    cdef Py_ssize_t _chunk_size
+    cdef unsigned long long _flushed_count     # The number of observations handed over to the sink
+    cdef readonly SummaryTable summary         # Summarizes the observations instead of keeping the rows, if not None
+    cdef bint _detects_warm_up                 # Drop the observations of the warm-up period of each simulation
+    cdef bint _warming_up                      # The end of the warm-up period is not detected yet
+    cdef Py_ssize_t _first_warm_up_check
+    cdef Py_ssize_t _max_warm_up_check         # The number of rows to give up the detection at
+    cdef Py_ssize_t _next_warm_up_check        # The number of rows to attempt the detection at
+    cdef readonly unsigned long long truncated_observations  # The number of observations dropped as warm-up
+    cdef readonly Termination termination      # Counts the need for more observations, if not None
+    cdef bint _is_satisfied                    # The need for more observations is not counted in termination
+
+    cdef _row_collected(self)
+    cdef _truncate_warm_up(self)
+    cdef _update_termination(self)
+    cdef bint _has_enough_observations(self) except -1
 
     # def reset(self)
     # cpdef get_observations(self) -> Dict[str, array]
@@ -1,8 +1,56 @@
 """ A Cython extension module providing a generic data collector.
 """
 
+import warnings
 from array import array
-from typing import Dict
+from typing import Dict, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._summary import SummaryTable
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_WARM_UP_CHECK = 1000    # The number of rows to collect before the first attempt to detect the warm-up period
+DEFAULT_MAX_WARM_UP_CHECK = 64 * DEFAULT_WARM_UP_CHECK  # The number of rows to give up the detection at
+MSER_BATCH_SIZE = 5
+
+
+def mser_truncation_point(values, batch_size: int = MSER_BATCH_SIZE) -> Optional[int]:
+    """ Detect the end of the warm-up period in a series of observations with the MSER-5 rule.
+
+    The observations are grouped into batches of ``batch_size`` and the number of leading batches ``d`` to drop is
+    chosen to minimize the marginal standard error of the remaining batch means,
+    ``sum((x[i] - mean(x[d:]))**2 for i in range(d, k)) / (k - d)**2``.
+    The truncation point is only accepted if it falls into the first half of the series; a minimum
+    in the second half means the series is too short to tell the end of the warm-up period.
+
+    :param values: The series of observations.
+    :param batch_size: The number of observations in a batch.
+    :return: The number of observations to drop, or ``None`` if the truncation point cannot be determined yet.
+    """
+    k = len(values) // batch_size
+
+    if k < 10:
+        return None
+
+    batch_means = [sum(values[i * batch_size:(i + 1) * batch_size]) / batch_size for i in range(k)]
+    best_d, best_statistic = None, None
+    total = total_of_squares = 0.0
+
+    # Traverse the batches backwards, so that the sums over the batches after d accumulate in O(k)
+    for d in range(k - 1, -1, -1):
+        total += batch_means[d]
+        total_of_squares += batch_means[d] ** 2
+        n = k - d
+
+        if n < 2:
+            continue
+
+        statistic = (total_of_squares - total * total / n) / (n * n)
+
+        if best_statistic is None or statistic <= best_statistic:
+            best_d, best_statistic = d, statistic
+
+    return best_d * batch_size if best_d is not None and best_d < k // 2 else None
 
 
 class GenericCollector:
@@ -43,18 +91,134 @@ class GenericCollector:
         :type: Dict[str, array.array]
 
         Every time the :meth:`collect` method is invoked it should add the same number of observations
-        to each of these arrays.
+        to each of these arrays, then call :meth:`_row_collected`.
+
+    .. rubric:: Sink mode
+
+    By default the observations accumulate in memory until :meth:`get_observations` is called.
+    After :meth:`set_sink` the collector hands over the observations to the sink in chunks of a fixed number of rows,
+    as soon as a chunk fills up, so that the memory used by the collector does not grow with the number of
+    observations. The sink is a callable accepting the chunk as a dictionary of arrays, like the ones returned by
+    :meth:`get_observations`.
+
+    .. rubric:: Warm-up detection
+
+    After :meth:`detect_warm_up` the collector drops the observations of the warm-up period of the simulation.
+    Every time the number of rows collected doubles, the MSER-5 rule is applied to the column named by the
+    :attr:`_warm_up_column` attribute of the class (see :func:`mser_truncation_point`). Once the end of the
+    warm-up period is detected, the rows before it are dropped and no further detection is attempted until
+    :meth:`restart`. In sink mode the rows are only handed over to the sink after the warm-up period.
+
+    The rows collected before the end of the warm-up period is detected do not count towards
+    :attr:`required_observations`, so the collector needs more observations at least until the first
+    detection attempt, whatever :attr:`required_observations` is. :meth:`get_observations` warns if the
+    end of the warm-up period has not been detected in the rows returned. If the end of the warm-up period
+    is not detected in the rows of the last attempt, e.g. because the simulated system is not stable, the
+    collector gives up the detection with a warning and keeps all the rows.
+
+    The column holds the observations of all the places or transitions the collector observes, interleaved in
+    the order they were made. The truncation point is detected in this mixed series and applies to all of them.
+
+    .. rubric:: Summary mode
+
+    A collector created with a :class:`~petsi.plugins._summary.SummaryTable` passes the observations to
+    the table instead of storing the rows. :meth:`get_observations` then returns the summary statistics from the table,
+    one row per place or transition, so the memory used by the collector does not depend on the number of observations.
+
+    .. rubric:: Termination
+
+    After :meth:`set_termination` the collector counts itself in the ``pending`` conditions of a
+    :class:`~petsi.plugins.autofire.Termination` flag while it needs more observations, so that the
+    fire control can stop as soon as all the collectors are satisfied, without polling
+    :meth:`need_more_observations`. The flag is updated as the rows are collected, whenever the
+    collector is reset and by :meth:`set_termination`, which has to be called again after changing
+    :attr:`required_observations`.
     """
 
-    def __init__(self, required_observations: int):
+    def __init__(self, required_observations: int, summary: "Optional[SummaryTable]" = None):
         """ Initialize the collector via :meth:`reset`.
 
         :param required_observations: The number of observations to accumulate in :attr:`_arrays` before
                 :meth:`need_more_observations` returns ``False``
+        :param summary: The table to summarize the observations in, or ``None`` to collect the rows.
         """
         self.required_observations = required_observations
+        self.summary = summary
         self._arrays = dict()
-        self.reset()
+        self._sink = None
+        self._chunk_size = DEFAULT_CHUNK_SIZE
+        self._detects_warm_up = False
+        self._first_warm_up_check = DEFAULT_WARM_UP_CHECK
+        self._max_warm_up_check = DEFAULT_MAX_WARM_UP_CHECK
+        self.termination = None
+        self._is_satisfied = False
+        self.restart()
+
+    def detect_warm_up(self, first_check: int = DEFAULT_WARM_UP_CHECK, max_check: int = DEFAULT_MAX_WARM_UP_CHECK):
+        """ Detect the end of the warm-up period and drop the observations before it.
+
+        :param first_check: The number of rows to collect before the first attempt to detect the end of the
+                warm-up period.
+        :param max_check: The number of rows after which the detection is given up.
+        :raise ValueError: The collector is in summary mode, ``first_check`` is less than 50 or
+                ``max_check`` is less than ``first_check``.
+        """
+        if self.summary is not None:
+            raise ValueError("A collector in summary mode keeps no rows to truncate")
+
+        if first_check < 10 * MSER_BATCH_SIZE:
+            raise ValueError(f"At least {10 * MSER_BATCH_SIZE} rows are needed to detect the warm-up period, "
+                             f"found {first_check}")
+
+        if max_check < first_check:
+            raise ValueError(f"The detection cannot be given up at {max_check} rows, "
+                             f"before the first attempt at {first_check} rows")
+
+        self._detects_warm_up = True
+        self._first_warm_up_check = first_check
+        self._max_warm_up_check = max_check
+        self.restart()
+
+    def restart(self):
+        """ :meth:`Reset <reset>` the collector for a new simulation, with a new warm-up period."""
+        # noinspection PyAttributeOutsideInit
+        self._warming_up = self._detects_warm_up
+        # noinspection PyAttributeOutsideInit
+        self._next_warm_up_check = self._first_warm_up_check
+        self.reset()    # The rows collected during the warm-up period do not satisfy the collector
+        # noinspection PyAttributeOutsideInit
+        self.truncated_observations = 0
+
+    def set_termination(self, termination):
+        """ Count the need of the collector for more observations in ``termination``.
+
+        :param termination: The flag to keep up-to-date, or ``None`` to stop updating the current one.
+        """
+        if self.termination is not None and not self._is_satisfied:
+            self.termination.pending -= 1
+
+        self.termination = termination
+
+        if termination is not None and not self._is_satisfied:
+            termination.pending += 1
+
+        self._update_termination()
+
+    def set_sink(self, sink: Optional[Callable[[Dict[str, array]], None]], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """ Hand over the observations to ``sink`` in chunks of ``chunk_size`` rows.
+
+        :param sink: A callable accepting a dictionary of arrays, or ``None`` to keep the observations in memory.
+        :param chunk_size: The number of rows in a chunk.
+        :raise ValueError: ``chunk_size`` is not positive or the collector is in summary mode.
+        """
+        if self.summary is not None:
+            raise ValueError("A collector in summary mode has no rows to hand over to a sink")
+
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be a positive integer, found {chunk_size}")
+
+        self._sink = sink
+        self._chunk_size = chunk_size
 
     def reset(self):
         """ Place newly created, empty arrays into :attr:`_arrays`
@@ -66,21 +230,122 @@ class GenericCollector:
         self._arrays.update((field_name, array(type_code)) for field_name, type_code in self._type_codes.items())
         # noinspection PyAttributeOutsideInit
         self._any_array = next(iter(self._arrays.values()))    # for calculating the number of observations
+        # noinspection PyAttributeOutsideInit
+        self._flushed_count = 0
+
+        if self.summary is not None:
+            self.summary.reset()
+
+        self._update_termination()
+
+    def get_state(self):
+        """ Capture the observations collected and the progress of the warm-up detection, for :meth:`set_state`.
+
+        The observations already handed over to the sink are only counted.
+        """
+        return (dict((name, column[:]) for name, column in self._arrays.items()),
+                self._flushed_count, self._warming_up, self._next_warm_up_check, self.truncated_observations,
+                None if self.summary is None else self.summary.get_state())
+
+    def set_state(self, state):
+        """ Restore the observations and the progress of the warm-up detection, as captured by :meth:`get_state`."""
+        arrays, flushed_count, warming_up, next_warm_up_check, truncated_observations, summary = state
+        self.reset()
+
+        for name, column in arrays.items():
+            self._arrays[name].extend(column)
+
+        self._flushed_count = flushed_count
+        self._warming_up = warming_up
+        self._next_warm_up_check = next_warm_up_check
+        self.truncated_observations = truncated_observations
+
+        if self.summary is not None:
+            self.summary.set_state(summary)
+
+        self._update_termination()
 
     def get_observations(self) -> Dict[str, array]:
         """ Retrieve the collected observations.
 
         This method implicitly :meth:`resets <reset>` the state of the collector.
+        In sink mode the observations not handed over yet are flushed to the sink and empty arrays are returned.
+        In summary mode the summary statistics are returned.
         """
-        data = self._arrays.copy()
+        if self._warming_up and len(self._any_array) > 0:
+            warnings.warn(f"The end of the warm-up period was not detected in {len(self._any_array)} rows, "
+                          f"the observations returned include the warm-up period", RuntimeWarning)
+
+        if self._sink is not None:
+            self.flush()
+
+        data = self._arrays.copy() if self.summary is None else self.summary.get_observations()
         self.reset()
         return data
 
+    def flush(self):
+        """ Hand over the observations collected since the previous flush to the sink, even if they do not
+        fill a chunk."""
+        flushed_count = self._flushed_count + len(self._any_array)
+
+        if len(self._any_array) > 0:
+            self._sink(self._arrays.copy())
+
+        # reset() may be extended in derived classes to rebind their references to the arrays
+        self.reset()
+        self._flushed_count = flushed_count
+        self._update_termination()
+
+    def _row_collected(self):
+        if self._warming_up:
+            if len(self._any_array) >= self._next_warm_up_check:
+                self._truncate_warm_up()
+        elif self._sink is not None and len(self._any_array) >= self._chunk_size:
+            self.flush()
+
+        self._update_termination()
+
+    def _update_termination(self):
+        is_satisfied = self._has_enough_observations()
+
+        if is_satisfied != self._is_satisfied:
+            self._is_satisfied = is_satisfied
+
+            if self.termination is not None:
+                self.termination.pending += -1 if is_satisfied else 1
+
+    def _truncate_warm_up(self):
+        truncation_point = mser_truncation_point(self._arrays[self._warm_up_column])
+
+        if truncation_point is None:
+            if self._next_warm_up_check < self._max_warm_up_check:
+                self._next_warm_up_check = min(2 * self._next_warm_up_check, self._max_warm_up_check)
+            else:
+                warnings.warn(f"The end of the warm-up period was not detected in {len(self._any_array)} rows, "
+                              f"giving up the detection", RuntimeWarning)
+                self._warming_up = False
+
+            return
+
+        for column in self._arrays.values():
+            del column[:truncation_point]
+
+        self.truncated_observations = truncation_point
+        self._warming_up = False
+
     def need_more_observations(self) -> bool:
         """ Determine if we have collected enough data.
 
         :return: ``False`` if at least ``required_observations`` have been collected since
-                 the last call to :meth:`get_observations`
+                 the last call to :meth:`get_observations`, including the ones handed over to the sink
+                 or summarized. The observations dropped as part of the warm-up period do not count,
+                 and neither do the ones collected before its end is detected.
         """
-        return len(self._any_array) < self.required_observations
+        return not self._has_enough_observations()
+
+    def _has_enough_observations(self):
+        if self.summary is not None:
+            return self.summary.count >= self.required_observations
+
+        return not self._warming_up and self._flushed_count + len(self._any_array) >= self.required_observations
 
@@ -1,5 +1,11 @@
 from array import array
-from typing import Dict
+from typing import Any, Dict, Callable, Optional, Sequence
+
+
+def mser_truncation_point(values: Sequence[float], batch_size: int = ...) -> Optional[int]: pass
+
+from ._summary import SummaryTable
+from .autofire import Termination
 
 
 class GenericCollector:
@@ -7,13 +13,48 @@ class GenericCollector:
     _type_codes: Dict[str, str]
     _arrays: Dict[str, array]
     _any_array: array
+    _sink: Optional[Callable[[Dict[str, array]], None]]
+    _chunk_size: int
+    _flushed_count: int
+    summary: Optional[SummaryTable]
+    _warm_up_column: str
+    _detects_warm_up: bool
+    _warming_up: bool
+    _first_warm_up_check: int
+    _max_warm_up_check: int
+    _next_warm_up_check: int
+    truncated_observations: int
+    termination: Optional[Termination]
+    _is_satisfied: bool
+
+    def __init__(self, required_observations: int, summary: Optional[SummaryTable] = None): pass
+
+    def set_termination(self, termination: Optional[Termination]): pass
+
+    def set_sink(self, sink: Optional[Callable[[Dict[str, array]], None]], chunk_size: int = ...): pass
+
+    def detect_warm_up(self, first_check: int = ..., max_check: int = ...): pass
 
-    def __init__(self, required_observations: int): pass
+    def restart(self): pass
 
     def reset(self): pass
 
+    def get_state(self) -> Any: pass
+
+    def set_state(self, state: Any): pass
+
     def get_observations(self) -> Dict[str, array]:
         pass
 
+    def flush(self): pass
+
+    def _row_collected(self): pass
+
+    def _truncate_warm_up(self): pass
+
+    def _update_termination(self): pass
+
+    def _has_enough_observations(self) -> bool: pass
+
     def need_more_observations(self) -> bool: pass
 
@@ -0,0 +1,68 @@
+import cython
+
+
+cdef class P2Quantile:
+    cdef readonly double probability
+    cdef double[::1] _heights       # The heights of the five markers
+    cdef double[::1] _positions     # The actual positions of the markers
+    cdef double[::1] _desired       # The desired positions of the markers
+    cdef double[::1] _increments    # The increments of the desired positions
+    cdef unsigned long long _count
+
+    @cython.locals(k=int, i=int, step=int, d=cython.double, height=cython.double)
+    cdef add(self, double value)
+    cdef double _parabolic(self, int i, int step)
+    cdef double _linear(self, int i, int step)
+
+
+cdef class OnlineStatistics:
+    cdef readonly unsigned long long count
+    cdef readonly double weight
+    cdef readonly double mean
+    cdef readonly double minimum
+    cdef readonly double maximum
+    cdef double _m2
+    cdef list _quantiles        # List[P2Quantile]
+
+    @cython.locals(delta=cython.double, quantile=P2Quantile)
+    cdef add(self, double value, double weight)
+
+
+cdef class SummaryTable:
+    cdef str _key_name
+    cdef bint _weighted
+    cdef tuple _probabilities
+    cdef list _statistics       # List[Optional[OnlineStatistics]], indexed by the keys
+    cdef readonly unsigned long long count
+
+    @cython.locals(statistics=OnlineStatistics)
+    cpdef add(self, Py_ssize_t key, double value, double weight)
+
+
+cdef class HistogramTable(SummaryTable):
+    cdef Py_ssize_t _size       # The number of regular buckets
+
+    @cython.locals(histogram='double[::1]', bucket=Py_ssize_t)
+    cpdef add(self, Py_ssize_t key, double value, double weight)
+
+
+cdef class Buckets:
+    cdef readonly double low
+    cdef readonly double high
+    cdef readonly Py_ssize_t n
+    cdef readonly bint logarithmic
+    cdef double _scale          # The number of buckets per unit of the (logarithmic) value
+
+    @cython.locals(bucket=Py_ssize_t)
+    cpdef Py_ssize_t bucket_of(self, double value)
+
+
+cdef class SojournTimeHistograms(SummaryTable):
+    cdef Buckets _buckets       # The buckets of the places missing from _place_buckets
+    cdef dict _place_buckets    # Dict[int, Buckets]
+    cdef dict _histograms       # Dict[Tuple[int, int, int], array], keyed by (kind, token type, place)
+
+    cpdef add(self, Py_ssize_t key, double value, double weight)
+
+    @cython.locals(buckets=Buckets, histogram='unsigned long long[::1]')
+    cpdef add_sojourn(self, int kind, unsigned int token_type, unsigned int place, double duration)
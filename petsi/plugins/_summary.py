@@ -0,0 +1,473 @@
+# cython: language_level=3
+# cython: profile=False
+
+# You may compile this file as:
+#    cythonize --3str -a -f -i petsi/plugins/_summary.py
+
+""" A Cython extension module for summarizing observations online, in constant memory.
+
+The summary collectors of the meter plugins feed their observations into a :class:`SummaryTable` instead of
+storing them row by row. The table keeps an :class:`OnlineStatistics` object for each place or transition ordinal,
+which maintains
+
+- the moments of the observed values with Welford's algorithm (weighted, if the observations have weights),
+- the minimum and the maximum and
+- streaming quantile estimates, with the P² algorithm of Jain and Chlamtac.
+
+A :class:`HistogramTable` keeps the total weight of the values falling into each bucket of a histogram instead,
+e.g. the time spent at each token count at a place. A :class:`SojournTimeHistograms` table counts the sojourn times
+of tokens in the :class:`Buckets` of histograms kept for each place and token type.
+"""
+
+from array import array
+from math import nan, inf, log
+from typing import TYPE_CHECKING
+
+import cython
+
+if TYPE_CHECKING:
+    from typing import Dict, Sequence, Tuple
+
+DEFAULT_PROBABILITIES = (0.5, 0.9, 0.99)
+
+
+@cython.cclass
+class P2Quantile:
+    """ Estimate a quantile of a stream of values with the P² algorithm, using five markers.
+
+    :param probability: The probability of the quantile, between 0 and 1.
+    """
+
+    def __init__(self, probability):
+        if not 0.0 < probability < 1.0:
+            raise ValueError(f"The probability of a quantile must be between 0 and 1, found {probability}")
+
+        self.probability = probability
+        self._heights = array('d', [0.0] * 5)
+        self._positions = array('d', [1.0, 2.0, 3.0, 4.0, 5.0])
+        self._desired = array('d', [1.0, 1.0 + 2 * probability, 1.0 + 4 * probability, 3.0 + 2 * probability, 5.0])
+        self._increments = array('d', [0.0, probability / 2, probability, (1.0 + probability) / 2, 1.0])
+        self._count = 0
+
+    def add(self, value):
+        if self._count < 5:
+            self._heights[self._count] = value
+            self._count += 1
+
+            if self._count == 5:
+                self._heights = array('d', sorted(self._heights))
+
+            return
+
+        self._count += 1
+
+        if value < self._heights[0]:
+            self._heights[0] = value
+            k = 0
+        elif value >= self._heights[4]:
+            self._heights[4] = value
+            k = 3
+        else:
+            k = 0
+
+            while value >= self._heights[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            self._positions[i] += 1.0
+
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Adjust the heights of the middle markers if they are off their desired positions
+        for i in range(1, 4):
+            d = self._desired[i] - self._positions[i]
+
+            if (d >= 1.0 and self._positions[i + 1] - self._positions[i] > 1.0) or \
+                    (d <= -1.0 and self._positions[i - 1] - self._positions[i] < -1.0):
+                step = 1 if d > 0 else -1
+                height = self._parabolic(i, step)
+
+                if not self._heights[i - 1] < height < self._heights[i + 1]:
+                    height = self._linear(i, step)
+
+                self._heights[i] = height
+                self._positions[i] += step
+
+    def _parabolic(self, i, step):
+        return self._heights[i] + step / (self._positions[i + 1] - self._positions[i - 1]) * (
+                (self._positions[i] - self._positions[i - 1] + step) * (self._heights[i + 1] - self._heights[i])
+                / (self._positions[i + 1] - self._positions[i])
+                + (self._positions[i + 1] - self._positions[i] - step) * (self._heights[i] - self._heights[i - 1])
+                / (self._positions[i] - self._positions[i - 1]))
+
+    def _linear(self, i, step):
+        return self._heights[i] + step * (self._heights[i + step] - self._heights[i]) \
+            / (self._positions[i + step] - self._positions[i])
+
+    def value(self) -> float:
+        """ The current estimate of the quantile; ``nan`` if no values were added.
+
+        Until five values are seen, the estimate is the corresponding order statistic of the values.
+        """
+        if self._count == 0:
+            return nan
+
+        if self._count < 5:
+            values = sorted([self._heights[i] for i in range(self._count)])
+            return values[min(self._count - 1, int(self.probability * self._count))]
+
+        return self._heights[2]
+
+    def get_state(self):
+        """ Capture the markers of the estimator, for :meth:`set_state`."""
+        return ([self._heights[i] for i in range(5)], [self._positions[i] for i in range(5)],
+                [self._desired[i] for i in range(5)], self._count)
+
+    def set_state(self, state):
+        """ Restore the markers of the estimator, as captured by :meth:`get_state`."""
+        heights, positions, desired, self._count = state
+        self._heights = array('d', heights)
+        self._positions = array('d', positions)
+        self._desired = array('d', desired)
+
+
+@cython.cclass
+class OnlineStatistics:
+    """ Summary statistics of a stream of (optionally weighted) values.
+
+    :param probabilities: The probabilities of the quantiles to estimate. Quantiles are only estimated for
+        unweighted values.
+    """
+
+    def __init__(self, probabilities=DEFAULT_PROBABILITIES):
+        self.count = 0
+        self.weight = 0.0
+        self.mean = nan
+        self._m2 = 0.0
+        self.minimum = nan
+        self.maximum = nan
+        self._quantiles = [P2Quantile(probability) for probability in probabilities]
+
+    def add(self, value, weight):
+        """ Add ``value`` to the statistics, with weight ``weight`` (1.0 for unweighted values)."""
+        if self.count == 0:
+            self.minimum = self.maximum = value
+        elif value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+
+        self.count += 1
+
+        if weight > 0.0:
+            self.weight += weight
+
+            if self.weight == weight:
+                self.mean = value
+            else:
+                delta = value - self.mean
+                self.mean += delta * weight / self.weight
+                self._m2 += weight * delta * (value - self.mean)
+
+        for quantile in self._quantiles:
+            quantile.add(value)
+
+    def variance(self, weighted) -> float:
+        """ The variance of the values.
+
+        :param weighted: Return the weighted population variance if ``True``, otherwise the sample variance of
+            the values, assuming unit weights.
+        """
+        if weighted:
+            return self._m2 / self.weight if self.weight > 0.0 else nan
+        else:
+            return self._m2 / (self.weight - 1.0) if self.weight > 1.0 else nan
+
+    def quantiles(self) -> "Sequence[float]":
+        """ The estimates of the quantiles, in the order of the probabilities."""
+        return [quantile.value() for quantile in self._quantiles]
+
+    def get_state(self):
+        """ Capture the statistics, for :meth:`set_state`."""
+        return (self.count, self.weight, self.mean, self._m2, self.minimum, self.maximum,
+                [quantile.get_state() for quantile in self._quantiles])
+
+    def set_state(self, state):
+        """ Restore the statistics, as captured by :meth:`get_state`."""
+        self.count, self.weight, self.mean, self._m2, self.minimum, self.maximum, quantiles = state
+
+        for quantile, quantile_state in zip(self._quantiles, quantiles):
+            quantile.set_state(quantile_state)
+
+
+def quantile_column_name(probability: float) -> str:
+    """ The name of the column holding the quantile of ``probability``, e.g. ``p99`` for 0.99."""
+    return f"p{probability * 100:g}"
+
+
+@cython.cclass
+class SummaryTable:
+    """ Summary statistics of values, keyed by the ordinals of places or transitions.
+
+    :param key_name: The name of the column holding the ordinals in :meth:`get_observations`.
+    :param weighted: Whether the values are weighted, e.g. by duration. The variance of weighted values is
+        the weighted population variance, and no quantiles are estimated for them.
+    :param probabilities: The probabilities of the quantiles to estimate for unweighted values.
+    """
+
+    def __init__(self, key_name, weighted=False, probabilities=DEFAULT_PROBABILITIES):
+        self._key_name = key_name
+        self._weighted = weighted
+        self._probabilities = () if weighted else tuple(probabilities)
+        self.reset()
+
+    def reset(self):
+        """ Forget all the values added."""
+        self._statistics = list()
+        self.count = 0
+
+    def add(self, key, value, weight):
+        """ Add ``value`` with ``weight`` to the statistics of ``key``."""
+        while key >= len(self._statistics):
+            self._statistics.append(None)
+
+        statistics = self._statistics[key]
+
+        if statistics is None:
+            self._statistics[key] = statistics = OnlineStatistics(self._probabilities)
+
+        statistics.add(value, weight)
+        self.count += 1
+
+    def get_state(self):
+        """ Capture the values added so far, for :meth:`set_state`."""
+        return self.count, [None if statistics is None else statistics.get_state()
+                            for statistics in self._statistics]
+
+    def set_state(self, state):
+        """ Restore the values added, as captured by :meth:`get_state`."""
+        self.count, statistics_states = state
+        self._statistics = list()
+
+        for statistics_state in statistics_states:
+            if statistics_state is None:
+                self._statistics.append(None)
+            else:
+                statistics = OnlineStatistics(self._probabilities)
+                statistics.set_state(statistics_state)
+                self._statistics.append(statistics)
+
+    def get_observations(self) -> "Dict[str, array]":
+        """ Summarize the values, one row for each key with values.
+
+        :return: The columns of the summary, keyed by name: the key, ``count``, ``weight`` (the total weight),
+            ``mean``, ``variance``, ``minimum``, ``maximum`` and a column for each quantile, e.g. ``p99``.
+        """
+        columns = {self._key_name: array('I'), "count": array('Q')}
+        columns.update((column_name, array('d')) for column_name in
+                       ["weight", "mean", "variance", "minimum", "maximum"] +
+                       [quantile_column_name(probability) for probability in self._probabilities])
+
+        for key, statistics in enumerate(self._statistics):
+            if statistics is not None:
+                row = [key, statistics.count, statistics.weight, statistics.mean,
+                       statistics.variance(self._weighted), statistics.minimum, statistics.maximum]
+                row.extend(statistics.quantiles())
+
+                for column, value in zip(columns.values(), row):
+                    column.append(value)
+
+        return columns
+
+
+
+@cython.cclass
+class HistogramTable(SummaryTable):
+    """ Histograms of the total weight of integer values, keyed by the ordinals of places or transitions.
+
+    Each value falls into the bucket of the same index, except for the values greater than or equal to ``size``,
+    which all fall into the overflow bucket, at index ``size``.
+
+    :param key_name: The name of the column holding the ordinals in :meth:`get_observations`.
+    :param size: The number of regular buckets.
+    """
+
+    def __init__(self, key_name, size):
+        if size < 1:
+            raise ValueError(f"The size of a histogram must be a positive integer, found {size}")
+
+        self._size = size
+        super().__init__(key_name, weighted=True, probabilities=())
+
+    def add(self, key, value, weight):
+        """ Add ``weight`` to the bucket of ``value`` in the histogram of ``key``."""
+        while key >= len(self._statistics):
+            self._statistics.append(None)
+
+        if self._statistics[key] is None:
+            self._statistics[key] = array('d', [0.0]) * (self._size + 1)
+
+        histogram = self._statistics[key]
+        bucket = self._size if value >= self._size else int(value)
+        histogram[bucket] += weight
+        self.count += 1
+
+    def get_state(self):
+        return self.count, [None if histogram is None else array('d', histogram) for histogram in self._statistics]
+
+    def set_state(self, state):
+        self.count, histograms = state
+        self._statistics = [None if histogram is None else array('d', histogram) for histogram in histograms]
+
+    def get_observations(self) -> "Dict[str, array]":
+        """ Return the histograms, one row for each bucket of each key with values.
+
+        :return: The columns of the histograms, keyed by name: the key, ``count`` (the value of the bucket,
+            ``size`` for the overflow bucket), ``weight`` (the total weight in the bucket) and ``fraction``
+            (the share of the bucket in the total weight of the key).
+        """
+        columns = {self._key_name: array('I'), "count": array('Q'), "weight": array('d'), "fraction": array('d')}
+
+        for key, histogram in enumerate(self._statistics):
+            if histogram is not None:
+                total = sum(histogram)
+
+                for bucket, weight in enumerate(histogram):
+                    for column, value in zip(columns.values(),
+                                             (key, bucket, weight, weight / total if total > 0.0 else nan)):
+                        column.append(value)
+
+        return columns
+
+
+@cython.cclass
+class Buckets:
+    """ The buckets of a histogram of real values: ``n`` buckets of equal width (or, with ``logarithmic=True``,
+    of equal ratio of their bounds) between ``low`` and ``high``.
+
+    Bucket 0 counts the values below ``low``; bucket ``n + 1`` counts the values greater than or equal to ``high``.
+
+    :param low: The lower bound of the first regular bucket.
+    :param high: The upper bound of the last regular bucket.
+    :param n: The number of regular buckets.
+    :param logarithmic: Space the bounds of the buckets logarithmically. ``low`` must then be positive.
+    """
+
+    def __init__(self, low, high, n, logarithmic=False):
+        if not low < high:
+            raise ValueError(f"The bounds of the buckets must be increasing, found low={low}, high={high}")
+
+        if n < 1:
+            raise ValueError(f"The number of buckets must be a positive integer, found {n}")
+
+        if logarithmic and low <= 0.0:
+            raise ValueError(f"The lower bound of logarithmic buckets must be positive, found {low}")
+
+        self.low = low
+        self.high = high
+        self.n = n
+        self.logarithmic = logarithmic
+        self._scale = n / (log(high / low) if logarithmic else high - low)
+
+    def bucket_of(self, value) -> int:
+        """ The index of the bucket ``value`` falls into."""
+        if value < self.low:
+            return 0
+
+        if value >= self.high:
+            return self.n + 1
+
+        bucket = 1 + int((log(value / self.low) if self.logarithmic else value - self.low) * self._scale)
+        return bucket if bucket <= self.n else self.n     # Guard against rounding errors near ``high``
+
+    def bounds(self, bucket: int) -> "Tuple[float, float]":
+        """ The lower (inclusive) and the upper (exclusive) bound of ``bucket``."""
+        def edge(i):
+            return self.low * (self.high / self.low) ** (i / self.n) if self.logarithmic \
+                else self.low + (self.high - self.low) * i / self.n
+
+        return (-inf if bucket == 0 else edge(bucket - 1),
+                inf if bucket == self.n + 1 else edge(bucket))
+
+    def __repr__(self):
+        return f"Buckets({self.low!r}, {self.high!r}, {self.n!r}, logarithmic={self.logarithmic!r})"
+
+
+VISIT = 0       # The kind of the histograms of the durations of single visits
+LIFETIME = 1    # The kind of the histograms of the total time a token spent at a place during its life
+
+
+@cython.cclass
+class SojournTimeHistograms(SummaryTable):
+    """ Histograms of the sojourn times of tokens, for each place and token type.
+
+    Two kinds of histograms are kept. The :data:`VISIT` histograms count the duration of each visit of a token
+    at a place. The :data:`LIFETIME` histograms count, for each token, the total time the token spent at a place,
+    when the token is destroyed.
+
+    :param buckets: The buckets of the histograms of all places, or a dictionary with the buckets of
+        the histograms of each place, keyed by the ordinal of the place. No histograms are kept for the places
+        missing from the dictionary.
+    """
+
+    def __init__(self, buckets):
+        self._buckets = buckets if isinstance(buckets, Buckets) else None
+        self._place_buckets = dict() if isinstance(buckets, Buckets) else dict(buckets)
+        super().__init__("place", weighted=True, probabilities=())
+
+    def reset(self):
+        """ Forget all the sojourn times added."""
+        super().reset()
+        self._histograms = dict()
+
+    def add(self, key, value, weight):
+        """ Count a visit of ``value`` duration at the place with ordinal ``key``, of a token of type 0."""
+        self.add_sojourn(VISIT, 0, key, value)
+
+    def add_sojourn(self, kind, token_type, place, duration):
+        """ Count a sojourn time in the histogram of ``kind`` for ``place`` and ``token_type``."""
+        if kind == VISIT:
+            self.count += 1
+
+        buckets = self._place_buckets.get(place, self._buckets)
+
+        if buckets is None:
+            return
+
+        key = (kind, token_type, place)
+
+        if key not in self._histograms:
+            self._histograms[key] = array('Q', [0]) * (buckets.n + 2)
+
+        histogram = self._histograms[key]
+        histogram[buckets.bucket_of(duration)] += 1
+
+    def get_state(self):
+        return self.count, {key: array('Q', histogram) for key, histogram in self._histograms.items()}
+
+    def set_state(self, state):
+        self.count, histograms = state
+        self._histograms = {key: array('Q', histogram) for key, histogram in histograms.items()}
+
+    def get_observations(self) -> "Dict[str, array]":
+        """ Return the histograms, one row for each bucket of each histogram.
+
+        :return: The columns of the histograms, keyed by name: ``kind`` (:data:`VISIT` or :data:`LIFETIME`),
+            ``token_type``, ``place``, ``bucket`` (the index of the bucket), ``lower`` and ``upper`` (the bounds
+            of the bucket) and ``count``.
+        """
+        columns = dict(kind=array('B'), token_type=array('I'), place=array('I'), bucket=array('I'),
+                       lower=array('d'), upper=array('d'), count=array('Q'))
+
+        for (kind, token_type, place), histogram in sorted(self._histograms.items()):
+            buckets = self._place_buckets.get(place, self._buckets)
+
+            for bucket, count in enumerate(histogram):
+                lower, upper = buckets.bounds(bucket)
+
+                for column, value in zip(columns.values(),
+                                         (kind, token_type, place, bucket, lower, upper, count)):
+                    column.append(value)
+
+        return columns
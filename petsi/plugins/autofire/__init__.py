@@ -29,20 +29,23 @@
 
 from dataclasses import dataclass, field
 from functools import cached_property
-from itertools import repeat
-from typing import Callable, Optional, TYPE_CHECKING
+from math import inf
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 
 from ...util import export
 
-from ..._structure import foreach
 from ..interface import AbstractPlugin
-from ._autofire import FireControl, AutoFirePluginTransitionObserver, Clock
+from ._autofire import FireControl, AutoFirePluginTransitionObserver, Clock, Termination
 
 if TYPE_CHECKING:
     from ..interface import NoopPlaceObserver, NoopTokenObserver
     from ..._structure import Transition
 
 export(Clock)
+export(Termination)
+
+# The number of firings between the returns from the firing loop of the fire control to Python
+CHECK_INTERVAL = 10000
 
 
 @export
@@ -59,6 +62,7 @@ class AutoFirePlugin(
     """
 
     _fire_control: FireControl = field(default_factory=FireControl, init=False)
+    _transitions: "Dict[int, Transition]" = field(default_factory=dict, init=False)     # Keyed by ordinal
 
     @cached_property
     def clock(self) -> Clock:
@@ -68,8 +72,59 @@ class AutoFirePlugin(
     def reset(self):
         self._fire_control.reset()
 
+    def get_state(self) -> Any:
+        """ Capture the state of the fire control, see :meth:`FireControl.get_state()
+        <petsi.plugins.autofire._autofire.FireControl.get_state>`."""
+        return self._fire_control.get_state()
+
+    def set_state(self, state: Any):
+        self._fire_control.set_state(state, self._transitions)
+
+    def set_generator(self, generator):
+        """ Use ``generator`` for the random choices among conflicting immediate transitions.
+
+        :param generator: A :class:`numpy.random.Generator` or :class:`random.Random` instance.
+        """
+        self._fire_control.set_generator(generator)
+
+    @property
+    def termination(self) -> Termination:
+        """ The flag checked by :meth:`fire_until_done`.
+
+        The collectors of the observation streams register their need for more observations in it.
+        """
+        return self._fire_control.termination
+
+    def set_profiling(self, is_profiling: bool = True):
+        """ Switch on or off the measurement of the time spent in selecting, sampling and firing transitions.
+
+        The measurements are available via :attr:`firing_times` and are cleared by :meth:`reset`.
+        """
+        self._fire_control.is_profiling = is_profiling
+
+    @property
+    def firing_times(self) -> Dict[str, float]:
+        """ The time (in seconds) spent since the last reset
+
+        - ``selection``: in selecting the transitions to fire,
+        - ``sampling``: in sampling the durations of the timed transitions getting enabled, including
+          the ones getting enabled while firing a transition, and
+        - ``firing``: in firing the selected transitions, i.e. in the flows and the observer callbacks.
+
+        The buckets do not overlap: the sampling done while firing a transition is not counted in ``firing``.
+
+        The times are measured only after :meth:`set_profiling`.
+        """
+        fire_control = self._fire_control
+        return dict(selection=fire_control.selection_time, sampling=fire_control.sampling_time,
+                    firing=fire_control.firing_time)
+
     def fire_while(self, condition: Callable[[], bool]):
-        """ Keep randomly firing transitions while ``condition`` is met or the enabled transitions are exhausted."""
+        """ Keep randomly firing transitions while ``condition`` is met or the enabled transitions are exhausted.
+
+            ``condition`` is called before every firing. Prefer :meth:`fire_until`, :meth:`fire_repeatedly` or
+            :meth:`fire_until_done` where they fit, as they check their conditions without calling back into Python.
+        """
         self._fire_control.start()
 
         while condition():
@@ -80,19 +135,38 @@ class AutoFirePlugin(
 
             Firing will stop earlier if there are no more enabled transitions.
         """
-        read_clock = self.clock.read
-        self.fire_while(lambda: read_clock() < end_time)
+        self._fire(end_time, 0, False)
 
     def fire_repeatedly(self, count_of_firings: int = 0):
-        """ Perform ``count_of_firings`` firings on randomly selected transitions.
+        """ Perform ``count_of_firings`` firings on randomly selected transitions, or fire indefinitely if it is zero.
 
             Firing will stop earlier if there are no more enabled transitions.
         """
+        self._fire(inf, count_of_firings, False)
+
+    def fire_until_done(self, end_time: float = inf):
+        """ Keep randomly firing transitions until the :attr:`termination` flag is raised or the Petri net time
+            reaches or exceeds ``end_time``.
+
+            Firing will stop earlier if there are no more enabled transitions.
+        """
+        self._fire(end_time, 0, True)
+
+    def _fire(self, end_time: float, count_of_firings: int, until_done: bool):
+        # The fire control returns every CHECK_INTERVAL firings, so that e.g. KeyboardInterrupt is handled
         self._fire_control.start()
+        fire_many = self._fire_control.fire_many
+        remaining = count_of_firings
+
+        while True:
+            batch = CHECK_INTERVAL if count_of_firings == 0 else min(remaining, CHECK_INTERVAL)
+
+            if batch <= 0 or fire_many(end_time, batch, until_done) < batch:
+                break
 
-        foreach(lambda _: self._fire_control.fire_next(),
-                repeat(None) if count_of_firings == 0 else repeat(None, count_of_firings))
+            remaining -= batch
 
     def transition_observer_factory(self, t: "Transition") -> Optional[AutoFirePluginTransitionObserver]:
         """ Creates and returns a :class:`petsi._autofire.AutoFirePluginTransitionObserver` """
+        self._transitions[t.ordinal] = t
         return AutoFirePluginTransitionObserver(self, t, self._fire_control)
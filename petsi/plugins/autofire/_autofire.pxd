@@ -1,23 +1,44 @@
 import cython
 from ..._structure cimport Transition, Token, Place
+from ..._distributions cimport Distribution
 from cpython cimport iterator
 
 # from cpython cimport defaultdict
 
 cdef class _PriorityLevel:
     cdef int priority
-    cdef set transitions    #: Set["_structure.Transition"]
-
+    cdef int size
+    cdef int _capacity
+    cdef dict _slot_of              #: Dict["_structure.Transition", int]
+    cdef list _transitions          #: List["_structure.Transition"]
+    cdef signed char[::1] _is_enabled
+    cdef double[::1] _tree
+
+    @cython.locals(slot=cython.int)
     cdef add(self, Transition transition)
 
+    @cython.locals(slot=cython.int)
     cdef remove(self, Transition transition)
 
+    @cython.locals(total_weight=cython.double, threshold=cython.double, node=cython.int, slot=cython.int)
+    cdef Transition select(self, double random_number)
+
+    @cython.locals(node=cython.int)
+    cdef _update(self, int slot, double weight)
+
+    @cython.locals(old_capacity=cython.int, old_is_enabled="signed char[::1]", old_tree="double[::1]", slot=cython.int, node=cython.int)
+    cdef _grow(self)
+
 
 cdef class Clock:
     cdef FireControl _fire_control
     cpdef double read(self) except -999
 
 
+cdef class Termination:
+    cdef public Py_ssize_t pending
+
+
 cdef class FireControl:
     cdef readonly double current_time
     cdef public bint _is_build_in_progress
@@ -28,11 +49,19 @@ cdef class FireControl:
     cdef set _active_priorities                #: Set[int] = cython.declare(set)
     cdef object _priority_levels          # : Dict[int, _PriorityLevel] = cython.declare(defaultdict)
     cdef list _timed_transitions               # : List[Tuple[float, int, "_structure.Transition"]] = cython.declare(list)
+    cdef Distribution _uniform
+    cdef readonly Termination termination
+    cdef public bint is_profiling
+    cdef readonly double selection_time
+    cdef readonly double sampling_time
+    cdef readonly double firing_time
+
+    cdef _clear_profile(self)
 
     cpdef enable_transition(self, Transition transition)
     cpdef disable_transition(self, Transition transition)
 
-    @cython.locals(deadline=cython.double)
+    @cython.locals(deadline=cython.double, start=cython.double)
     cdef _schedule_timed_transition(self, Transition transition)
 
     cdef _remove_timed_transition_from_schedule(self, Transition transition)
@@ -45,9 +74,18 @@ cdef class FireControl:
 
     cdef Transition _next_timed_transition(self)
 
-    @cython.locals(priority_level=_PriorityLevel, new_time=cython.double, weights=list, transition=Transition)
+    @cython.locals(priority_level=_PriorityLevel, new_time=cython.double, transition=Transition)
     cpdef tuple _select_next_transition(self)
 
+    @cython.locals(new_time=cython.double, transition=Transition)
+    cpdef fire_next(self)
+
+    @cython.locals(new_time=cython.double, transition=Transition, start=cython.double, selected=cython.double)
+    cdef _fire_next_profiled(self)
+
+    @cython.locals(firings=cython.longlong)
+    cpdef long long fire_many(self, double end_time, long long count_of_firings, bint until_done) except -1
+
 
 cdef class AutoFirePluginTransitionObserver:
     cdef object _plugin   # Plugins.Plugin
@@ -37,14 +37,17 @@
     ``FireControl`` up-to-date.
 """
 
+from array import array
 from collections import defaultdict
 from heapq import heappush, heappop
 from itertools import count
-from random import choices as random_choices
+from time import perf_counter
 from typing import TYPE_CHECKING, List, Set, Dict, Tuple, Iterator
 
 import cython
 
+from ..._distributions import Distribution, Uniform
+
 if TYPE_CHECKING:
     from petsi import _structure
     from plugins.interface import APlugin
@@ -52,18 +55,137 @@ if TYPE_CHECKING:
 
 @cython.cclass
 class _PriorityLevel:
+    """ The enabled immediate transitions sharing a priority.
+
+    The weights of the transitions are kept in a sum tree (a complete binary tree stored in an array,
+    each internal node holding the sum of its children), so that adding, removing and selecting
+    a transition randomly, with probability proportional to its weight, all take O(log n) time.
+
+    Each transition seen on the level gets a leaf (slot) of the tree when it is first added.
+    The leaf holds the weight of the transition while it is enabled and zero otherwise.
+    """
     priority: int
-    transitions: Set["_structure.Transition"]
+    size: int                   # The number of enabled transitions on the level
+    _capacity: int              # The number of leaves in the tree, a power of 2
+    _slot_of: Dict["_structure.Transition", int]
+    _transitions: List["_structure.Transition"]     # Indexed by slot
+    _is_enabled: array          # Indexed by slot
+    _tree: array                # _tree[1] is the root, the leaves are at _tree[_capacity + slot]
 
     def __init__(self, priority: int):
         self.priority = priority
-        self.transitions = set()
+        self.size = 0
+        self._capacity = 1
+        self._slot_of = dict()
+        self._transitions = list()
+        self._is_enabled = array('b', [0])
+        self._tree = array('d', [0.0, 0.0])
+
+    def add(self, transition):
+        slot = self._slot_of.get(transition, -1)
+
+        if slot < 0:
+            slot = len(self._transitions)
+
+            if slot == self._capacity:
+                self._grow()
+
+            self._slot_of[transition] = slot
+            self._transitions.append(transition)
+
+        if not self._is_enabled[slot]:
+            self._is_enabled[slot] = 1
+            self.size += 1
+            self._update(slot, transition.weight)
+
+    def remove(self, transition):
+        slot = self._slot_of[transition]
+
+        if not self._is_enabled[slot]:
+            raise KeyError(transition)
+
+        self._is_enabled[slot] = 0
+        self.size -= 1
+        self._update(slot, 0.0)
+
+    def select(self, random_number):
+        """ Select an enabled transition with probability proportional to its weight.
+
+        If the total weight of the enabled transitions is zero, the one added first to the level is selected.
+
+        :param random_number: A random number from the interval [0, 1).
+        :return: The selected transition.
+        """
+        total_weight = self._tree[1]
+
+        if total_weight <= 0.0:
+            for slot in range(len(self._transitions)):
+                if self._is_enabled[slot]:
+                    return self._transitions[slot]
+
+        threshold = random_number * total_weight
+        node = 1
+
+        while node < self._capacity:
+            node <<= 1
+            if threshold >= self._tree[node]:
+                threshold -= self._tree[node]
+                node += 1
+
+        return self._transitions[node - self._capacity]
+
+    def _update(self, slot, weight):
+        # Parents are recomputed from their children rather than adjusted by the difference,
+        # so rounding errors do not accumulate in the sums.
+        node = self._capacity + slot
+        self._tree[node] = weight
+
+        while node > 1:
+            node >>= 1
+            self._tree[node] = self._tree[2 * node] + self._tree[2 * node + 1]
+
+    def _grow(self):
+        old_capacity = self._capacity
+        old_is_enabled = self._is_enabled
+        old_tree = self._tree
+        self._capacity = 2 * old_capacity
+        self._is_enabled = array('b', [0] * self._capacity)
+        self._tree = array('d', [0.0] * (2 * self._capacity))
+
+        for slot in range(old_capacity):
+            self._is_enabled[slot] = old_is_enabled[slot]
+            self._tree[self._capacity + slot] = old_tree[old_capacity + slot]
 
-    def add(self, transition: "_structure.Transition"):
-        self.transitions.add(transition)
+        for node in range(self._capacity - 1, 0, -1):
+            self._tree[node] = self._tree[2 * node] + self._tree[2 * node + 1]
 
-    def remove(self, transition: "_structure.Transition"):
-        self.transitions.remove(transition)
+    def get_state(self):
+        """ Capture the ordinals of the transitions in the order of their slots and whether they are enabled."""
+        ordinals = list()
+        is_enabled = list()
+
+        for slot in range(len(self._transitions)):
+            ordinals.append(self._transitions[slot].ordinal)
+            is_enabled.append(bool(self._is_enabled[slot]))
+
+        return ordinals, is_enabled
+
+    def set_state(self, state, transitions):
+        """ Restore the slots and the enabled transitions of a new level, as captured by :meth:`get_state`.
+
+        Adding the transitions in the order of their slots rebuilds the same tree, so the random choices
+        among the transitions are also the same.
+
+        :param transitions: The transitions of the net, keyed by ordinal.
+        """
+        ordinals, is_enabled = state
+
+        for ordinal in ordinals:
+            self.add(transitions[ordinal])
+
+        for slot in range(len(ordinals)):
+            if not is_enabled[slot]:
+                self.remove(transitions[ordinals[slot]])
 
     # These dunder methods cannot be cdef or cpdef (as per cython rules)
     # We need to use the @cython syntax to define their signature.
@@ -123,6 +245,24 @@ class Clock:
         return self._fire_control.current_time
 
 
+class Termination:
+    """ A flag checked by :class:`FireControl` between firings, raised when all the conditions counted in it are met.
+
+    The conditions, e.g. the collectors of the observation streams, keep :attr:`pending` up-to-date themselves:
+    they increment it when they start needing more firings and decrement it when they stop needing them.
+    This way :meth:`FireControl.fire_many` can test for termination without calling back into Python.
+    """
+    pending: int    # The number of conditions not met yet
+
+    def __init__(self):
+        self.pending = 0
+
+    @property
+    def done(self) -> bool:
+        """ ``True`` if all the conditions are met."""
+        return self.pending == 0
+
+
 class FireControl:
     """ Tracks all enabled transitions of the Petri net and selects and fires them according to the firing rules."""
     current_time: float
@@ -131,25 +271,36 @@ class FireControl:
     _deadline_disambiguator: Iterator[int]
     _transition_enabled_at_start_up: Dict["_structure.Transition", bool]
 
-    # A heap of (priority, Transition set) tuples, ordered by negative priority.
+    # A heap of _PriorityLevel objects, ordered by negative priority.
     # This is needed as the head of the heap (in the Python implementation) is
-    # the smallest item. Each set contains the enabled immediate transitions at
-    # that level. Empty sets are removed from the head of the heap.
-    # Below these sets are also called the 'priority_level'.
+    # the smallest item. Each priority level contains the enabled immediate transitions at
+    # that level. Empty levels are removed from the head of the heap.
     _active_priority_levels: List[_PriorityLevel]
 
     # The set of priorities with priority levels present in the _active_priority_levels heap
     _active_priorities: Set[int]
 
-    # The same set of Transitions as above (same set object!), keyed by priority,
-    # allowing random access. The sets are created when the observer for
-    # the first transition at that priority is created
-    # and are never removed from this dict.
+    # The same priority levels as above (same objects!), keyed by priority,
+    # allowing random access. The levels are created when the first transition
+    # at that priority gets enabled and are only removed from this dict by reset().
     _priority_levels: Dict[int, _PriorityLevel]
 
     # A heap of (deadline, Transition) tuples, ordered by deadline
     _timed_transitions: List[Tuple[float, int, "_structure.Transition"]]
 
+    # Random numbers for choosing among the enabled immediate transitions of a priority level
+    _uniform: Distribution
+
+    # Raised when the conditions registered by the observation streams are met
+    termination: Termination
+
+    # With is_profiling set, the time spent in selecting the transitions to fire, in sampling the durations of
+    # the timed transitions and in firing the transitions is accumulated in these attributes (in seconds)
+    is_profiling: bool
+    selection_time: float
+    sampling_time: float
+    firing_time: float
+
     def get_clock(self) -> Clock:
         """ Obtain a Clock instance for reading the simulation time of this ``FireControl`` instance."""
         return Clock(self)
@@ -169,6 +320,17 @@ class FireControl:
 
         self._priority_levels = PriorityLevelDict()
         self._timed_transitions = list()
+        self._uniform = Uniform(0.0, 1.0)
+        self.termination = Termination()
+        self.is_profiling = False
+        self._clear_profile()
+
+    def set_generator(self, generator):
+        """ Use ``generator`` for choosing among the enabled immediate transitions of a priority level.
+
+        :param generator: A :class:`numpy.random.Generator` or :class:`random.Random` instance.
+        """
+        self._uniform = Uniform(0.0, 1.0, generator)
 
     def reset(self):
         # This will cause start() to re-enable the initially enabled transitions
@@ -179,6 +341,12 @@ class FireControl:
         self._active_priorities.clear()
         self._priority_levels.clear()
         self._timed_transitions.clear()
+        self._clear_profile()
+
+    def _clear_profile(self):
+        self.selection_time = 0.0
+        self.sampling_time = 0.0
+        self.firing_time = 0.0
 
     def start(self):
         if self._is_build_in_progress:
@@ -189,6 +357,82 @@ class FireControl:
                 else:
                     "Nothing to do, by default all transitions are treated as disabled."
 
+    def get_state(self) -> "Dict[str, object]":
+        """ Capture the simulation time, the schedule of the timed transitions, the enabled immediate transitions
+        and the state of the random choices among them, for :meth:`set_state`.
+
+        The transitions are identified by their ordinals.
+        """
+        priority_levels = list()
+
+        for priority, priority_level in self._priority_levels.items():
+            priority_levels.append((priority, priority_level.get_state()))
+
+        timed_transitions = list()
+
+        for deadline, _, transition in sorted(self._timed_transitions):
+            timed_transitions.append((deadline, transition.ordinal))
+
+        return dict(current_time=self.current_time,
+                    is_build_in_progress=self._is_build_in_progress,
+                    uniform=self._uniform.get_state(),
+                    timed_transitions=timed_transitions,
+                    priority_levels=priority_levels,
+                    active_priorities=sorted(self._active_priorities))
+
+    def set_state(self, state, transitions):
+        """ Restore the state captured by :meth:`get_state`.
+
+        The fire control must be in build mode, with the marking of the net already restored. Unless the state was
+        captured in build mode too, the fire control leaves build mode with the timed transitions scheduled
+        at their captured deadlines, without sampling their durations again.
+
+        :param transitions: The transitions of the net, keyed by ordinal.
+        :raise ValueError: The fire control is not in build mode, or the transitions enabled by the marking
+                differ from the captured ones.
+        """
+        if not self._is_build_in_progress:
+            raise ValueError("The state of the fire control can only be restored after a reset")
+
+        if not state["is_build_in_progress"]:
+            captured = set()
+
+            for deadline, ordinal in state["timed_transitions"]:
+                captured.add(ordinal)
+
+            for priority, (ordinals, enabled_slots) in state["priority_levels"]:
+                for slot in range(len(ordinals)):
+                    if enabled_slots[slot]:
+                        captured.add(ordinals[slot])
+
+            enabled = set()
+
+            for transition, is_enabled in self._transition_enabled_at_start_up.items():
+                if is_enabled:
+                    enabled.add(transition.ordinal)
+
+            if captured != enabled:
+                raise ValueError("The transitions enabled by the marking differ from the ones in the state")
+
+        self.current_time = state["current_time"]
+        self._uniform.set_state(state["uniform"])
+
+        if state["is_build_in_progress"]:
+            return
+
+        self._is_build_in_progress = False
+
+        for priority, priority_level_state in state["priority_levels"]:
+            priority_level = self._priority_levels[priority]
+            priority_level.set_state(priority_level_state, transitions)
+
+        for priority in state["active_priorities"]:
+            heappush(self._active_priority_levels, self._priority_levels[priority])
+            self._active_priorities.add(priority)
+
+        for deadline, ordinal in state["timed_transitions"]:
+            heappush(self._timed_transitions, (deadline, next(self._deadline_disambiguator), transitions[ordinal]))
+
     def enable_transition(self, transition: "_structure.Transition"):
         if self._is_build_in_progress:
             self._transition_enabled_at_start_up[transition] = True
@@ -202,7 +446,13 @@ class FireControl:
             self._disable_transition(transition)
 
     def _schedule_timed_transition(self, transition: "_structure.Transition"):
-        deadline: float = self.current_time + transition.get_duration()
+        if self.is_profiling:
+            start = perf_counter()
+            deadline: float = self.current_time + transition.get_duration()
+            self.sampling_time += perf_counter() - start
+        else:
+            deadline = self.current_time + transition.get_duration()
+
         heappush(self._timed_transitions, (deadline, next(self._deadline_disambiguator), transition))
 
     def _remove_timed_transition_from_schedule(self, transition: "_structure.Transition"):
@@ -245,18 +495,13 @@ class FireControl:
         # First try to find an enabled immediate transition
         while len(self._active_priority_levels) > 0:
             priority_level = self._active_priority_levels[0]
-            num_transitions = len(priority_level.transitions)
 
-            if num_transitions == 0:
+            if priority_level.size == 0:
                 heappop(self._active_priority_levels)
                 self._active_priorities.remove(priority_level.priority)
                 continue
 
-            weights = list()
-            for transition in priority_level.transitions:
-                weights.append(transition.weight)
-
-            transition = random_choices(list(priority_level.transitions), weights)[0]
+            transition = priority_level.select(self._uniform.sample())
             new_time = self.current_time
 
             # No need to remove the transition from the priority_level.
@@ -275,6 +520,10 @@ class FireControl:
         return new_time, transition
 
     def fire_next(self):
+        if self.is_profiling:
+            self._fire_next_profiled()
+            return
+
         new_time, transition = self._select_next_transition()
         # print(new_time, transition.name)
         self.current_time = new_time
@@ -286,6 +535,44 @@ class FireControl:
             self._remove_timed_transition_from_schedule(transition)
             self._schedule_timed_transition(transition)
 
+    def _fire_next_profiled(self):
+        """ :meth:`fire_next`, accumulating the time spent in selecting and firing the transition.
+
+        The durations sampled while firing are accounted for in :attr:`sampling_time` only.
+        """
+        start = perf_counter()
+        new_time, transition = self._select_next_transition()
+        selected = perf_counter()
+        self.selection_time += selected - start
+        sampling_time = self.sampling_time
+        self.current_time = new_time
+        transition.fire()
+
+        if transition.is_timed and transition.is_enabled:
+            self._remove_timed_transition_from_schedule(transition)
+            self._schedule_timed_transition(transition)
+
+        self.firing_time += perf_counter() - selected - (self.sampling_time - sampling_time)
+
+    def fire_many(self, end_time, count_of_firings, until_done):
+        """ Fire transitions in a tight loop.
+
+        Before each firing the loop stops if ``count_of_firings`` transitions have been fired,
+        the simulation time reached or exceeded ``end_time``, or, with ``until_done``,
+        if the :attr:`termination` flag is raised.
+
+        :raise IndexError: There are no more enabled transitions.
+        :return: The number of transitions fired.
+        """
+        firings = 0
+
+        while firings < count_of_firings and self.current_time < end_time \
+                and not (until_done and self.termination.pending == 0):
+            self.fire_next()
+            firings += 1
+
+        return firings
+
 
 class AutoFirePluginTransitionObserver:
     """ Observes a single ``Transition`` and forwards the enablement events to the shared ``FireControl`` instance."""
@@ -306,6 +593,10 @@ class AutoFirePluginTransitionObserver:
 
     def reset(self): pass
 
+    def get_state(self): pass
+
+    def set_state(self, state): pass
+
     def after_firing(self): pass
 
     def before_firing(self): pass
@@ -15,6 +15,11 @@ class _PriorityLevel:
 
     def remove(self, transition: "_structure.Transition"): pass
 
+    def get_state(self) -> Tuple[List[int], List[bool]]: pass
+
+    def set_state(self, state: Tuple[List[int], List[bool]],
+                  transitions: Dict[int, "_structure.Transition"]): pass
+
     def __eq__(self, other: "_PriorityLevel") -> bool: pass
     def __ne__(self, other: "_PriorityLevel") -> bool: pass
     def __lt__(self, other: "_PriorityLevel") -> bool: pass
@@ -31,8 +36,21 @@ class Clock:
     def read(self) -> float:
         pass
 
+class Termination:
+    pending: int
+
+    def __init__(self): pass
+
+    @property
+    def done(self) -> bool: pass
+
 class FireControl:
     current_time: float
+    termination: Termination
+    is_profiling: bool
+    selection_time: float
+    sampling_time: float
+    firing_time: float
     _is_build_in_progress: bool
 
     _deadline_disambiguator: Iterator[int]
@@ -74,6 +92,13 @@ class FireControl:
         :return: None
         """
 
+    def get_state(self) -> Dict[str, object]:
+        """ Capture the state of the fire control, for :meth:`set_state`."""
+
+    def set_state(self, state: Dict[str, object], transitions: Dict[int, "_structure.Transition"]):
+        """ Restore the state captured by :meth:`get_state`, after the marking of the net is restored in build mode.
+        """
+
     def enable_transition(self, transition: "_structure.Transition"):
         """ Callback method to indicate that a transition got enabled
         :param transition:
@@ -105,6 +130,16 @@ class FireControl:
         :return: None
         """
 
+    def _fire_next_profiled(self): pass
+    def _clear_profile(self): pass
+
+    def fire_many(self, end_time: float, count_of_firings: int, until_done: bool) -> int:
+        """ Fire transitions until ``count_of_firings`` is reached, the time reaches ``end_time``
+            or, with ``until_done``, the termination flag is raised.
+        :raise IndexError   If there is no enabled transition
+        :return: The number of transitions fired
+        """
+
 
 class AutoFirePluginTransitionObserver(interface.NoopTransitionObserver["AutoFirePlugin"]):
 
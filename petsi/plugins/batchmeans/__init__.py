@@ -0,0 +1,206 @@
+""" A plugin estimating steady-state metrics with the method of batch means.
+
+.. rubric:: Public package interface
+
+- Class :class:`BatchMeansPlugin` (see below)
+- Class :class:`Estimate` (see below)
+
+.. rubric:: Internal submodules
+
+.. autosummary::
+    :template: module_reference.rst
+    :recursive:
+    :toctree:
+
+    petsi.plugins.batchmeans._batchmeans
+"""
+from dataclasses import dataclass, field
+from math import inf, nan, sqrt
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from ...util import export
+
+from ..interface import AbstractPlugin
+from ._batchmeans import BatchAccumulator, ThroughputTransitionObserver, SojournTimeTokenObserver
+
+if TYPE_CHECKING:
+    from ..autofire import Clock
+    from ..interface import NoopPlaceObserver
+    from ..._structure import Token, TokenType, Transition
+
+MEAN_SOJOURN_TIME = "mean_sojourn_time"
+THROUGHPUT = "throughput"
+
+
+def student_t_quantile(probability: float, degrees_of_freedom: int) -> float:
+    """ Approximate the ``probability`` quantile of Student's t distribution with the Cornish-Fisher expansion.
+
+    The error is below 0.5% for the 0.975 quantile with 5 or more degrees of freedom.
+    """
+    z = NormalDist().inv_cdf(probability)
+    n = degrees_of_freedom
+    return z + (z ** 3 + z) / (4 * n) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * n ** 2) \
+        + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * n ** 3)
+
+
+@export
+@dataclass(frozen=True)
+class Estimate:
+    """ The estimate of a metric with its confidence interval."""
+    mean: float         #: The point estimate, i.e. the mean of the batch means
+    half_width: float   #: The half width of the confidence interval around the mean
+    batches: int        #: The number of batches the estimate is based on
+
+    @property
+    def relative_half_width(self) -> float:
+        """ The half width of the confidence interval relative to the mean."""
+        return self.half_width / abs(self.mean) if self.mean != 0.0 else inf
+
+
+@export
+@dataclass(eq=False)
+class BatchMeansPlugin(
+        AbstractPlugin["NoopPlaceObserver", "ThroughputTransitionObserver", "SojournTimeTokenObserver"]):
+    """ A PetSi plugin estimating the mean sojourn times at places and the throughputs of transitions,
+    with confidence intervals, by the method of batch means.
+
+    The simulated time is divided into batches, closed by :meth:`close_batch`. A metric is estimated
+    from its values in the batches, which are treated as independent observations:
+
+    - the mean sojourn time of the tokens leaving a place during the batch and
+    - the number of the firings of a transition during the batch per unit of time.
+
+    Whenever the number of batches reaches twice ``_batches``, neighbouring batches are merged pairwise and
+    the length of the subsequent batches is doubled. Longer batches are less correlated, so the batches become
+    closer to independent as the simulation proceeds, while their number stays between ``_batches`` and
+    twice that.
+    """
+    _clock: "Clock"
+    _sojourn_time_places: Dict[str, int]        # The ordinals of the places of the sojourn time metrics, by name
+    _throughput_transitions: Dict[str, int]     # The ordinals of the transitions of the throughput metrics, by name
+    _batches: int = 20                          # The minimum number of batches for an estimate
+    batch_length: float = 1.0                   # The length of the batches in simulated time
+
+    _accumulator: BatchAccumulator = field(init=False)
+    _metric_of_place: Dict[int, int] = field(init=False)
+    _metric_of_transition: Dict[int, int] = field(init=False)
+    _sums: List[List[float]] = field(init=False)        # The sums of the observations of the metrics, by batch
+    _counts: List[List[float]] = field(init=False)      # The numbers of the observations of the metrics, by batch
+    _durations: List[float] = field(init=False)         # The durations of the batches
+    _initial_batch_length: float = field(init=False)
+
+    def __post_init__(self):
+        if self._batches < 2:
+            raise ValueError(f"The number of batches must be at least 2, found {self._batches}")
+
+        if self.batch_length <= 0.0:
+            raise ValueError(f"The batch length must be positive, found {self.batch_length}")
+
+        n = len(self._sojourn_time_places)
+        self._metric_of_place = {ordinal: metric for metric, ordinal in enumerate(self._sojourn_time_places.values())}
+        self._metric_of_transition = {ordinal: n + metric
+                                      for metric, ordinal in enumerate(self._throughput_transitions.values())}
+        self._accumulator = BatchAccumulator(n + len(self._throughput_transitions))
+        self._initial_batch_length = self.batch_length
+        self._clear_batches()
+
+    def _clear_batches(self):
+        self._sums = list()
+        self._counts = list()
+        self._durations = list()
+        self.batch_length = self._initial_batch_length
+
+    def observes_tokens_of(self, typ: "TokenType") -> bool:
+        return len(self._metric_of_place) > 0
+
+    def token_observer_factory(self, t: "Token") -> Optional[SojournTimeTokenObserver]:
+        return SojournTimeTokenObserver(self, t, self._clock, self._accumulator, self._metric_of_place) \
+            if self._metric_of_place else None
+
+    def transition_observer_factory(self, t: "Transition") -> Optional[ThroughputTransitionObserver]:
+        metric = self._metric_of_transition.get(t.ordinal)
+        return ThroughputTransitionObserver(self, t, self._accumulator, metric) if metric is not None else None
+
+    def reset(self):
+        super().reset()
+        self.restart()
+
+    def restart(self):
+        """ Drop the batches closed and the observations of the current batch, keeping the marking related state
+        of the observers."""
+        self._accumulator.reset()
+        self._clear_batches()
+
+    def get_state(self) -> Any:
+        # The batches closed are never modified in place, so copying the lists of them is enough
+        return dict(super().get_state(), accumulator=self._accumulator.get_state(),
+                    batches=(list(self._sums), list(self._counts), list(self._durations)),
+                    batch_length=self.batch_length)
+
+    def set_state(self, state: Any):
+        super().set_state(state)
+        self._accumulator.set_state(state["accumulator"])
+        sums, counts, durations = state["batches"]
+        self._sums = list(sums)
+        self._counts = list(counts)
+        self._durations = list(durations)
+        self.batch_length = state["batch_length"]
+
+    def close_batch(self, duration: float):
+        """ Close the current batch and start a new one.
+
+        :param duration: The simulated time elapsed since the start of the batch.
+        """
+        sums, counts = self._accumulator.close_batch()
+        self._sums.append(sums)
+        self._counts.append(counts)
+        self._durations.append(duration)
+
+        if len(self._durations) >= 2 * self._batches:
+            self._sums = [[a + b for a, b in zip(first, second)]
+                          for first, second in zip(self._sums[0::2], self._sums[1::2])]
+            self._counts = [[a + b for a, b in zip(first, second)]
+                            for first, second in zip(self._counts[0::2], self._counts[1::2])]
+            self._durations = [first + second for first, second in zip(self._durations[0::2], self._durations[1::2])]
+            self.batch_length *= 2
+
+    def estimates(self, confidence: float = 0.95) -> Dict[str, Dict[str, Estimate]]:
+        """ Estimate the metrics from the batches closed so far.
+
+        :param confidence: The confidence level of the intervals.
+        :return: The estimates keyed by the kind of the metric (``mean_sojourn_time`` or ``throughput``) and
+            the name of the place or transition. The estimates are ``nan`` with fewer than two batches, or
+            if a place had no departures in some batch.
+        """
+        names = list(self._sojourn_time_places) + list(self._throughput_transitions)
+        n = len(self._sojourn_time_places)
+        k = len(self._durations)
+        estimates: Dict[str, Dict[str, Estimate]] = {MEAN_SOJOURN_TIME: dict(), THROUGHPUT: dict()}
+
+        for metric, name in enumerate(names):
+            if metric < n:
+                values = [sums[metric] / counts[metric] if counts[metric] > 0 else nan
+                          for sums, counts in zip(self._sums, self._counts)]
+            else:
+                values = [counts[metric] / duration if duration > 0 else nan
+                          for counts, duration in zip(self._counts, self._durations)]
+
+            if k < 2:
+                estimate = Estimate(nan, nan, k)
+            else:
+                mean = sum(values) / k
+                variance = sum((value - mean) ** 2 for value in values) / (k - 1)
+                half_width = student_t_quantile((1 + confidence) / 2, k - 1) * sqrt(variance / k)
+                estimate = Estimate(mean, half_width, k)
+
+            estimates[MEAN_SOJOURN_TIME if metric < n else THROUGHPUT][name] = estimate
+
+        return estimates
+
+    def is_precise(self, relative_half_width: float, confidence: float = 0.95) -> bool:
+        """ Tell if there are at least ``_batches`` batches and the relative half width of the confidence interval
+        of every metric is at most ``relative_half_width``."""
+        return len(self._durations) >= self._batches and \
+            all(estimate.relative_half_width <= relative_half_width
+                for estimates in self.estimates(confidence).values() for estimate in estimates.values())
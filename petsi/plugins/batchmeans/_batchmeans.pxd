@@ -0,0 +1,41 @@
+from ..._structure cimport Token, Place, Transition
+from ..autofire._autofire cimport Clock
+import cython
+
+
+cdef class BatchAccumulator:
+    cdef readonly Py_ssize_t size
+    cdef double[::1] _sums
+    cdef double[::1] _counts
+
+    cdef add(self, Py_ssize_t metric, double value)
+
+
+cdef class ThroughputTransitionObserver:
+    cdef object _plugin   # BatchMeansPlugin
+    cdef Transition _transition
+    cdef BatchAccumulator _accumulator
+    cdef Py_ssize_t _metric
+
+    cpdef got_enabled(self, )
+    cpdef got_disabled(self, )
+    cpdef before_firing(self)
+    cpdef after_firing(self, )
+    cpdef reset(self)
+
+
+cdef class SojournTimeTokenObserver:
+    cdef object _plugin   # BatchMeansPlugin
+    cdef Token _token
+    cdef Clock _clock
+    cdef BatchAccumulator _accumulator
+    cdef dict _metric_of_place
+    cdef double _arrival_time
+    cdef object __weakref__         # Plugins keep weak references to their token observers
+
+    cpdef report_construction(self)
+    cpdef report_destruction(self)
+    cpdef report_arrival_at(self, Place p)
+
+    @cython.locals(metric=Py_ssize_t)
+    cpdef report_departure_from(self, Place p)
@@ -0,0 +1,120 @@
+""" The observers of the batch means plugin, accumulating the observations of the current batch.
+"""
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Tuple
+
+    # Need to rename Clock, otherwise it collides with the cimported Clock in the .pxd file!
+    from ..autofire import Clock as TClock
+
+    # Same trick for Token, Place and Transition
+    from ..._structure import Token as TToken, Place as TPlace, Transition as TTransition
+
+    from ..interface import APlugin
+
+
+class BatchAccumulator:
+    """ The sum and the number of the observations of each metric in the current batch."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._sums = array('d', [0.0]) * size
+        self._counts = array('d', [0.0]) * size
+
+    def add(self, metric, value):
+        """ Add an observation of ``value`` to ``metric``."""
+        self._sums[metric] += value
+        self._counts[metric] += 1.0
+
+    def close_batch(self) -> "Tuple[List[float], List[float]]":
+        """ Start a new batch.
+
+        :return: The sums and the numbers of the observations of the metrics in the batch closed.
+        """
+        sums = [self._sums[metric] for metric in range(self.size)]
+        counts = [self._counts[metric] for metric in range(self.size)]
+        self.reset()
+        return sums, counts
+
+    def get_state(self) -> "Tuple[List[float], List[float]]":
+        """ Capture the sums and the numbers of the observations in the current batch, for :meth:`set_state`."""
+        return [self._sums[metric] for metric in range(self.size)], \
+            [self._counts[metric] for metric in range(self.size)]
+
+    def set_state(self, state):
+        """ Restore the observations of the current batch, as captured by :meth:`get_state`."""
+        sums, counts = state
+
+        for metric in range(self.size):
+            self._sums[metric] = sums[metric]
+            self._counts[metric] = counts[metric]
+
+    def reset(self):
+        """ Drop the observations of the current batch."""
+        for metric in range(self.size):
+            self._sums[metric] = 0.0
+            self._counts[metric] = 0.0
+
+
+class ThroughputTransitionObserver:
+    """ Count the firings of a transition."""
+
+    def __init__(self, _plugin: "APlugin", _transition: "TTransition", _accumulator: BatchAccumulator, _metric: int):
+        self._plugin = _plugin
+        self._transition = _transition
+        self._accumulator = _accumulator
+        self._metric = _metric
+
+    def got_enabled(self, ): pass   # No actual base class, so need to provide an implementation
+
+    def got_disabled(self, ): pass  # No actual base class, so need to provide an implementation
+
+    def before_firing(self): pass   # No actual base class, so need to provide an implementation
+
+    def after_firing(self, ):
+        self._accumulator.add(self._metric, 1.0)
+
+    def reset(self): pass
+
+    def get_state(self): pass
+
+    def set_state(self, state): pass
+
+
+class SojournTimeTokenObserver:
+    """ Measure the sojourn times of a token at the places of the sojourn time metrics."""
+
+    def __init__(self, _plugin: "APlugin", _token: "TToken", _clock: "TClock", _accumulator: BatchAccumulator,
+                 _metric_of_place):
+        self._plugin = _plugin
+        self._token = _token
+        self._clock = _clock
+        self._accumulator = _accumulator
+        self._metric_of_place = _metric_of_place   # Dict[int, int], the metric index of each place by ordinal
+        self._arrival_time = 0.0
+
+    def reset(self):
+        """ Do nothing, the observer goes away with its token."""
+
+    def get_state(self):
+        return self._arrival_time
+
+    def set_state(self, state):
+        self._arrival_time = state
+
+    def report_construction(self):
+        """ Do nothing """
+
+    def report_destruction(self):
+        """ Do nothing """
+
+    def report_arrival_at(self, _: "TPlace"):
+        self._arrival_time = self._clock.read()
+
+    def report_departure_from(self, p: "TPlace"):
+        metric = self._metric_of_place.get(p.ordinal, -1)
+
+        if metric >= 0:
+            self._accumulator.add(metric, self._clock.read() - self._arrival_time)
@@ -13,12 +13,13 @@
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from weakref import WeakSet
 
-from typing import TYPE_CHECKING, Dict, Set, Optional, TypeVar, Generic
+from typing import TYPE_CHECKING, Any, Dict, MutableSet, Optional, TypeVar, Generic
 
 if TYPE_CHECKING:
     # noinspection PyUnresolvedReferences
-    from ..._structure import Place, Transition, Token
+    from ..._structure import Place, Transition, Token, TokenType
 
 
 APlaceObserver = TypeVar("APlaceObserver", bound="AbstractPlaceObserver")
@@ -49,6 +50,15 @@ class AbstractPlaceObserver(ABC, Generic[APlugin]):
         When this method is invoked, all marking related state must be removed from the observer.
         """
 
+    def get_state(self) -> Any:
+        """ Capture the marking related state of the observer, for :meth:`set_state`.
+
+        The state must be picklable. The default implementation returns ``None``.
+        """
+
+    def set_state(self, state: Any):
+        """ Restore the marking related state of the observer, as captured by :meth:`get_state`."""
+
     @abstractmethod
     def report_arrival_of(self, token):
         """ Report the arrival of a token at the observed place.
@@ -86,6 +96,15 @@ class AbstractTransitionObserver(ABC, Generic[APlugin]):
         When this method is invoked, all marking related state must be removed from the observer.
         """
 
+    def get_state(self) -> Any:
+        """ Capture the marking related state of the observer, for :meth:`set_state`.
+
+        The state must be picklable. The default implementation returns ``None``.
+        """
+
+    def set_state(self, state: Any):
+        """ Restore the marking related state of the observer, as captured by :meth:`get_state`."""
+
     @abstractmethod
     def before_firing(self, ):
         """ A callback to notify about the start of the firing process.
@@ -119,6 +138,9 @@ class AbstractTokenObserver(ABC, Generic[APlugin]):
     Token observers accumulate observation state related to a token.
     They get notifications related to the observed token.
 
+    A token observer is referenced by its token and lives as long as the token is alive.
+    The plugin keeps weak references to its token observers only, hence they must be weak-referenceable.
+
     :param _plugin: The plugin this observer belongs to.
     :type _plugin: :class:`Plugins.AbstractPlugin`
     :param _token: The token observed by this observer.
@@ -134,6 +156,16 @@ class AbstractTokenObserver(ABC, Generic[APlugin]):
         When this method is invoked, all marking related state must be removed from the observer.
         """
 
+    def get_state(self) -> Any:
+        """ Capture the state of the observer, for :meth:`set_state`.
+
+        The state must be picklable. It is captured and restored together with the token, see
+        :meth:`Token.get_state() <petsi._structure.Token.get_state>`. The default implementation returns ``None``.
+        """
+
+    def set_state(self, state: Any):
+        """ Restore the state of the observer, as captured by :meth:`get_state`."""
+
     @abstractmethod
     def report_construction(self, ):
         """ Report the construction of the token.
@@ -173,7 +205,10 @@ class AbstractPlugin(ABC, Generic[APlaceObserver, ATransitionObserver, ATokenObs
 
     _place_observers: Dict[str, APlaceObserver] = field(default_factory=dict, init=False)
     _transition_observers: Dict[str, ATransitionObserver] = field(default_factory=dict, init=False)
-    _token_observers: Set[ATokenObserver] = field(default_factory=set, init=False)
+    # Token observers are referenced by their tokens only, and the tokens drop them when destroyed.
+    # Keeping weak references here lets the observers of destroyed tokens go away immediately,
+    # so the size of the registry follows the number of live tokens.
+    _token_observers: MutableSet[ATokenObserver] = field(default_factory=WeakSet, init=False)
 
     # In derived classes of AbstractPlugin one may override these factory methods
     # to return instances of classes inheriting from
@@ -217,13 +252,25 @@ class AbstractPlugin(ABC, Generic[APlaceObserver, ATransitionObserver, ATokenObs
         :return: A token observer or ``None``
         """
 
+    def observes_tokens_of(self, typ: "TokenType") -> bool:
+        """ Tell if the plugin may want to observe tokens of the given type.
+
+        `PetSi` uses this method to decide whether the tokens of the type need an identity at all.
+        The default implementation returns ``True`` if :meth:`token_observer_factory` is overridden.
+        Override this method if the plugin observes tokens of selected types only.
+
+        :param typ: The :class:`~petsi._structure.TokenType` in question.
+        :return: ``False`` if :meth:`token_observer_factory` never returns an observer for tokens of ``typ``.
+        """
+        return type(self).token_observer_factory is not AbstractPlugin.token_observer_factory
+
     def reset(self):
         # """ Reset the marking-related state of the plugin.
         #
         # Removes all data collected during the previous simulation
         # by cascading the call to the observers of the plugin.
         # """
-        for token_observer in self._token_observers:
+        for token_observer in list(self._token_observers):
             token_observer.reset()
         self._token_observers.clear()
 
@@ -233,6 +280,29 @@ class AbstractPlugin(ABC, Generic[APlaceObserver, ATransitionObserver, ATokenObs
         for transition_observer in self._transition_observers.values():
             transition_observer.reset()
 
+    def get_state(self) -> Any:
+        """ Capture the marking related state of the plugin, for :meth:`set_state`.
+
+        The default implementation captures the state of the place and transition observers. The state of the
+        token observers is captured with their tokens. Plugins with state of their own extend this method
+        and :meth:`set_state`. The state must be picklable.
+        """
+        return dict(places={name: observer.get_state() for name, observer in self._place_observers.items()},
+                    transitions={name: observer.get_state()
+                                 for name, observer in self._transition_observers.items()})
+
+    def set_state(self, state: Any):
+        """ Restore the marking related state of the plugin, as captured by :meth:`get_state`.
+
+        `PetSi` invokes this method after restoring the marking of the net, so the state restored overrides
+        the effects of putting the tokens back into the places.
+        """
+        for name, observer_state in state["places"].items():
+            self._place_observers[name].set_state(observer_state)
+
+        for name, observer_state in state["transitions"].items():
+            self._transition_observers[name].set_state(observer_state)
+
     def observe_place(self, p: "Place") -> Optional[AbstractPlaceObserver]:
         o = self.place_observer_factory(p)
 
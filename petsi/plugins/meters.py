@@ -7,12 +7,12 @@ from typing import Generic, TypeVar, TYPE_CHECKING
 
 from ..util import export
 
-from ._meters import GenericCollector
+from ._meters import GenericCollector, DEFAULT_CHUNK_SIZE, DEFAULT_WARM_UP_CHECK, DEFAULT_MAX_WARM_UP_CHECK
 from .interface import APlaceObserver, ATransitionObserver, ATokenObserver, AbstractPlugin
 
 if TYPE_CHECKING:
-    from .autofire import Clock
-    from typing import Optional, FrozenSet, Dict, Callable
+    from .autofire import Clock, Termination
+    from typing import Any, Optional, FrozenSet, Dict, Callable
 
 ACollector = TypeVar("ACollector", bound=GenericCollector)
 
@@ -28,9 +28,30 @@ class MeterPlugin(Generic[ACollector, APlaceObserver, ATransitionObserver, AToke
     _token_types: "Optional[FrozenSet[int]]"      # Observe these token types only
     _transitions: "Optional[FrozenSet[int]]"      # Observe these transitions only
     _clock: "Clock"
+    _summary: bool = False                        # Summarize the observations instead of collecting the rows
 
     _collector: ACollector = field(init=False)
 
+    def reset(self):
+        super().reset()
+        # Removing the tokens of the previous run from the net may have produced observations
+        self.restart()
+
+    def restart(self):
+        """ Drop the observations collected so far and start over, e.g. with a new warm-up period detection,
+        keeping the marking related state of the observers.
+
+        See :meth:`GenericCollector.restart() <petsi.plugins._meters.GenericCollector.restart>`.
+        """
+        self._collector.restart()
+
+    def get_state(self) -> "Any":
+        return dict(super().get_state(), collector=self._collector.get_state())
+
+    def set_state(self, state: "Any"):
+        super().set_state(state)
+        self._collector.set_state(state["collector"])
+
     def get_observations(self) -> "Dict[str, array]":
         """ Retrieve the collected observations.
 
@@ -40,6 +61,32 @@ class MeterPlugin(Generic[ACollector, APlaceObserver, ATransitionObserver, AToke
         """
         return self._collector.get_observations()
 
+    def set_sink(self, sink: "Optional[Callable[[Dict[str, array]], None]]", chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """ Hand over the observations to ``sink`` in chunks, instead of keeping them in memory.
+
+        See :meth:`GenericCollector.set_sink() <petsi.plugins._meters.GenericCollector.set_sink>`.
+        """
+        self._collector.set_sink(sink, chunk_size)
+
+    def set_termination(self, termination: "Optional[Termination]"):
+        """ Count the need for more observations in ``termination``.
+
+        See :meth:`GenericCollector.set_termination() <petsi.plugins._meters.GenericCollector.set_termination>`.
+        """
+        self._collector.set_termination(termination)
+
+    def detect_warm_up(self, first_check: int = DEFAULT_WARM_UP_CHECK, max_check: int = DEFAULT_MAX_WARM_UP_CHECK):
+        """ Drop the observations of the warm-up period of each simulation.
+
+        See :meth:`GenericCollector.detect_warm_up() <petsi.plugins._meters.GenericCollector.detect_warm_up>`.
+        """
+        self._collector.detect_warm_up(first_check, max_check)
+
+    @property
+    def truncated_observations(self) -> int:
+        """ The number of observations dropped as part of the warm-up period of the current simulation."""
+        return self._collector.truncated_observations
+
     def get_need_more_observations(self) -> "Callable[[], bool]":
         """ :return: a callable for polling if :meth:`get_observations` should be called."""
         return self._collector.need_more_observations
@@ -52,5 +99,7 @@ class MeterPlugin(Generic[ACollector, APlaceObserver, ATransitionObserver, AToke
     @required_observations.setter
     def required_observations(self, required_observations: int):
         self._collector.required_observations = required_observations
+        # Re-evaluate the need for more observations with the new requirement
+        self._collector.set_termination(self._collector.termination)
 
 
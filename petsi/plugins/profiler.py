@@ -0,0 +1,243 @@
+""" A plugin showing which transitions and plugins make a simulation slow.
+
+The Cython extension modules of PetSi are built without profiling support, so :mod:`cProfile` cannot look into them.
+The :class:`ProfilerPlugin` measures the figures that matter for the speed of a model instead:
+
+- the number of firings, enablements and disablements of each transition,
+- the number of calls to, and the time spent in, each callback of the observers of the profiled plugins and
+- the time spent by the fire control in selecting the transitions, in sampling the durations of the timed transitions
+  and in firing the transitions.
+
+The plugins to profile must be wrapped with :meth:`ProfilerPlugin.profiled` and the wrappers registered with the net
+in their place. The time measurements themselves slow the simulation down, so the times are meaningful relative to
+each other only.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from time import perf_counter
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from ..util import export
+
+from .interface import AbstractPlugin, NoopTransitionObserver
+
+if TYPE_CHECKING:
+    from .autofire import AutoFirePlugin
+    from .interface import NoopPlaceObserver, NoopTokenObserver
+    from .._structure import Place, Token, TokenType, Transition
+
+
+@export
+@dataclass
+class TransitionProfile:
+    """ The firings and the enablement churn of a transition."""
+    firings: int = 0        #: The number of firings
+    enablements: int = 0    #: The number of times the transition got enabled
+    disablements: int = 0   #: The number of times the transition got disabled
+
+
+@export
+@dataclass
+class CallbackProfile:
+    """ The calls to an observer callback of a plugin."""
+    calls: int = 0          #: The number of calls
+    seconds: float = 0.0    #: The total time spent in the calls
+
+
+@export
+@dataclass(frozen=True)
+class Profile:
+    """ The figures collected by a :class:`ProfilerPlugin` since the last reset."""
+    transitions: Dict[str, TransitionProfile]           #: The profile of each transition, by name
+    callbacks: Dict[str, Dict[str, CallbackProfile]]    #: The profile of each callback, by plugin and callback name
+    firing_times: Dict[str, float]  #: See :attr:`AutoFirePlugin.firing_times <.autofire.AutoFirePlugin.firing_times>`
+
+    def __str__(self) -> str:
+        lines = ["Fire control: " + ", ".join(f"{name} {seconds:.6f} s" for name, seconds in self.firing_times.items()),
+                 "",
+                 f"{'Plugin':30} {'Callback':24} {'Calls':>12} {'Seconds':>12}"]
+        lines.extend(f"{plugin:30} {callback:24} {profile.calls:12} {profile.seconds:12.6f}"
+                     for plugin, callback, profile in sorted(
+                         ((plugin, callback, profile)
+                          for plugin, callbacks in self.callbacks.items() for callback, profile in callbacks.items()),
+                         key=lambda row: row[2].seconds, reverse=True))
+        lines.extend(["", f"{'Transition':30} {'Firings':>12} {'Enablements':>12} {'Disablements':>12}"])
+        lines.extend(f"{name:30} {profile.firings:12} {profile.enablements:12} {profile.disablements:12}"
+                     for name, profile in sorted(self.transitions.items(),
+                                                 key=lambda item: item[1].firings, reverse=True))
+        return "\n".join(lines)
+
+
+class TimedObserver:
+    """ Stands in for a place, transition or token observer, measuring the time spent in its callbacks.
+
+    The callbacks are forwarded to the observer. Calls to ``reset`` are not measured.
+    """
+    __slots__ = ("_observer", "_callbacks", "__weakref__")
+
+    def __init__(self, observer, callbacks: Dict[str, CallbackProfile]):
+        self._observer = observer
+        self._callbacks = callbacks
+
+    def _record(self, callback: str, start: float):
+        profile = self._callbacks[callback]
+        profile.seconds += perf_counter() - start
+        profile.calls += 1
+
+    def reset(self):
+        self._observer.reset()
+
+    def get_state(self):
+        return self._observer.get_state()
+
+    def set_state(self, state):
+        self._observer.set_state(state)
+
+    def report_arrival_of(self, token):
+        start = perf_counter()
+        self._observer.report_arrival_of(token)
+        self._record("report_arrival_of", start)
+
+    def report_departure_of(self, token):
+        start = perf_counter()
+        self._observer.report_departure_of(token)
+        self._record("report_departure_of", start)
+
+    def before_firing(self):
+        start = perf_counter()
+        self._observer.before_firing()
+        self._record("before_firing", start)
+
+    def after_firing(self):
+        start = perf_counter()
+        self._observer.after_firing()
+        self._record("after_firing", start)
+
+    def got_enabled(self):
+        start = perf_counter()
+        self._observer.got_enabled()
+        self._record("got_enabled", start)
+
+    def got_disabled(self):
+        start = perf_counter()
+        self._observer.got_disabled()
+        self._record("got_disabled", start)
+
+    def report_construction(self):
+        start = perf_counter()
+        self._observer.report_construction()
+        self._record("report_construction", start)
+
+    def report_destruction(self):
+        start = perf_counter()
+        self._observer.report_destruction()
+        self._record("report_destruction", start)
+
+    def report_arrival_at(self, p: "Place"):
+        start = perf_counter()
+        self._observer.report_arrival_at(p)
+        self._record("report_arrival_at", start)
+
+    def report_departure_from(self, p: "Place"):
+        start = perf_counter()
+        self._observer.report_departure_from(p)
+        self._record("report_departure_from", start)
+
+
+class ProfiledPlugin:
+    """ Stands in for a plugin in the net, wrapping the observers created by the plugin in :class:`TimedObserver`
+    instances.
+
+    The plugin keeps managing its observers; resetting the stand-in resets the plugin and clears the measurements.
+    """
+
+    def __init__(self, plugin: AbstractPlugin):
+        self.plugin = plugin
+        self.callbacks: Dict[str, CallbackProfile] = defaultdict(CallbackProfile)
+
+    @property
+    def name(self) -> str:
+        return self.plugin.name
+
+    def observes_tokens_of(self, typ: "TokenType") -> bool:
+        return self.plugin.observes_tokens_of(typ)
+
+    def reset(self):
+        self.plugin.reset()
+        self.callbacks.clear()
+
+    def get_state(self) -> Any:
+        return self.plugin.get_state()
+
+    def set_state(self, state: Any):
+        self.plugin.set_state(state)
+
+    def observe_place(self, p: "Place") -> Optional[TimedObserver]:
+        return self._timed(self.plugin.observe_place(p))
+
+    def observe_token(self, t: "Token") -> Optional[TimedObserver]:
+        return self._timed(self.plugin.observe_token(t))
+
+    def observe_transition(self, t: "Transition") -> Optional[TimedObserver]:
+        return self._timed(self.plugin.observe_transition(t))
+
+    def _timed(self, observer) -> Optional[TimedObserver]:
+        return None if observer is None else TimedObserver(observer, self.callbacks)
+
+
+@dataclass(eq=False)
+class ProfilerTransitionObserver(NoopTransitionObserver["ProfilerPlugin"]):
+    """ Counts the firings, enablements and disablements of a transition."""
+    _profile: TransitionProfile = field(default_factory=TransitionProfile)
+
+    def reset(self):
+        self._profile.firings = self._profile.enablements = self._profile.disablements = 0
+
+    def after_firing(self):
+        self._profile.firings += 1
+
+    def got_enabled(self):
+        self._profile.enablements += 1
+
+    def got_disabled(self):
+        self._profile.disablements += 1
+
+
+@export
+@dataclass(eq=False)
+class ProfilerPlugin(AbstractPlugin["NoopPlaceObserver", ProfilerTransitionObserver, "NoopTokenObserver"]):
+    """ A PetSi plugin profiling the transitions of the net, the plugins wrapped with :meth:`profiled` and
+    the fire control of ``_auto_fire``.
+
+    The profiler should be registered with the net before the profiled plugins, so that it sees the transitions
+    in the same state as they do.
+    """
+    _auto_fire: "Optional[AutoFirePlugin]" = None     # Measure the time spent in the fire control of this plugin
+
+    _profiled_plugins: List[ProfiledPlugin] = field(default_factory=list, init=False)
+    _transition_profiles: Dict[str, TransitionProfile] = field(default_factory=dict, init=False)
+
+    def __post_init__(self):
+        if self._auto_fire is not None:
+            self._auto_fire.set_profiling()
+
+    def profiled(self, plugin: AbstractPlugin) -> ProfiledPlugin:
+        """ Wrap ``plugin`` for measuring the time spent in the callbacks of its observers.
+
+        :return: The wrapper to register with the net instead of ``plugin``.
+        """
+        profiled_plugin = ProfiledPlugin(plugin)
+        self._profiled_plugins.append(profiled_plugin)
+        return profiled_plugin
+
+    def transition_observer_factory(self, t: "Transition") -> ProfilerTransitionObserver:
+        profile = self._transition_profiles.setdefault(t.name, TransitionProfile())
+        return ProfilerTransitionObserver(self, t, profile)
+
+    def profile(self) -> Profile:
+        """ Take a snapshot of the figures collected since the last reset."""
+        return Profile({name: replace(profile) for name, profile in self._transition_profiles.items()},
+                       {profiled_plugin.name: {callback: replace(profile)
+                                               for callback, profile in profiled_plugin.callbacks.items()}
+                        for profiled_plugin in self._profiled_plugins},
+                       dict() if self._auto_fire is None else self._auto_fire.firing_times)
@@ -21,11 +21,14 @@ from typing import Iterator, Optional, TYPE_CHECKING
 from ...util import export
 
 from ..meters import MeterPlugin
+from .._summary import SummaryTable, SojournTimeHistograms
 from ._sojourntime import SojournTimeCollector, SojournTimePluginTokenObserver
 
 if TYPE_CHECKING:
     from ..interface import NoopPlaceObserver, NoopTransitionObserver
-    from ..._structure import Token
+    from typing import Any, Dict, Union
+    from .._summary import Buckets
+    from ..._structure import Token, TokenType
 
 
 @export
@@ -45,12 +48,37 @@ class SojournTimePlugin(
 
         On the overall histograms one increment represents all the visits of a token at a given place.
         The bucket is selected based on the cumulative time the token spent at the place during its whole life.
+
+        The histograms are kept if ``_buckets`` is set, see :class:`~petsi.plugins._summary.SojournTimeHistograms`.
+        Otherwise the plugin collects the individual visits, or their summary statistics if ``_summary`` is set.
     """
+    # The buckets of the histograms of all places, or of each place by ordinal
+    _buckets: "Union[None, Buckets, Dict[int, Buckets]]" = None
 
     token_id: Iterator[int] = field(default_factory=count, init=False)
 
     def __post_init__(self):
-        self._collector = SojournTimeCollector(self._n)
+        if self._buckets is not None:
+            summary = SojournTimeHistograms(self._buckets)
+        elif self._summary:
+            summary = SummaryTable("place")
+        else:
+            summary = None
+
+        self._collector = SojournTimeCollector(self._n, summary)
+
+    def get_state(self) -> "Any":
+        # The identifiers of the tokens in the net are restored with their observers
+        next_token_id = next(self.token_id)
+        self.token_id = count(next_token_id)
+        return dict(super().get_state(), next_token_id=next_token_id)
+
+    def set_state(self, state: "Any"):
+        super().set_state(state)
+        self.token_id = count(state["next_token_id"])
+
+    def observes_tokens_of(self, typ: "TokenType") -> bool:
+        return self._token_types is None or typ.ordinal in self._token_types
 
     def token_observer_factory(self, t: "Token") -> Optional[SojournTimePluginTokenObserver]:
         return SojournTimePluginTokenObserver(self, t, self._places, self._clock,
@@ -1,6 +1,7 @@
 from ..._structure cimport Token, Place
 from ..autofire._autofire cimport Clock
 from .._meters cimport GenericCollector
+from .._summary cimport SojournTimeHistograms
 from cpython.array cimport array
 import cython
 
@@ -12,12 +13,14 @@ cdef class SojournTimeCollector(GenericCollector):
     cdef array _visit_number
     cdef array _place
     cdef array _duration
+    cdef readonly SojournTimeHistograms histograms     # Counts the durations instead of collecting rows, if not None
 
     cdef collect(self, unsigned long long token_id,
                        unsigned int token_type,
                        double start_time,
                        unsigned long long visit_number,
                        unsigned int place, double duration)
+    cdef collect_lifetime(self, unsigned int token_type, unsigned int place, double duration)
 
 
 cdef class SojournTimePluginTokenObserver:
@@ -31,6 +34,8 @@ cdef class SojournTimePluginTokenObserver:
     cdef SojournTimeCollector _collector
 
     cdef double _arrival_time       #: double = cython.declare(cython.double)
+    cdef dict _time_at_places       # Dict[int, float], None unless the collector keeps lifetime histograms
+    cdef object __weakref__         # Plugins keep weak references to their token observers
 
     cpdef report_construction(self)
     cpdef report_destruction(self)
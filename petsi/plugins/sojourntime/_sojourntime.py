@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .._meters import GenericCollector
+from .._summary import SojournTimeHistograms, VISIT, LIFETIME
 
 if TYPE_CHECKING:
     from typing import Optional, FrozenSet
@@ -31,6 +32,9 @@ class SojournTimeCollector(GenericCollector):
         ``place`` ,``unsigned int (16 bits)``  , The index of the place in the places array.
         ``duration`` , ``double``, How long the token stayed at the place (sojourn time)
 
+    In summary mode the durations are summarized by ``place``. If the summary table is a
+    :class:`~petsi.plugins._summary.SojournTimeHistograms` object, the durations are counted in its histograms,
+    together with the total time each token spent at each place during its life.
     """
     _type_codes = dict(token_id='Q',      # unsigned long long (64 bits)
                        token_type='I',    # unsigned int (16 bits)
@@ -39,6 +43,11 @@ class SojournTimeCollector(GenericCollector):
                        place='I',         # unsigned int (16 bits)
                        duration='d',      # double
                        )
+    _warm_up_column = "duration"  # The end of the warm-up period is detected in the durations
+
+    def __init__(self, required_observations, summary=None):
+        self.histograms = summary if isinstance(summary, SojournTimeHistograms) else None
+        super().__init__(required_observations, summary)
 
     def reset(self):
         super().reset()
@@ -51,12 +60,27 @@ class SojournTimeCollector(GenericCollector):
     #             visit_number: int, place: int, duration: float):
     def collect(self, token_id, token_type, start_time,
                 visit_number, place, duration):
+        if self.histograms is not None:
+            self.histograms.add_sojourn(VISIT, token_type, place, duration)
+            self._row_collected()
+            return
+
+        if self.summary is not None:
+            self.summary.add(place, duration, 1.0)
+            self._row_collected()
+            return
+
         self._token_id.append(token_id)
         self._token_type.append(token_type)
         self._start_time.append(start_time)
         self._visit_number.append(visit_number)
         self._place.append(place)
         self._duration.append(duration)
+        self._row_collected()
+
+    def collect_lifetime(self, token_type, place, duration):
+        """ Count the total time a token of ``token_type`` spent at ``place`` during its life in the histograms."""
+        self.histograms.add_sojourn(LIFETIME, token_type, place, duration)
 
 
 class SojournTimePluginTokenObserver:  # Cython does not cope with base classes here
@@ -64,7 +88,7 @@ class SojournTimePluginTokenObserver:  # Cython does not cope with base classes
     def __init__(self,
                  _plugin: "APlugin",
                  _token: "TToken",
-                 _places: "Optional[FrozenSet[int]]",
+                 _places: "Optional[frozenset]",
                  _clock: "TClock",
                  _collector: SojournTimeCollector,
                  _token_id: int):
@@ -76,6 +100,8 @@ class SojournTimePluginTokenObserver:  # Cython does not cope with base classes
         self._clock = _clock
         self._collector = _collector
         self._arrival_time = 0.0
+        # The total time spent at each place, by place ordinal, if the collector keeps lifetime histograms
+        self._time_at_places = dict() if _collector.histograms is not None else None
 
     def reset(self):
         """ Do nothing.
@@ -85,11 +111,24 @@ class SojournTimePluginTokenObserver:  # Cython does not cope with base classes
         so there is no need to change anything in the state of the observer.
         """
 
+    def get_state(self):
+        return (self._token_id, self._visit_number, self._arrival_time,
+                None if self._time_at_places is None else dict(self._time_at_places))
+
+    def set_state(self, state):
+        self._token_id, self._visit_number, self._arrival_time, time_at_places = state
+
+        if self._time_at_places is not None:
+            self._time_at_places = dict(time_at_places or ())
+
     def report_construction(self):
         """ Do nothing """
 
     def report_destruction(self):
-        """ Do nothing """
+        """ Report the total time the token spent at each place, if the collector keeps lifetime histograms."""
+        if self._time_at_places is not None:
+            for place, duration in self._time_at_places.items():
+                self._collector.collect_lifetime(self._token.typ.ordinal, place, duration)
 
     def report_arrival_at(self, _: "TPlace"):
         """ Start the time measurement for the visit at the place"""
@@ -107,4 +146,7 @@ class SojournTimePluginTokenObserver:  # Cython does not cope with base classes
             self._collector.collect(self._token_id, self._token.typ.ordinal, self._arrival_time,
                                     self._visit_number, p.ordinal, sojourn_time)
 
+            if self._time_at_places is not None:
+                self._time_at_places[p.ordinal] = self._time_at_places.get(p.ordinal, 0.0) + sojourn_time
+
         self._visit_number += 1
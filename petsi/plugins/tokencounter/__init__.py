@@ -19,6 +19,7 @@ from typing import Optional, TYPE_CHECKING
 from ...util import export
 
 from ..meters import MeterPlugin
+from .._summary import SummaryTable, HistogramTable
 from ._tokencounter import TokenCounterCollector, TokenCounterPluginPlaceObserver
 
 if TYPE_CHECKING:
@@ -37,10 +38,22 @@ class TokenCounterPlugin(
         The plugin collects the empirical distribution of the
         time-weighted token counts at all places of the observed Petri net,
         i.e. in what percentage of time the token count is i at place j.
+
+        With ``_histogram_size`` set, the plugin accumulates these distributions during the simulation, in a
+        :class:`~petsi.plugins._summary.HistogramTable`, instead of collecting a row for each change of the token
+        counts. Otherwise, with ``_summary`` set, it keeps the time-weighted summary statistics of the token counts.
     """
+    _histogram_size: Optional[int] = None     # The number of buckets below the overflow bucket of the histograms
 
     def __post_init__(self):
-        self._collector = TokenCounterCollector(self._n)
+        if self._histogram_size is not None:
+            summary = HistogramTable("place", self._histogram_size)
+        elif self._summary:
+            summary = SummaryTable("place", weighted=True)
+        else:
+            summary = None
+
+        self._collector = TokenCounterCollector(self._n, summary)
 
     def place_observer_factory(self, p: "Place") -> Optional[TokenCounterPluginPlaceObserver]:
         return TokenCounterPluginPlaceObserver(self, p, self._clock, self._collector) \
@@ -27,12 +27,15 @@ class TokenCounterCollector(GenericCollector):
         ``count`` , ``unsigned long long (64 bits)`` , The number of the tokens at the place during the stable period
         ``duration`` , ``double`` , The duration of the stable period.
 
+    In summary mode the counts are summarized by ``place``, weighted by the durations, either into summary statistics
+    or into histograms of the time spent at each count.
     """
     _type_codes = dict(start_time='d',   # double
                        place='I',        # unsigned int (16 bits)
                        count='Q',        # unsigned long long (64 bits)
                        duration='d',     # double
                        )
+    _warm_up_column = "count"  # The end of the warm-up period is detected in the token counts
 
     def reset(self):
         super().reset()
@@ -42,10 +45,16 @@ class TokenCounterCollector(GenericCollector):
     # cython crashes with argument annotations ....
     # def collect(self, start_time: float, place: int, count: int, duration: float):
     def collect(self, start_time, place, count, duration):
+        if self.summary is not None:
+            self.summary.add(place, count, duration)
+            self._row_collected()
+            return
+
         self._start_time.append(start_time)
         self._place.append(place)
         self._count.append(count)
         self._duration.append(duration)
+        self._row_collected()
 
 
 class TokenCounterPluginPlaceObserver:
@@ -64,6 +73,12 @@ class TokenCounterPluginPlaceObserver:
         self._num_tokens = 0
         self._time_of_last_token_move = 0.0
 
+    def get_state(self):
+        return self._num_tokens, self._time_of_last_token_move
+
+    def set_state(self, state):
+        self._num_tokens, self._time_of_last_token_move = state
+
     def _update_num_tokens_by(self, delta: int):
         now: float = self._clock.read()
         duration: float = now - self._time_of_last_token_move
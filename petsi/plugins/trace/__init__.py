@@ -0,0 +1,324 @@
+""" A plugin recording the firings of the transitions and the movements of the tokens into a file, for replaying them
+into meters offline.
+
+.. rubric:: Synopsis
+
+.. code-block:: python
+
+    tracer = simulator.trace("run.trace")
+    simulator.simulate()
+    tracer.close()
+
+    runs = replay("run.trace", "token_visits", "place_population", summary=True)
+    visits = runs[0]["token_visits"]
+
+A trace file consists of
+
+#. an 8 byte magic string, ``PETSITRC``,
+#. the format version and the length of the header, as little-endian 32 and 64 bit unsigned integers,
+#. the header: a UTF-8 encoded JSON object with the columns of the events, the byte order of the machine
+   writing the file, the name tables of the net and whether the movements of the tokens are recorded,
+#. the chunks of events, each a 64 bit unsigned count of events followed by the columns of the events.
+
+The events and their columns are described in :mod:`petsi.plugins.trace._trace`. The replay feeds the events into
+the collectors of the meters the same way their observers do during a simulation, so it yields the observations
+a simulation with the meters would have.
+
+.. rubric:: Public package interface
+
+- Class :class:`TracePlugin` (see below)
+- Class :class:`Trace` (see below)
+- Function :func:`replay` (see below)
+
+.. rubric:: Internal submodules
+
+.. autosummary::
+    :template: module_reference.rst
+    :recursive:
+    :toctree:
+
+    petsi.plugins.trace._trace
+"""
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from itertools import count
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from ...observations import net_name_tables
+from ...util import export
+
+from ..interface import AbstractPlugin
+from .._summary import Buckets, HistogramTable, SojournTimeHistograms, SummaryTable
+from ..sojourntime._sojourntime import SojournTimeCollector
+from ..tokencounter._tokencounter import TokenCounterCollector
+from ..transitioninterval._transitioninterval import FiringCollector
+from ._trace import COLUMNS, RESET, MeterReplay, TraceBuffer, TraceTokenObserver, TraceTransitionObserver
+
+if TYPE_CHECKING:
+    from ..autofire import Clock
+    from ..interface import NoopPlaceObserver
+    from ..._structure import Net, Token, TokenType, Transition
+
+MAGIC = b"PETSITRC"
+VERSION = 1
+
+#: The number of events buffered before writing them to the file
+DEFAULT_CAPACITY = 65536
+
+_PREAMBLE = struct.Struct("<8sIQ")   # magic, version, header length
+_CHUNK = struct.Struct("<Q")         # the number of events in the chunk
+
+#: The streams that can be replayed from a trace; the first two need the movements of the tokens
+STREAMS = ("token_visits", "place_population", "transition_firing")
+
+
+@export
+@dataclass(eq=False)
+class TracePlugin(AbstractPlugin["NoopPlaceObserver", TraceTransitionObserver, TraceTokenObserver]):
+    """ A PetSi plugin recording the events of a net into a file.
+
+    The events are collected in a buffer of ``_capacity`` events, written to the file whenever it fills up,
+    and by :meth:`flush` and :meth:`close`. The header of the file is written with the first events,
+    so the net must be complete by then.
+
+    Each reset of the plugin is recorded, starting a new run in the trace. The tokens removed from the net
+    by the reset must not be recorded: :meth:`pause` the recording before resetting the net,
+    as :class:`~petsi.simulation.Simulator` does. The plugin must be registered while the net is empty.
+
+    :param _net: The net to trace, for its name tables.
+    :param _clock: The clock of the simulation.
+    :param _file_name: The file to create or overwrite.
+    :param _capacity: The number of events to buffer.
+    :param _tokens: Record the movements of the tokens, not just the firings of the transitions.
+    """
+    _net: "Net"
+    _clock: "Clock"
+    _file_name: str
+    _capacity: int = DEFAULT_CAPACITY
+    _tokens: bool = True
+
+    _buffer: TraceBuffer = field(init=False)
+    _file: BinaryIO = field(init=False)
+    _is_header_written: bool = field(default=False, init=False)
+    _token_ids: Iterator[int] = field(default_factory=count, init=False)
+
+    def __post_init__(self):
+        self._buffer = TraceBuffer(self._capacity, self._write_chunk)
+        self._file = open(self._file_name, "wb")
+
+    def observes_tokens_of(self, typ: "TokenType") -> bool:
+        return self._tokens
+
+    def token_observer_factory(self, t: "Token") -> Optional[TraceTokenObserver]:
+        return TraceTokenObserver(self, t, self._clock, self._buffer, next(self._token_ids)) if self._tokens else None
+
+    def transition_observer_factory(self, t: "Transition") -> TraceTransitionObserver:
+        return TraceTransitionObserver(self, t, self._clock, self._buffer)
+
+    def pause(self):
+        """ Stop recording the events until the next reset."""
+        self._buffer.is_recording = False
+
+    def reset(self):
+        super().reset()
+        self._buffer.is_recording = True
+        self._buffer.record(RESET, 0, self._clock.read(), -1)
+
+    def _write_chunk(self, buffer: TraceBuffer):
+        if not self._is_header_written:
+            header = json.dumps(dict(columns=[dict(name=name, typecode=typecode, itemsize=array(typecode).itemsize)
+                                              for name, typecode in COLUMNS.items()],
+                                     byteorder=sys.byteorder,
+                                     names=net_name_tables(self._net),
+                                     tokens=self._tokens,
+                                     )).encode("utf-8")
+            self._file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+            self._file.write(header)
+            self._is_header_written = True
+
+        self._file.write(_CHUNK.pack(buffer.size))
+
+        for column in buffer.columns:
+            self._file.write(memoryview(column)[:buffer.size])
+
+        buffer.clear()
+
+    def flush(self):
+        """ Write the buffered events to the file."""
+        if self._buffer.size > 0 or not self._is_header_written:
+            self._write_chunk(self._buffer)
+
+        self._file.flush()
+
+    def close(self):
+        """ Write the buffered events to the file and close it. No more events may be recorded."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+@export
+class Trace:
+    """ A trace file written by a :class:`TracePlugin`.
+
+    .. attribute:: names
+        :type: Dict[str, List[str]]
+
+        The name tables of the net (``places``, ``transitions`` and ``types``).
+
+    .. attribute:: tokens
+        :type: bool
+
+        Whether the movements of the tokens are recorded.
+    """
+    names: Dict[str, List[str]]
+    tokens: bool
+    version: int
+
+    def __init__(self, file_name: str):
+        self._file_name = file_name
+
+        with open(file_name, "rb") as file:
+            self._data_start = self._load_header(file)
+
+    def _load_header(self, file: BinaryIO) -> int:
+        preamble = file.read(_PREAMBLE.size)
+
+        if len(preamble) < _PREAMBLE.size:
+            raise ValueError(f"{self._file_name} is not a PetSi trace file")
+
+        magic, self.version, header_length = _PREAMBLE.unpack(preamble)
+
+        if magic != MAGIC:
+            raise ValueError(f"{self._file_name} is not a PetSi trace file")
+
+        if self.version > VERSION:
+            raise ValueError(f"{self._file_name} has format version {self.version}; "
+                             f"this version of PetSi reads versions up to {VERSION}")
+
+        header = json.loads(file.read(header_length).decode("utf-8"))
+
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{self._file_name} was written on a {header['byteorder']} endian machine")
+
+        for column in header["columns"]:
+            if array(column["typecode"]).itemsize != column["itemsize"]:
+                raise ValueError(f"The item size of column '{column['name']}' in {self._file_name} does not match "
+                                 f"the item size of type code '{column['typecode']}' on this machine")
+
+        self._typecodes = [column["typecode"] for column in header["columns"]]
+        self.names = header["names"]
+        self.tokens = header["tokens"]
+        return _PREAMBLE.size + header_length
+
+    def chunks(self) -> Iterator[Tuple[array, ...]]:
+        """ Read the chunks of events.
+
+        :return: An iterator over the chunks, each a tuple of the columns of the events (see
+                :data:`~petsi.plugins.trace._trace.COLUMNS`).
+        :raise ValueError: The file ends in the middle of a chunk.
+        """
+        with open(self._file_name, "rb") as file:
+            file.seek(self._data_start)
+
+            while True:
+                size = file.read(_CHUNK.size)
+
+                if not size:
+                    return
+
+                if len(size) < _CHUNK.size:
+                    raise ValueError(f"{self._file_name} is truncated")
+
+                length, = _CHUNK.unpack(size)
+                chunk = list()
+
+                for typecode in self._typecodes:
+                    column = array(typecode)
+
+                    try:
+                        column.fromfile(file, length)
+                    except EOFError:
+                        raise ValueError(f"{self._file_name} is truncated") from None
+
+                    chunk.append(column)
+
+                yield tuple(chunk)
+
+
+@export
+def replay(file_name: str,
+           *streams: str,
+           places: Optional[Iterable[str]] = None,
+           transitions: Optional[Iterable[str]] = None,
+           token_types: Optional[Iterable[str]] = None,
+           summary: bool = False,
+           histogram: Optional[int] = None,
+           sojourn_buckets: Union[None, Buckets, Dict[str, Buckets]] = None,
+           ) -> List[Dict[str, Dict[str, array]]]:
+    """ Compute the observations of meters from a trace.
+
+    The parameters select the observations the same way as the ones of
+    :meth:`Simulator.observe() <petsi.simulation.Simulator.observe>` do.
+
+    :param file_name: The trace file written by a :class:`TracePlugin`.
+    :param streams: The types of the streams to compute: ``token_visits``, ``place_population`` or
+                    ``transition_firing``.
+    :param places: The places to observe. Observes all places when set to ``None``.
+    :param transitions: The transitions to observe. Observes all transitions when set to ``None``.
+    :param token_types: The type of tokens to observe. Observes all types when set to ``None``.
+    :param summary: Summarize the observations instead of returning them one by one.
+    :param histogram: The number of buckets in the histograms of the ``place_population`` stream.
+    :param sojourn_buckets: The buckets of the sojourn time histograms of the ``token_visits`` stream, for all
+                    places or for each place by name.
+    :return: The observations of each run in the trace, each keyed by the stream type.
+    :raise KeyError: An unknown stream type, place, transition or token type.
+    :raise ValueError: The movements of the tokens are not recorded in the trace, but needed by a stream.
+    """
+    trace = Trace(file_name)
+    unknown = [stream for stream in streams if stream not in STREAMS]
+
+    if unknown:
+        raise KeyError(f"Unknown stream types: {', '.join(unknown)}")
+
+    if not trace.tokens and ("token_visits" in streams or "place_population" in streams):
+        raise ValueError(f"The movements of the tokens are not recorded in {file_name}")
+
+    ordinal_of = {kind: {name: ordinal for ordinal, name in enumerate(names)} for kind, names in trace.names.items()}
+
+    def ordinals(kind: str, names: Optional[Iterable[str]]):
+        return None if names is None else frozenset(ordinal_of[kind][name] for name in names)
+
+    _places = ordinals("places", places)
+    _sojourn_buckets = sojourn_buckets if sojourn_buckets is None or isinstance(sojourn_buckets, Buckets) \
+        else {ordinal_of["places"][p]: buckets for p, buckets in sojourn_buckets.items()}
+
+    if "token_visits" not in streams:
+        sojourn_time = None
+    elif _sojourn_buckets is not None:
+        sojourn_time = SojournTimeCollector(0, SojournTimeHistograms(_sojourn_buckets))
+    else:
+        sojourn_time = SojournTimeCollector(0, SummaryTable("place") if summary else None)
+
+    if "place_population" not in streams:
+        token_counter = None
+    elif histogram is not None:
+        token_counter = TokenCounterCollector(0, HistogramTable("place", histogram))
+    else:
+        token_counter = TokenCounterCollector(0, SummaryTable("place", weighted=True) if summary else None)
+
+    firing = FiringCollector(0, SummaryTable("transition") if summary else None) \
+        if "transition_firing" in streams else None
+
+    meters = MeterReplay(sojourn_time, token_counter, firing,
+                         _places, ordinals("types", token_types), ordinals("transitions", transitions),
+                         len(trace.names["places"]), len(trace.names["transitions"]))
+
+    for chunk in trace.chunks():
+        meters.replay(*chunk)
+
+    meters.finish_run()
+    return meters.runs
@@ -0,0 +1,83 @@
+from ..._structure cimport Token, Place, Transition
+from ..autofire._autofire cimport Clock
+from ..sojourntime._sojourntime cimport SojournTimeCollector
+from ..tokencounter._tokencounter cimport TokenCounterCollector
+from ..transitioninterval._transitioninterval cimport FiringCollector
+import cython
+
+
+cdef class TraceBuffer:
+    cdef readonly Py_ssize_t capacity
+    cdef readonly Py_ssize_t size
+    cdef public bint is_recording
+    cdef object _sink                   # Callable[[TraceBuffer], None]
+    cdef readonly tuple columns         # Tuple[array, ...], see COLUMNS
+    cdef unsigned char[::1] _kinds
+    cdef unsigned int[::1] _ordinals
+    cdef double[::1] _times
+    cdef long long[::1] _tokens
+
+    @cython.locals(i=Py_ssize_t)
+    cpdef record(self, unsigned char kind, unsigned int ordinal, double time, long long token)
+
+
+cdef class TraceTransitionObserver:
+    cdef object _plugin   # TracePlugin
+    cdef Transition _transition
+    cdef Clock _clock
+    cdef TraceBuffer _buffer
+
+    cpdef got_enabled(self, )
+    cpdef got_disabled(self, )
+    cpdef before_firing(self)
+    cpdef after_firing(self, )
+    cpdef reset(self)
+
+
+cdef class TraceTokenObserver:
+    cdef object _plugin   # TracePlugin
+    cdef Token _token
+    cdef Clock _clock
+    cdef TraceBuffer _buffer
+    cdef long long _token_id
+    cdef object __weakref__         # Plugins keep weak references to their token observers
+
+    cpdef report_construction(self)
+    cpdef report_destruction(self)
+    cpdef report_arrival_at(self, Place p)
+    cpdef report_departure_from(self, Place p)
+
+
+cdef class ReplayedToken:
+    cdef unsigned long long token_id
+    cdef unsigned int token_type
+    cdef unsigned long long visit_number
+    cdef double arrival_time
+    cdef dict time_at_places        # Dict[int, float], None unless the collector keeps lifetime histograms
+
+
+cdef class MeterReplay:
+    cdef SojournTimeCollector _sojourn_time
+    cdef TokenCounterCollector _token_counter
+    cdef FiringCollector _firing
+    cdef frozenset _places
+    cdef frozenset _token_types
+    cdef frozenset _transitions
+    cdef dict _tokens               # Dict[int, ReplayedToken], by the token id of the trace
+    cdef unsigned long long _next_token_id
+    cdef long long[::1] _num_tokens
+    cdef double[::1] _time_of_last_token_move
+    cdef double[::1] _previous_firing_time
+    cdef unsigned long long _events_in_run
+    cdef readonly list runs         # List[Dict[str, Dict[str, array]]]
+
+    @cython.locals(i=Py_ssize_t, kind=cython.uchar, ordinal=cython.uint, time=cython.double, token=ReplayedToken)
+    cpdef replay(self, unsigned char[::1] kinds, unsigned int[::1] ordinals, double[::1] times, long long[::1] tokens)
+
+    @cython.locals(sojourn_time=cython.double)
+    cdef _depart(self, ReplayedToken token, unsigned int place, double time)
+
+    cpdef finish_run(self)
+
+    @cython.locals(place=Py_ssize_t, transition=Py_ssize_t)
+    cdef _reset(self, double time)
@@ -0,0 +1,270 @@
+""" A Cython extension module recording the events of a Petri net into a buffer and replaying them into meters.
+
+The events are recorded into the columns of a :class:`TraceBuffer`, one row per event:
+
+- ``kind``: the kind of the event, one of :data:`FIRING`, :data:`CONSTRUCTION`, :data:`ARRIVAL`,
+  :data:`DEPARTURE`, :data:`DESTRUCTION` and :data:`RESET`,
+- ``ordinal``: the ordinal of the transition fired, of the place arrived at or departed from, or of the type of the
+  token constructed or destroyed,
+- ``time``: the simulation time of the event and
+- ``token``: the identifier of the token, or -1 for firings and resets.
+
+The firing of a transition is recorded before the flows of its arcs, so the token events following a firing
+belong to it.
+"""
+from array import array
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    # Need to rename Clock, otherwise it collides with the cimported Clock in the .pxd file!
+    from ..autofire import Clock as TClock
+
+    # Same trick for Token, Place and Transition
+    from ..._structure import Token as TToken, Place as TPlace, Transition as TTransition
+
+    from ..interface import APlugin
+
+FIRING = 0
+CONSTRUCTION = 1
+ARRIVAL = 2
+DEPARTURE = 3
+DESTRUCTION = 4
+RESET = 5
+
+#: The names and type codes of the columns of a trace
+COLUMNS = dict(kind='B', ordinal='I', time='d', token='q')
+
+
+class TraceBuffer:
+    """ A fixed-size buffer of events.
+
+    When the buffer fills up, it is handed over to ``sink``, which is expected to save the events
+    in :attr:`columns` and :meth:`clear` the buffer.
+    """
+
+    def __init__(self, capacity: int, sink: "Callable[[TraceBuffer], None]"):
+        if capacity < 1:
+            raise ValueError(f"The capacity must be a positive integer, found {capacity}")
+
+        self.capacity = capacity
+        self.size = 0
+        self.is_recording = True
+        self._sink = sink
+        self.columns = tuple(array(type_code, [0]) * capacity for type_code in COLUMNS.values())
+        self._kinds, self._ordinals, self._times, self._tokens = self.columns
+
+    def clear(self):
+        """ Drop the events in the buffer."""
+        self.size = 0
+
+    def record(self, kind, ordinal, time, token):
+        """ Add an event to the buffer, unless recording is suspended."""
+        if not self.is_recording:
+            return
+
+        i = self.size
+        self._kinds[i] = kind
+        self._ordinals[i] = ordinal
+        self._times[i] = time
+        self._tokens[i] = token
+        self.size = i + 1
+
+        if self.size == self.capacity:
+            self._sink(self)
+
+
+class TraceTransitionObserver:
+    """ Record the firings of a transition."""
+
+    def __init__(self, _plugin: "APlugin", _transition: "TTransition", _clock: "TClock", _buffer: TraceBuffer):
+        self._plugin = _plugin
+        self._transition = _transition
+        self._clock = _clock
+        self._buffer = _buffer
+
+    def got_enabled(self, ): pass   # No actual base class, so need to provide an implementation
+
+    def got_disabled(self, ): pass  # No actual base class, so need to provide an implementation
+
+    def before_firing(self):
+        self._buffer.record(FIRING, self._transition.ordinal, self._clock.read(), -1)
+
+    def after_firing(self, ): pass  # No actual base class, so need to provide an implementation
+
+    def reset(self): pass
+
+    def get_state(self): pass
+
+    def set_state(self, state): pass
+
+
+class TraceTokenObserver:
+    """ Record the construction, the movements and the destruction of a token."""
+
+    def __init__(self, _plugin: "APlugin", _token: "TToken", _clock: "TClock", _buffer: TraceBuffer, _token_id: int):
+        self._plugin = _plugin
+        self._token = _token
+        self._clock = _clock
+        self._buffer = _buffer
+        self._token_id = _token_id
+
+    def reset(self):
+        """ Do nothing, the observer goes away with its token."""
+
+    def get_state(self):
+        return self._token_id
+
+    def set_state(self, state):
+        self._token_id = state
+
+    def report_construction(self):
+        self._buffer.record(CONSTRUCTION, self._token.typ.ordinal, self._clock.read(), self._token_id)
+
+    def report_destruction(self):
+        self._buffer.record(DESTRUCTION, self._token.typ.ordinal, self._clock.read(), self._token_id)
+
+    def report_arrival_at(self, p: "TPlace"):
+        self._buffer.record(ARRIVAL, p.ordinal, self._clock.read(), self._token_id)
+
+    def report_departure_from(self, p: "TPlace"):
+        self._buffer.record(DEPARTURE, p.ordinal, self._clock.read(), self._token_id)
+
+
+class ReplayedToken:
+    """ The state of a token needed for replaying its visits into a :class:`SojournTimeCollector`."""
+
+    def __init__(self, token_id: int, token_type: int, keeps_lifetimes: bool):
+        self.token_id = token_id
+        self.token_type = token_type
+        self.visit_number = 0
+        self.arrival_time = 0.0
+        # The total time spent at each place, by place ordinal, if the collector keeps lifetime histograms
+        self.time_at_places = dict() if keeps_lifetimes else None
+
+
+class MeterReplay:
+    """ Feed the events of a trace into the collectors of meters, the same way as the observers of the meters do
+    during a simulation.
+
+    The collectors are restarted at each :data:`RESET` event. The observations collected until then form a run.
+
+    :param sojourn_time: The collector of the sojourn times of the tokens, or ``None``.
+    :param token_counter: The collector of the token counts at the places, or ``None``.
+    :param firing: The collector of the intervals between the firings of the transitions, or ``None``.
+    :param places: Collect the sojourn times and the token counts at these places only, by ordinal, if not ``None``.
+    :param token_types: Collect the sojourn times of the tokens of these types only, by ordinal, if not ``None``.
+    :param transitions: Collect the intervals of these transitions only, by ordinal, if not ``None``.
+    :param number_of_places: The number of places in the net.
+    :param number_of_transitions: The number of transitions in the net.
+    """
+
+    def __init__(self, sojourn_time, token_counter, firing, places, token_types, transitions,
+                 number_of_places: int, number_of_transitions: int):
+        self._sojourn_time = sojourn_time
+        self._token_counter = token_counter
+        self._firing = firing
+        self._places = places
+        self._token_types = token_types
+        self._transitions = transitions
+        self._tokens = dict()
+        self._next_token_id = 0
+        self._num_tokens = array('q', [0]) * number_of_places
+        self._time_of_last_token_move = array('d', [0.0]) * number_of_places
+        self._previous_firing_time = array('d', [0.0]) * number_of_transitions
+        self._events_in_run = 0
+        self.runs = list()
+
+    def replay(self, kinds, ordinals, times, tokens):
+        """ Replay a chunk of events, given as the columns of the trace."""
+        for i in range(len(kinds)):
+            kind = kinds[i]
+            ordinal = ordinals[i]
+            time = times[i]
+
+            if kind == RESET:
+                if self._events_in_run > 0:
+                    self.finish_run()
+
+                self._reset(time)
+                continue
+
+            self._events_in_run += 1
+
+            if kind == FIRING:
+                if self._firing is not None and (self._transitions is None or ordinal in self._transitions):
+                    self._firing.collect(ordinal, time, time - self._previous_firing_time[ordinal])
+                    self._previous_firing_time[ordinal] = time
+
+            elif kind == ARRIVAL or kind == DEPARTURE:
+                if self._token_counter is not None and (self._places is None or ordinal in self._places):
+                    self._token_counter.collect(self._time_of_last_token_move[ordinal], ordinal,
+                                                self._num_tokens[ordinal], time - self._time_of_last_token_move[ordinal])
+                    self._time_of_last_token_move[ordinal] = time
+                    self._num_tokens[ordinal] += 1 if kind == ARRIVAL else -1
+
+                if self._sojourn_time is not None:
+                    token = self._tokens.get(tokens[i])
+
+                    if token is not None:
+                        if kind == ARRIVAL:
+                            token.arrival_time = time
+                        else:
+                            self._depart(token, ordinal, time)
+
+            elif kind == CONSTRUCTION:
+                if self._sojourn_time is not None and (self._token_types is None or ordinal in self._token_types):
+                    self._tokens[tokens[i]] = ReplayedToken(self._next_token_id, ordinal,
+                                                            self._sojourn_time.histograms is not None)
+                    self._next_token_id += 1
+
+            elif kind == DESTRUCTION:
+                token = self._tokens.pop(tokens[i], None)
+
+                if token is not None and token.time_at_places is not None:
+                    for place, duration in token.time_at_places.items():
+                        self._sojourn_time.collect_lifetime(token.token_type, place, duration)
+
+    def _depart(self, token, place, time):
+        if self._places is None or place in self._places:
+            sojourn_time = time - token.arrival_time
+            self._sojourn_time.collect(token.token_id, token.token_type, token.arrival_time,
+                                       token.visit_number, place, sojourn_time)
+
+            if token.time_at_places is not None:
+                token.time_at_places[place] = token.time_at_places.get(place, 0.0) + sojourn_time
+
+        token.visit_number += 1
+
+    def finish_run(self):
+        """ Close the current run, appending the observations of the collectors to :attr:`runs`."""
+        observations = dict()
+
+        if self._sojourn_time is not None:
+            observations["token_visits"] = self._sojourn_time.get_observations()
+
+        if self._token_counter is not None:
+            observations["place_population"] = self._token_counter.get_observations()
+
+        if self._firing is not None:
+            observations["transition_firing"] = self._firing.get_observations()
+
+        self.runs.append(observations)
+        self._events_in_run = 0
+
+    def _reset(self, time):
+        # The tokens of the previous run were removed from the net without being destroyed
+        self._tokens.clear()
+
+        for place in range(len(self._num_tokens)):
+            self._num_tokens[place] = 0
+            self._time_of_last_token_move[place] = 0.0
+
+        for transition in range(len(self._previous_firing_time)):
+            self._previous_firing_time[transition] = time
+
+        for collector in (self._sojourn_time, self._token_counter, self._firing):
+            if collector is not None:
+                collector.restart()
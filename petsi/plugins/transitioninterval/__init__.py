@@ -19,6 +19,7 @@ from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
 from ..meters import MeterPlugin
+from .._summary import SummaryTable
 from ...util import export
 
 from ._transitioninterval import FiringCollector, TransitionIntervalPluginTransitionObserver
@@ -36,7 +37,7 @@ class TransitionIntervalPlugin(
     """ A PetSi plugin for collecting stats on the time intervals between firings of transitions."""
 
     def __post_init__(self):
-        self._collector = FiringCollector(self._n)
+        self._collector = FiringCollector(self._n, SummaryTable("transition") if self._summary else None)
 
     def transition_observer_factory(self, t: "Transition") -> \
             Optional[TransitionIntervalPluginTransitionObserver]:
@@ -26,11 +26,13 @@ class FiringCollector(GenericCollector):
         ``firing_time`` , ``double`` , When transition was fired
         ``interval`` , ``double`` , The time elapsed since the previous firing of the transition
 
+    In summary mode the intervals are summarized by ``transition``.
     """
     _type_codes = dict(transition='I',   # unsigned int (16 bits)
                        firing_time='d',  # double
                        interval='d',     # double
                        )
+    _warm_up_column = "interval"  # The end of the warm-up period is detected in the intervals
 
     def reset(self):
         super().reset()
@@ -40,9 +42,15 @@ class FiringCollector(GenericCollector):
     # cython crashes with argument annotations ....
     # def collect(self, transition: int, firing_time: float, interval: float):
     def collect(self, transition, firing_time, interval):
+        if self.summary is not None:
+            self.summary.add(transition, interval, 1.0)
+            self._row_collected()
+            return
+
         self._transition.append(transition)
         self._firing_time.append(firing_time)
         self._interval.append(interval)
+        self._row_collected()
 
 
 class TransitionIntervalPluginTransitionObserver:
@@ -72,3 +80,9 @@ class TransitionIntervalPluginTransitionObserver:
 
     def reset(self):
         self._previous_firing_time = self._clock.read()
+
+    def get_state(self):
+        return self._previous_firing_time
+
+    def set_state(self, state):
+        self._previous_firing_time = state
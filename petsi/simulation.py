@@ -2,26 +2,40 @@
 """
 
 import os
+import pickle
 import re
+import zlib
 from array import array, typecodes
-from collections import defaultdict
-from functools import wraps, reduce
-from glob import glob
+from functools import wraps
+from glob import glob, escape as glob_escape
+from math import inf
 from typing import TYPE_CHECKING, Optional, Dict, Callable, TypeVar, Any, cast, \
-    Tuple, FrozenSet, Iterable, List
+    Tuple, FrozenSet, Iterable, List, Set, Union
 
 from .plugins.meters import MeterPlugin
+from .plugins._meters import DEFAULT_CHUNK_SIZE
+from .plugins._summary import Buckets
 from .plugins.transitioninterval import TransitionIntervalPlugin
 from .plugins.sojourntime import SojournTimePlugin
 from .plugins.tokencounter import TokenCounterPlugin
+from .plugins.batchmeans import BatchMeansPlugin, Estimate
+from .plugins.profiler import ProfilerPlugin, Profile
+from .plugins.trace import TracePlugin, DEFAULT_CAPACITY
+from .plugins.interface import AbstractPlugin
 
 from .netviz import Visualizer
-from ._structure import Net
+from .observations import ChunkedObservations, net_name_tables
+from ._structure import Net, Transition, build_from_spec
+from ._distributions import RandomStreams, Distribution
 from .plugins.autofire import AutoFirePlugin
 from .plugins.autofire import Clock
 
 if TYPE_CHECKING:
     from graphviz import Digraph
+    from ._compiled import CompiledNet
+
+#: The version of the format of the checkpoints created by :meth:`Simulator.checkpoint`
+CHECKPOINT_VERSION = 1
 
 
 class Simulator:
@@ -34,37 +48,103 @@ class Simulator:
         #. Arcs
     """
     _net: Net
+    _random_streams: RandomStreams
+    _seeded_samplers: List[Distribution]
     _auto_fire: AutoFirePlugin
     _meters: Dict[str, MeterPlugin]
-    _need_more_observations: List[Callable[[], bool]]
+    _batch_means: Optional[BatchMeansPlugin]
+    _profiler: Optional[ProfilerPlugin]
+    _tracer: Optional[TracePlugin]
 
     # Type[_MeterPlugin] Callable[[str, ], _MeterPlugin]
     _meter_plugins: Dict[str, Callable[[str, int,
                                         Optional[FrozenSet[int]],
                                         Optional[FrozenSet[int]],
                                         Optional[FrozenSet[int]],
-                                        Clock],
+                                        Clock, bool],
                                        MeterPlugin]] = \
         dict(token_visits=SojournTimePlugin,
              place_population=TokenCounterPlugin,
              transition_firing=TransitionIntervalPlugin,
              )
 
-    def __init__(self, net_name: str = "net",):
+    def __init__(self, net_name: str = "net", seed: Any = None, profiling: bool = False):
         """ Create a Simulator object.
 
+        All random numbers of the simulator are drawn from independent streams derived from ``seed``:
+        one for choosing among conflicting immediate transitions, one for each net :meth:`compiled <compile>`
+        and one for each timed transition
+        whose distribution is a :mod:`~petsi.distributions` object created without an explicit generator.
+        Distributions given as arbitrary callables draw their random numbers on their own.
+
         :param net_name:    The name of the Petri net
+        :param seed:        An integer seed, a :class:`numpy.random.SeedSequence`, a
+                            :class:`~petsi.distributions.RandomStreams` object, or ``None`` for a fresh seed
+                            from the operating system. Simulators built the same way from the same seed
+                            produce the same results.
+        :param profiling:   Profile the simulations, see :meth:`profile`.
         """
         self._net = Net(net_name)
+        self._seeded_samplers = list()
+        self._compiled_nets = list()
         self._auto_fire = AutoFirePlugin("auto-fire plugin")
-        self._net.register_plugin(self._auto_fire)
+        self._profiler = None
+
+        if profiling:
+            self._profiler = ProfilerPlugin("profiler", self._auto_fire)
+            self._net.register_plugin(self._profiler)
+
+        self._register_plugin(self._auto_fire)
         self._meters = dict()
-        self._need_more_observations = list()
+        self._batch_means = None
+        self._tracer = None
+        self.reseed(seed)
+
+    def _register_plugin(self, plugin: AbstractPlugin):
+        self._net.register_plugin(plugin if self._profiler is None else self._profiler.profiled(plugin))
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any], seed: Any = None, profiling: bool = False) -> "Simulator":
+        """ Create a simulator for the net described by ``spec``.
+
+        :param spec: The description of the net, as returned by :meth:`to_spec`.
+        :param seed: The seed of the random streams, see :meth:`__init__`.
+        :param profiling: Profile the simulations, see :meth:`__init__`.
+        :return: The simulator created, without any observation streams.
+        """
+        simulator = cls(spec["name"], seed, profiling)
+        build_from_spec(simulator, spec)
+        return simulator
+
+    def reseed(self, seed: Any = None):
+        """ Replace the random streams of the simulator.
+
+        The streams are assigned in the same order as at construction time, hence a simulator reseeded with
+        a seed behaves the same as one built with that seed. This allows building a net once and
+        running several independent replications with it. The nets :meth:`compiled <compile>` earlier
+        are reseeded as well.
+
+        :param seed: The seed for the new streams, see :meth:`__init__`.
+        """
+        self._random_streams = seed if isinstance(seed, RandomStreams) else RandomStreams(seed)
+        self._auto_fire.set_generator(self._random_streams.generator())
+        # Taken at a fixed position, so that compiling the net does not shift the streams of the samplers
+        self._compiled_net_streams, = self._random_streams.spawn(1)
+
+        for sampler in self._seeded_samplers:
+            sampler.set_generator(self._random_streams.generator())
+
+        for compiled_net in self._compiled_nets:
+            compiled_net.set_generator(self._compiled_net_streams.generator())
 
     def observe(self,
                 places: Optional[Iterable[str]] = None,
                 transitions: Optional[Iterable[str]] = None,
                 token_types: Optional[Iterable[str]] = None,
+                summary: bool = False,
+                histogram: Optional[int] = None,
+                sojourn_buckets: Union[None, Buckets, Dict[str, Buckets]] = None,
+                detect_warm_up: bool = False,
                 **required_observations: int,
                 ) -> Tuple[Callable[[], Dict[str, array]], ...]:
         """ Create one or more observation streams.
@@ -91,6 +171,27 @@ class Simulator:
                         This parameter is ignored for the ``token_visits`` and ``place_population`` streams.
         :param token_types: The type of tokens to observe. Observes all types when set to ``None``.
                         This parameter is ignored for the ``transition_firing`` and ``place_population`` streams.
+        :param summary: Summarize the observations online instead of collecting them one by one. The callables
+                        then return the count, mean, variance, minimum, maximum and quantile estimates of the
+                        observations, one row per place or transition, and the memory used does not grow with the
+                        number of observations. See :class:`~petsi.plugins._summary.SummaryTable`.
+        :param histogram: The number of buckets in the histograms of the ``place_population`` stream. If set,
+                        the callable of the stream returns the time spent at each token count at each place,
+                        accumulated during the simulation: the rows with the ``count`` of the buckets
+                        ``0 .. histogram - 1`` hold the time spent at that count, the row with ``count == histogram``
+                        the time spent at ``histogram`` or more tokens. ``summary`` is ignored for the stream.
+                        This parameter is ignored for the other streams.
+        :param sojourn_buckets: The buckets of the sojourn time histograms of the ``token_visits`` stream, for all
+                        places or for each place by name. If set, the callable of the stream returns the histograms
+                        of the durations of the visits and of the total time each destroyed token spent at
+                        each place, by place and token type, counted during the simulation. See
+                        :class:`~petsi.plugins._summary.SojournTimeHistograms`. ``summary`` is ignored for the
+                        stream. This parameter is ignored for the other streams.
+        :param detect_warm_up: Detect the end of the warm-up period of each simulation with the MSER-5 rule and
+                        drop the observations before it, see
+                        :meth:`GenericCollector.detect_warm_up() <petsi.plugins._meters.GenericCollector.detect_warm_up>`.
+                        The number of observations dropped is returned by :meth:`truncated_observations`.
+                        Not supported together with ``summary``, ``histogram`` or ``sojourn_buckets``.
         :return:        A tuple of callables returning the observations as a dictionary of Python arrays.
                         The order of the callables matches the order of the stream types in ``required_observations``.
         :raise KeyError: ``required_observations`` got an unexpected stream type.
@@ -103,16 +204,29 @@ class Simulator:
         _transitions = None if transitions is None \
             else frozenset(self._net.transition(t).ordinal for t in transitions)
         _clock = self._auto_fire.clock
+        _sojourn_buckets = sojourn_buckets if sojourn_buckets is None or isinstance(sojourn_buckets, Buckets) \
+            else {self._net.place(p).ordinal: buckets for p, buckets in sojourn_buckets.items()}
 
         get_observations: List[Callable[[], Dict[str, array]]] = list()
         for stream, n in required_observations.items():
             plugin_type = self._meter_plugins[stream]
 
             # Create the plugin
-            plugin: MeterPlugin = plugin_type(stream, n, _places, _token_types, _transitions, _clock)
-            self._net.register_plugin(plugin)
+            if plugin_type is TokenCounterPlugin:
+                options = dict(_histogram_size=histogram)
+            elif plugin_type is SojournTimePlugin:
+                options = dict(_buckets=_sojourn_buckets)
+            else:
+                options = dict()
+
+            plugin: MeterPlugin = plugin_type(stream, n, _places, _token_types, _transitions, _clock, summary,
+                                              **options)
+            if detect_warm_up:
+                plugin.detect_warm_up()
+
+            self._register_plugin(plugin)
             self._meters[stream] = plugin
-            self._need_more_observations.append(plugin.get_need_more_observations())
+            plugin.set_termination(self._auto_fire.termination)
             get_observations.append(plugin.get_observations)
 
         return tuple(get_observations)
@@ -134,8 +248,233 @@ class Simulator:
         for stream, n in required_observations.items():
             self._meters[stream].required_observations = n
 
+    def set_sink(self, stream: str, sink: Optional[Callable[[Dict[str, array]], None]],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """ Hand over the observations of a stream to ``sink`` in chunks, instead of keeping them in memory.
+
+        The sink is called as soon as ``chunk_size`` observations are collected, with a dictionary of arrays like the
+        ones returned by the callables of :func:`observe`. These callables then flush the remaining observations to
+        the sink and return empty arrays. The required number of observations still counts all observations,
+        including the ones handed over to the sink.
+
+        :param stream: The type of the stream, as passed to :func:`observe`.
+        :param sink: A callable accepting the chunks, e.g. a :class:`FileSink`, or ``None`` to keep the
+                    observations in memory again.
+        :param chunk_size: The number of observations in a chunk.
+        :raise KeyError: The stream is not observed.
+        """
+        self._meters[stream].set_sink(sink, chunk_size)
+
+    def truncated_observations(self) -> Dict[str, int]:
+        """ The number of observations dropped from each stream as part of the warm-up period of the last simulation.
+
+        :return: The numbers keyed by the stream type; zero for streams without warm-up detection or
+                 whose warm-up period has not ended yet.
+        """
+        return {stream: meter.truncated_observations for stream, meter in self._meters.items()}
+
+    def get_observations(self) -> Dict[str, Dict[str, array]]:
+        """ Retrieve the observations collected in all streams.
+
+        This resets the collectors of the streams, as the callables returned by :func:`observe` do.
+
+        :return: The observations of each stream, keyed by the stream type.
+        """
+        return {stream: meter.get_observations() for stream, meter in self._meters.items()}
+
+    def estimate(self,
+                 mean_sojourn_times: Iterable[str] = (),
+                 throughputs: Iterable[str] = (),
+                 batches: int = 20,
+                 batch_length: float = 1.0,
+                 ):
+        """ Select the metrics to estimate with confidence intervals, by the method of batch means.
+
+        The metrics are used by :meth:`simulate` with ``until_precision``, and their estimates are returned by
+        :meth:`estimates`. See :class:`~petsi.plugins.batchmeans.BatchMeansPlugin`.
+
+        :param mean_sojourn_times: The names of the places to estimate the mean sojourn time of the tokens at.
+        :param throughputs: The names of the transitions to estimate the number of firings per unit time of.
+        :param batches: The minimum number of batches to estimate the metrics from.
+        :param batch_length: The initial length of the batches in simulated time. The length is doubled
+                        whenever the number of batches reaches twice ``batches``.
+        :raise ValueError: The metrics were already selected.
+        :raise KeyError: A place or transition does not exist.
+        """
+        if self._batch_means is not None:
+            raise ValueError("The metrics to estimate are already selected")
+
+        self._batch_means = BatchMeansPlugin(
+            "batch means", self._auto_fire.clock,
+            {name: self._net.place(name).ordinal for name in mean_sojourn_times},
+            {name: self._net.transition(name).ordinal for name in throughputs},
+            batches, batch_length)
+        self._register_plugin(self._batch_means)
+
+    def estimates(self, confidence: float = 0.95) -> Dict[str, Dict[str, Estimate]]:
+        """ The estimates of the metrics selected by :meth:`estimate`, from the last simulation.
+
+        :param confidence: The confidence level of the intervals.
+        :return: The estimates keyed by the kind of the metric (``mean_sojourn_time`` or ``throughput``)
+                 and the name of the place or transition.
+        :raise ValueError: No metrics were selected.
+        """
+        if self._batch_means is None:
+            raise ValueError("No metrics were selected with estimate()")
+
+        return self._batch_means.estimates(confidence)
+
+    def profile(self) -> Profile:
+        """ Report where the time of the last simulation went.
+
+        The profile tells, since the start of the last simulation,
+
+        - the number of firings, enablements and disablements of each transition,
+        - the number of calls to, and the time spent in, the observer callbacks of each plugin of the simulator
+          (e.g. ``before_firing``, ``after_firing``, ``report_arrival_of``) and
+        - the time spent in selecting the transitions to fire, in sampling the durations of the timed transitions
+          and in firing the transitions.
+
+        Printing the profile shows these as tables. See :mod:`petsi.plugins.profiler`.
+
+        :raise ValueError: The simulator was created without ``profiling``.
+        """
+        if self._profiler is None:
+            raise ValueError("Create the simulator with profiling=True to profile the simulations")
+
+        return self._profiler.profile()
+
+    def trace(self, file_name: str, capacity: int = DEFAULT_CAPACITY, tokens: bool = True) -> TracePlugin:
+        """ Record the firings of the transitions and the movements of the tokens into a file.
+
+        Each simulation is recorded as a run in the trace. The observations of the meters can be computed from
+        the trace offline, with :func:`~petsi.plugins.trace.replay`. The net must be complete before the
+        first simulation.
+
+        :param file_name: The file to create or overwrite.
+        :param capacity: The number of events to buffer before writing them to the file.
+        :param tokens: Record the movements of the tokens. Without them only the ``transition_firing``
+                        stream can be replayed.
+        :return: The plugin recording the trace. :meth:`~petsi.plugins.trace.TracePlugin.close` it
+                        to complete the file.
+        :raise ValueError: The simulator is already tracing.
+        """
+        if self._tracer is not None:
+            raise ValueError("The simulator is already tracing")
+
+        self._tracer = TracePlugin("trace", self._net, self._auto_fire.clock, file_name, capacity, tokens)
+        self._register_plugin(self._tracer)
+        return self._tracer
+
+    def checkpoint(self) -> bytes:
+        """ Capture the state of the simulation, for continuing it later with :meth:`restore`.
+
+        The checkpoint holds
+
+        - the marking of the net, including the tags of the tokens and the state of their observers,
+        - the state of the fire control: the simulation time, the deadlines of the enabled timed transitions and
+          the enabled immediate transitions,
+        - the state of the random generators of the simulator and
+        - the state of the plugins, including the observations collected but not retrieved yet.
+
+        The structure of the net, the observation streams and the sinks are not part of the checkpoint.
+        Distributions given as arbitrary callables draw their random numbers on their own, so their state
+        is not captured either.
+
+        :return: The state, pickled and compressed. The tags of the tokens must be picklable.
+        :raise ValueError: The simulator is tracing.
+        """
+        if self._tracer is not None:
+            raise ValueError("A simulator that is tracing cannot be checkpointed")
+
+        state = dict(version=CHECKPOINT_VERSION,
+                     names=net_name_tables(self._net),
+                     marking=self._net.get_marking(),
+                     plugins={plugin.name: plugin.get_state() for plugin in self._net.observers},
+                     samplers={transition.ordinal: transition.sampler.get_state()
+                               for transition in self._net.transitions if transition.is_timed},
+                     )
+        return zlib.compress(pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+
+    def restore(self, checkpoint: bytes):
+        """ Continue from the state captured by :meth:`checkpoint`.
+
+        The simulator must have the same net and the same plugins (e.g. observation streams) as the one
+        checkpointed, but it may be a different simulator object, e.g. in another process. Continue the simulation
+        with :meth:`simulate` passing ``resume=True``.
+
+        :param checkpoint: The checkpoint returned by :meth:`checkpoint`.
+        :raise ValueError: The checkpoint does not match the net or the plugins of the simulator, or the simulator
+                is tracing.
+        """
+        if self._tracer is not None:
+            raise ValueError("A simulator that is tracing cannot be restored")
+
+        state = pickle.loads(zlib.decompress(checkpoint))
+
+        if state["version"] > CHECKPOINT_VERSION:
+            raise ValueError(f"The checkpoint has format version {state['version']}; "
+                             f"this version of PetSi reads versions up to {CHECKPOINT_VERSION}")
+
+        if state["names"] != net_name_tables(self._net):
+            raise ValueError(f"The checkpoint was taken of a different net than '{self._net.name}'")
+
+        plugin_names = [plugin.name for plugin in self._net.observers]
+
+        if list(state["plugins"]) != plugin_names:
+            raise ValueError(f"The checkpoint was taken with the plugins {', '.join(state['plugins'])}; "
+                             f"found {', '.join(plugin_names)}")
+
+        self._reset()
+        self._net.set_marking(state["marking"])
+
+        for plugin in self._net.observers:
+            plugin.set_state(state["plugins"][plugin.name])
+
+        for transition in self._net.transitions:
+            if transition.is_timed:
+                transition.sampler.set_state(state["samplers"][transition.ordinal])
+
+    def warm_up(self, duration: float) -> bytes:
+        """ Run the net from an empty marking for ``duration`` simulated time, then drop the observations
+        collected meanwhile.
+
+        The state reached can be the starting point of many replications, without simulating the transient
+        for each of them: :meth:`restore` the checkpoint returned, :meth:`reseed` the simulator with a random stream
+        of its own for each replication, then :meth:`simulate` with ``resume=True``.
+        See also :func:`~petsi.parallel.run_replications`.
+
+        :param duration: The simulated time to run for.
+        :return: The checkpoint of the state reached, see :meth:`checkpoint`.
+        :raise ValueError: The simulator is tracing.
+        """
+        if self._tracer is not None:
+            raise ValueError("A simulator that is tracing cannot be checkpointed")
+
+        self._reset()
+        self._auto_fire.fire_until(duration)
+
+        for meter in self._meters.values():
+            meter.restart()
+
+        if self._batch_means is not None:
+            self._batch_means.restart()
+
+        return self.checkpoint()
+
     def need_more_observations(self) -> bool:
-        return any(map(lambda c: c(), self._need_more_observations))
+        return not self._auto_fire.termination.done
+
+    def _reset(self):
+        # Removing the tokens left over by a previous run disables transitions, possibly timed ones
+        # that are not due. Putting the fire control in build mode first makes it just record these events.
+        self._auto_fire.reset()
+
+        # The removal of the tokens is not part of any run of the trace
+        if self._tracer is not None:
+            self._tracer.pause()
+
+        self._net.reset()
 
     def fire_repeatedly(self, count_of_firings: int):
         """ Fire ``count_of_firings`` transitions.
@@ -144,18 +483,85 @@ class Simulator:
 
         The actual number of firings performed may be less if the enabled transitions are exhausted.
         """
-        self._net.reset()
+        self._reset()
         self._auto_fire.fire_repeatedly(count_of_firings)
 
-    def simulate(self):
+    def simulate(self,
+                 until_precision: Optional[float] = None,
+                 confidence: float = 0.95,
+                 max_time: float = inf,
+                 resume: bool = False,
+                 ):
         """ Run a simulation using the Petri net.
 
         The net will keep firing transitions until all transitions get disabled or the required number of
         observations have been collected (see the ``required_observations`` parameter in :func:`observe()`
         and :func:`required_observations()`).
+
+        With ``until_precision`` the simulation stops instead when the confidence intervals of all the metrics
+        selected by :meth:`estimate` are narrow enough, or when the simulated time reaches ``max_time``.
+        The observation streams keep collecting observations in the meantime. The estimates can be retrieved
+        with :meth:`estimates`.
+
+        :param until_precision: The target half width of the confidence intervals, relative to the estimates.
+        :param confidence:  The confidence level of the intervals.
+        :param max_time:    The simulated time to stop at, even if the target precision is not reached.
+        :param resume:      Continue from the current state, e.g. the end of the previous simulation or a state
+                            :meth:`restored <restore>`, instead of starting from an empty net at time zero.
+        :raise ValueError: ``until_precision`` is given but no metrics were selected with :meth:`estimate`.
         """
-        self._net.reset()
-        self._auto_fire.fire_while(self.need_more_observations)
+        if until_precision is not None and self._batch_means is None:
+            raise ValueError("Select the metrics to estimate with estimate() before simulating until a precision")
+
+        if not resume:
+            self._reset()
+
+        if until_precision is None:
+            self._auto_fire.fire_until_done()
+            return
+
+        read_clock = self._auto_fire.clock.read
+        batch_start = read_clock()
+
+        while True:
+            self._auto_fire.fire_until(min(batch_start + self._batch_means.batch_length, max_time))
+            now = read_clock()
+            self._batch_means.close_batch(now - batch_start)
+            batch_start = now
+
+            if now >= max_time or self._batch_means.is_precise(until_precision, confidence):
+                break
+
+    @property
+    def random_streams(self) -> RandomStreams:
+        """ The source of the random generators used by the simulator.
+
+        Use :meth:`RandomStreams.spawn() <petsi.distributions.RandomStreams.spawn>` to derive independent
+        seeds for further simulators, e.g. for replications.
+        """
+        return self._random_streams
+
+    def add_timed_transition(self, name: str, distribution: Callable[[], float]) -> Transition:
+        transition = self._net.add_timed_transition(name, distribution)
+        sampler = transition.sampler
+
+        if not sampler.has_own_generator:
+            sampler.set_generator(self._random_streams.generator())
+            self._seeded_samplers.append(sampler)
+
+        return transition
+
+    add_timed_transition.__doc__ = Net.add_timed_transition.__doc__
+
+    def compile(self) -> "CompiledNet":
+        """ Freeze the structure of the net into a :class:`~petsi._compiled.CompiledNet`.
+
+        See :meth:`Net.compile() <petsi._structure.Net.compile>`. The compiled net gets its own random stream,
+        which is replaced by :meth:`reseed`.
+        """
+        compiled_net = self._net.compile(self._compiled_net_streams.generator())
+        self._compiled_nets.append(compiled_net)
+        return compiled_net
 
     @property
     def net(self) -> Net:
@@ -202,8 +608,6 @@ class Simulator:
     # noinspection PyArgumentList
     add_immediate_transition = _delegate_to(Net.add_immediate_transition)
     # noinspection PyArgumentList
-    add_timed_transition = _delegate_to(Net.add_timed_transition)
-    # noinspection PyArgumentList
     add_constructor = _delegate_to(Net.add_constructor)
     # noinspection PyArgumentList
     add_transfer = _delegate_to(Net.add_transfer)
@@ -213,6 +617,8 @@ class Simulator:
     add_test = _delegate_to(Net.add_test)
     # noinspection PyArgumentList
     add_inhibitor = _delegate_to(Net.add_inhibitor)
+    # noinspection PyArgumentList
+    to_spec = _delegate_to(Net.to_spec)
 
 
 def save_array(a: array, file_name_prefix: str, ):
@@ -285,31 +691,50 @@ def load_array(file_name_prefix: str, a: Optional[array] = None, typecode: Optio
 def load_observations(file_name_prefix: str, ) -> Dict[str, array]:
     observations: Dict[str, array] = dict()
 
-    for file_name in glob(f"{file_name_prefix}_*.array_*"):
-        m = re.match(".*_(?P<metric_name>[^_]+)\\.array_.", file_name)
+    for file_name in glob(f"{glob_escape(file_name_prefix)}_*.array_*"):
+        m = re.match(f"{re.escape(file_name_prefix)}_(?P<metric_name>.+)\\.array_(?P<typecode>.)$", file_name)
 
         if m is None:
             raise ValueError(f"{file_name} contains no metric name")
 
         metric_name = m.group('metric_name')
-        observations[metric_name] = load_array(file_name)
+        observations[metric_name] = load_array(f"{file_name_prefix}_{metric_name}", typecode=m.group('typecode'))
 
     return observations
 
 
-def flatten_observations(observations: Iterable[Dict[str, array]]) -> Dict[str, array]:
-    transposed = defaultdict(list)
+class FileSink:
+    """ An observation sink appending the chunks it receives to files, one file for each column.
+
+    The files are named and formatted as by :func:`save_observations`, so they can be read back
+    with :func:`load_observations`. Existing files with the same names are overwritten by the first chunk.
+
+    :param file_name_prefix: The common prefix of the names of the files.
+    """
+    _file_name_prefix: str
+    _columns_written: Set[str]
 
-    for metric_dict in observations:
-        for metric_name, value_array in metric_dict.items():
-            transposed[metric_name].append(value_array)
+    def __init__(self, file_name_prefix: str):
+        self._file_name_prefix = file_name_prefix
+        self._columns_written = set()
 
-    def concatenate(a: array, b: array) -> array:
-        a.extend(b)
-        return a
+    def __call__(self, chunk: Dict[str, array]):
+        for column_name, column in chunk.items():
+            mode = "ab" if column_name in self._columns_written else "wb"
 
-    flat_observations: Dict[str, array] = dict()
-    for metric_name, value_array_list in transposed.items():
-        flat_observations[metric_name] = reduce(concatenate, value_array_list)
+            with open(f"{self._file_name_prefix}_{column_name}.array_{column.typecode}", mode) as file:
+                column.tofile(file)
 
-    return flat_observations
+            self._columns_written.add(column_name)
+
+
+def flatten_observations(observations: Iterable[Dict[str, array]]) -> Dict[str, array]:
+    """ Concatenate batches of observations of the same stream.
+
+    The batches are not modified; each column of the result is allocated and copied once,
+    see :class:`~petsi.observations.ChunkedObservations`.
+
+    :param observations: The batches, each a dictionary of columns with the same names.
+    :return: The concatenated columns, keyed by name.
+    """
+    return ChunkedObservations(observations).materialize()
@@ -2,7 +2,8 @@
 # Import setuptools before Cython, otherwise, both might disagree about the class to use
 # See https://cython.readthedocs.io/en/latest/src/userguide/source_files_and_compilation.html
 
-from setuptools import setup, find_packages, Extension
+from setuptools import setup, find_packages
+from Cython.Build import cythonize
 import os
 import sys
 
@@ -11,12 +12,17 @@ package_name = "petsi"
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
-cythonized_modules = ["_structure",
+cythonized_modules = ["_distributions",
+                      "_structure",
+                      "_compiled",
+                      "plugins/_summary",
                       "plugins/_meters",
                       "plugins/sojourntime/_sojourntime",
                       "plugins/tokencounter/_tokencounter",
                       "plugins/transitioninterval/_transitioninterval",
                       "plugins/autofire/_autofire",
+                      "plugins/batchmeans/_batchmeans",
+                      "plugins/trace/_trace",
                       ]
 
 
@@ -29,39 +35,31 @@ def modules_with_prefix_suffix(modules, prefix, suffix):
 
 
 package_data = (
-    modules_with_suffix(cythonized_modules, ".c") +
     modules_with_suffix(cythonized_modules, ".pxd") +
     # modules_with_suffix(cythonized_modules, ".html") +
     modules_with_suffix(cythonized_modules, ".pyi")
 )
 
-extension_args = dict()
+# The *.c files are not shipped: they are generated from the *.py and *.pxd files at build time, so that
+# the extension modules never lag behind the pure Python modules. Cython is a build requirement in pyproject.toml.
 
-# We only cythonize in development mode, i.e. when
+# In development mode, i.e. when
 #
 #   setup.py develop
 #
-# is run. Otherwise we compile the shipped *.c files
-if 'develop' in sys.argv and "--uninstall" not in sys.argv:
-    from Cython.Build import cythonize
-
-    extension_args.update(
-        # Command line for the manual cythonization of individual modules use (on the example of _meters.py):
-        #
-        #    cythonize --3str -a -f -i petsi/_meters.py
-        #
-        ext_modules=cythonize([os.path.join(package_name, module_name + ".py")
-                               for module_name in cythonized_modules
-                               ],
-                              force=True, annotate=True, language_level="3str"),
-    )
-else:
-    extension_args.update(
-        ext_package=package_name,
-        ext_modules=[Extension(module_name, [os.path.join(package_name, module_name + ".c")])
-                     for module_name in cythonized_modules
-                     ],
-    )
+# is run, all the modules are cythonized and annotated
+is_develop = 'develop' in sys.argv and "--uninstall" not in sys.argv
+
+extension_args = dict(
+    # Command line for the manual cythonization of individual modules use (on the example of _meters.py):
+    #
+    #    cythonize --3str -a -f -i petsi/_meters.py
+    #
+    ext_modules=cythonize([os.path.join(package_name, module_name + ".py")
+                           for module_name in cythonized_modules
+                           ],
+                          force=is_develop, annotate=is_develop, language_level="3str"),
+)
 
 setup(
     name='petsi',
@@ -90,7 +88,11 @@ setup(
     install_requires=["more-itertools>=8.2.0",
                       "graphviz~=0.14",
                       ],
-    packages=find_packages(),
+    extras_require={
+        # Block sampling of the built-in distributions; falls back to the random module without it
+        "numpy": ["numpy>=1.17"],
+    },
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     package_data={
         'petsi': package_data,
     },
@@ -0,0 +1,26 @@
+from unittest import TestCase, main
+
+from benchmarks.models import MODELS, random_net
+from benchmarks.runner import STREAMS, run_benchmarks
+
+
+class BenchmarkTest(TestCase):
+    def test_models_keep_firing(self):
+        for name, create in list(MODELS.items()) + [("random", lambda: random_net(100))]:
+            with self.subTest(model=name):
+                simulator = create()
+                simulator.fire_repeatedly(2000)
+                self.assertGreater(simulator._auto_fire.clock.read(), 0.0)
+
+    def test_results(self):
+        results = run_benchmarks(models=["mmc"], sizes=(100,), firings=500, repeat=1)
+
+        self.assertEqual({result.model for result in results}, {"mmc", "random"})
+        self.assertEqual({result.metric for result in results if result.model == "random"},
+                         {"build_time", "register_plugin_time", "firings_per_second", "peak_memory"} |
+                         {f"meter_overhead.{stream}" for stream in STREAMS})
+        self.assertTrue(all(result.value > 0 for result in results if result.unit))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,12 @@
 import inspect
+import os
+from tempfile import TemporaryDirectory
+from time import perf_counter, sleep
+import pickle
+import statistics
+from collections import defaultdict
+from array import array
+from random import Random
 from unittest import TestCase, main, skipUnless
 from unittest.mock import Mock
 
@@ -7,6 +15,16 @@ from petsi._structure import Net
 from petsi.plugins.autofire import FireControl
 from petsi.plugins.sojourntime import SojournTimePlugin
 from petsi.plugins.tokencounter import TokenCounterPlugin
+from petsi import Simulator
+from petsi.simulation import FileSink, load_observations, flatten_observations
+from petsi.plugins import Buckets
+from petsi.plugins._summary import SummaryTable, VISIT, LIFETIME
+from petsi.plugins._meters import mser_truncation_point, DEFAULT_WARM_UP_CHECK, DEFAULT_MAX_WARM_UP_CHECK
+from petsi.observations import save_columnar, load_columnar, ChunkedObservations
+from petsi.parallel import run_replications, SharedObservations
+from petsi.plugins.trace import Trace, replay
+from petsi.distributions import Exponential, Deterministic, Uniform, Erlang, LogNormal, Empirical, \
+    FunctionDistribution
 
 
 class FireControlTest(TestCase):
@@ -102,6 +120,744 @@ class AutoFireTest(TestCase):
 
         self.auto_fire.fire_repeatedly(1000)
 
+    def test_weighted_selection(self):
+        self.auto_fire.set_generator(Random(1))
+        self.net.add_place("waiting", "my type", "FIFO")
+        self.net.add_timed_transition("source", lambda: 1.0)
+        self.net.add_constructor("arrivals", "source", "waiting")
+        routed = list()
+
+        for i in range(1, 5):
+            routed.append(self.net.add_place(f"routed {i}", "my type", "FIFO"))
+            self.net.add_immediate_transition(f"route {i}", 1, float(i))
+            self.net.add_transfer(f"routing {i}", "waiting", f"route {i}", f"routed {i}")
+
+        self.auto_fire.fire_repeatedly(4000)
+
+        counts = [len(list(p.tokens)) for p in routed]
+        self.assertEqual(sum(counts), 2000)
+        for i, count in enumerate(counts, 1):
+            self.assertAlmostEqual(count / 2000, i / 10, delta=0.03)
+
+    def build_queue(self):
+        self.net.add_place("waiting", "my type", "FIFO")
+        self.net.add_timed_transition("source", lambda: 2.0)
+        self.net.add_constructor("arrivals", "source", "waiting")
+        self.net.add_timed_transition("sink", lambda: 1.0)
+        self.net.add_destructor("departures", "waiting", "sink", )
+
+    def test_firing_limits(self):
+        self.build_queue()
+        self.auto_fire.fire_until(10.0)
+        self.assertEqual(self.auto_fire.clock.read(), 10.0)
+
+        fire_control = self.auto_fire._fire_control
+        self.assertEqual(fire_control.fire_many(float("inf"), 4, False), 4)
+        self.assertEqual(self.auto_fire.clock.read(), 14.0)
+        self.assertEqual(fire_control.fire_many(14.0, 4, False), 0)
+        fire_control.fire_next()
+        self.assertEqual(self.auto_fire.clock.read(), 15.0)
+
+    def test_termination(self):
+        self.build_queue()
+        termination = self.auto_fire.termination
+        self.assertTrue(termination.done)
+
+        self.token_counter.set_termination(termination)
+        self.sojourn_time.set_termination(termination)
+        self.assertEqual(termination.pending, 2)
+
+        self.auto_fire.fire_until_done()
+        self.assertTrue(termination.done)
+        self.assertFalse(self.token_counter.get_need_more_observations()())
+        self.assertEqual(len(self.sojourn_time.get_observations()["duration"]), 10)
+        self.assertEqual(termination.pending, 1)
+
+        self.sojourn_time.required_observations = 0
+        self.assertEqual(termination.pending, 0)
+        self.token_counter.set_termination(None)
+        self.assertTrue(termination.done)
+
+
+class SimulatorTest(TestCase):
+    def setUp(self):
+        self.simulator = self.create_simulator()
+
+    @staticmethod
+    def create_simulator(profiling: bool = False) -> Simulator:
+        simulator = Simulator("test net", profiling=profiling)
+        simulator.add_place("waiting")
+        simulator.add_place("idle")
+        simulator.add_place("busy")
+        simulator.add_immediate_transition("open", 2)
+        simulator.add_inhibitor("only once", "busy", "open")
+        simulator.add_inhibitor("never again", "idle", "open")
+        simulator.add_constructor("server", "open", "idle")
+        simulator.add_timed_transition("arrival", lambda: 1.0)
+        simulator.add_constructor("arrivals", "arrival", "waiting")
+        simulator.add_immediate_transition("start", 1)
+        simulator.add_destructor("enter", "waiting", "start")
+        simulator.add_transfer("seize", "idle", "start", "busy")
+        simulator.add_timed_transition("service", lambda: 0.5)
+        simulator.add_transfer("release", "busy", "service", "idle")
+        return simulator
+
+    def test_simulate_black_dot_net(self):
+        get_place_population, = self.simulator.observe(place_population=20)
+        self.simulator.simulate()
+        self.assertGreaterEqual(len(get_place_population()["count"]), 20)
+
+    def test_observing_black_dot_tokens(self):
+        get_token_visits, = self.simulator.observe(token_visits=10)
+        self.simulator.simulate()
+        token_visits = get_token_visits()
+        self.assertGreaterEqual(len(token_visits["duration"]), 10)
+        self.assertEqual(set(token_visits["place"]), {0, 1, 2})
+
+    def test_sink(self):
+        get_token_visits, = self.simulator.observe(token_visits=50)
+        chunks = list()
+        self.simulator.set_sink("token_visits", chunks.append, 7)
+        self.simulator.simulate()
+
+        self.assertGreaterEqual(sum(len(chunk["duration"]) for chunk in chunks), 49)
+        self.assertTrue(all(len(chunk["duration"]) == 7 for chunk in chunks))
+        self.assertEqual(len(get_token_visits()["duration"]), 0)
+        self.assertGreaterEqual(sum(len(chunk["duration"]) for chunk in chunks), 50)
+
+    def test_file_sink(self):
+        get_token_visits, = self.simulator.observe(token_visits=50)
+
+        with TemporaryDirectory() as directory:
+            prefix = os.path.join(directory, "visits")
+            self.simulator.set_sink("token_visits", FileSink(prefix), 8)
+            self.simulator.simulate()
+            get_token_visits()
+            observations = load_observations(prefix)
+
+        self.assertEqual(set(observations), {"token_id", "token_type", "start_time", "visit_number", "place",
+                                             "duration"})
+        self.assertGreaterEqual(len(observations["token_id"]), 50)
+        self.assertEqual(observations["token_id"].typecode, "Q")
+
+    def test_columnar_file(self):
+        get_token_visits, = self.simulator.observe(token_visits=50)
+        self.simulator.simulate()
+        observations = get_token_visits()
+
+        with TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "visits.petsi")
+            save_columnar(file_name, observations, net=self.simulator.net, parameters=dict(seed=42))
+
+            with load_columnar(file_name) as loaded:
+                self.assertEqual(loaded.to_arrays(), observations)
+                self.assertEqual(loaded.parameters, dict(seed=42))
+                self.assertEqual(loaded.names["places"], [place.name for place in self.simulator.net.places])
+
+            with load_columnar(file_name, columns=["place", "duration"]) as loaded:
+                self.assertEqual(set(loaded.columns), {"place", "duration"})
+                self.assertIsInstance(loaded.columns["duration"], memoryview)
+                self.assertEqual(loaded.columns["duration"].tolist(), observations["duration"].tolist())
+
+            with self.assertRaises(KeyError):
+                load_columnar(file_name, columns=["no such column"])
+
+            with open(file_name, "r+b") as file:
+                file.write(b"NOTPETSI")
+
+            with self.assertRaises(ValueError):
+                load_columnar(file_name)
+
+    def test_summary_mode(self):
+        get_visits, get_population, get_firings = self.simulator.observe(
+            summary=True, token_visits=1000, place_population=1000, transition_firing=1000)
+        self.simulator.simulate()
+
+        visits = get_visits()
+        self.assertEqual(set(visits), {"place", "count", "weight", "mean", "variance", "minimum", "maximum",
+                                       "p50", "p90", "p99"})
+        self.assertGreaterEqual(sum(visits["count"]), 1000)
+
+        for row in range(len(visits["place"])):
+            self.assertLessEqual(visits["minimum"][row], visits["p50"][row])
+            self.assertLessEqual(visits["p50"][row], visits["p99"][row])
+            self.assertLessEqual(visits["p99"][row], visits["maximum"][row])
+
+        population = get_population()
+        self.assertNotIn("p50", population)
+        self.assertEqual(len(population["place"]), len(self.simulator.net.places))
+        self.assertEqual(set(get_firings()["transition"]), {t.ordinal for t in self.simulator.net.transitions})
+
+        with self.assertRaises(ValueError):
+            self.simulator.set_sink("token_visits", list.append)
+
+    def test_population_histograms(self):
+        get_rows, = self.simulator.observe(place_population=1000)
+        self.simulator.simulate()
+        rows = get_rows()
+
+        simulator = self.create_simulator()
+        get_histograms, = simulator.observe(histogram=3, place_population=1000)
+        simulator.simulate()
+        histograms = get_histograms()
+
+        self.assertEqual(set(histograms), {"place", "count", "weight", "fraction"})
+        self.assertEqual(len(histograms["place"]), 4 * len(simulator.net.places))
+
+        expected = defaultdict(float)
+
+        for place, count, duration in zip(rows["place"], rows["count"], rows["duration"]):
+            expected[place, min(count, 3)] += duration
+
+        for place, count, weight in zip(histograms["place"], histograms["count"], histograms["weight"]):
+            self.assertAlmostEqual(weight, expected[place, count])
+
+    def test_sojourn_time_histograms(self):
+        get_rows, = self.simulator.observe(token_visits=1000)
+        self.simulator.simulate()
+        rows = get_rows()
+
+        simulator = self.create_simulator()
+        buckets = Buckets(0.1, 10.0, 20, logarithmic=True)
+        get_histograms, = simulator.observe(sojourn_buckets=dict(waiting=buckets, busy=buckets), token_visits=1000)
+        simulator.simulate()
+        histograms = get_histograms()
+
+        waiting, busy = simulator.net.place("waiting").ordinal, simulator.net.place("busy").ordinal
+        self.assertEqual(set(histograms["place"]), {waiting, busy})
+        self.assertEqual(set(histograms["kind"]), {VISIT, LIFETIME})
+
+        expected = defaultdict(int)
+
+        for place, duration in zip(rows["place"], rows["duration"]):
+            if place in (waiting, busy):
+                expected[place, buckets.bucket_of(duration)] += 1
+
+        for kind, place, bucket, lower, upper, count in zip(
+                histograms["kind"], histograms["place"], histograms["bucket"],
+                histograms["lower"], histograms["upper"], histograms["count"]):
+            if kind == VISIT:
+                self.assertEqual(count, expected[place, bucket])
+                self.assertEqual((lower, upper), buckets.bounds(bucket))
+
+    def test_profile(self):
+        with self.assertRaises(ValueError):
+            self.simulator.profile()
+
+        simulator = self.create_simulator(profiling=True)
+        simulator.observe(transition_firing=20)
+        simulator.simulate()
+        profile = simulator.profile()
+
+        transitions = profile.transitions
+        self.assertEqual(transitions["open"].firings, 1)
+        # The simulation may stop between an arrival and the start of its service
+        self.assertIn(transitions["arrival"].firings - transitions["start"].firings, (0, 1))
+        self.assertEqual(transitions["start"].enablements, transitions["arrival"].firings)
+
+        firings = sum(transition.firings for transition in transitions.values())
+        self.assertEqual(profile.callbacks["transition_firing"]["after_firing"].calls, firings)
+        self.assertEqual(profile.callbacks["auto-fire plugin"]["before_firing"].calls, firings)
+        self.assertGreater(profile.firing_times["firing"], profile.callbacks["transition_firing"]["after_firing"].seconds)
+        self.assertIn("service", str(profile))
+
+    def test_profile_buckets_do_not_overlap(self):
+        def slow_duration():
+            sleep(0.002)
+            return 1.0
+
+        simulator = Simulator("slow sampling", profiling=True)
+        simulator.add_place("waiting")
+        simulator.add_timed_transition("arrival", slow_duration)
+        simulator.add_constructor("arrivals", "arrival", "waiting")
+        simulator.add_timed_transition("service", lambda: 0.5)
+        simulator.add_destructor("departures", "waiting", "service")
+        simulator.observe(transition_firing=20)
+
+        start = perf_counter()
+        simulator.simulate()
+        elapsed = perf_counter() - start
+        firing_times = simulator.profile().firing_times
+
+        # The arrivals are rescheduled while firing them, yet their sampling is not counted as firing
+        self.assertGreater(firing_times["sampling"], 10 * 0.002)
+        self.assertLess(firing_times["firing"], firing_times["sampling"])
+        self.assertLessEqual(sum(firing_times.values()), elapsed)
+
+    def test_trace_replay(self):
+        self.simulator.observe(token_visits=30, place_population=30, transition_firing=30)
+
+        with TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "run.trace")
+            tracer = self.simulator.trace(file_name, capacity=16)
+            runs = list()
+
+            for _ in range(2):
+                self.simulator.simulate()
+                runs.append(self.simulator.get_observations())
+
+            tracer.close()
+            replayed = replay(file_name, "token_visits", "place_population", "transition_firing")
+
+            self.assertEqual(len(replayed), 2)
+            self.assertEqual(replayed, runs)
+            self.assertEqual(Trace(file_name).names["places"], [place.name for place in self.simulator.net.places])
+
+            summary, = replay(file_name, "transition_firing", transitions=["arrival"], summary=True)[1:]
+            self.assertEqual(summary["transition_firing"]["transition"].tolist(),
+                             [self.simulator.net.transition("arrival").ordinal])
+            self.assertEqual(summary["transition_firing"]["count"][0], runs[1]["transition_firing"]["transition"]
+                             .tolist().count(self.simulator.net.transition("arrival").ordinal))
+
+    def test_trace_without_tokens(self):
+        with TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "run.trace")
+            tracer = self.simulator.trace(file_name, tokens=False)
+            self.simulator.fire_repeatedly(20)
+            tracer.close()
+
+            firings, = replay(file_name, "transition_firing")
+            self.assertEqual(len(firings["transition_firing"]["interval"]), 20)
+
+            with self.assertRaises(ValueError):
+                replay(file_name, "token_visits")
+
+    def test_token_observers_of_destroyed_tokens_are_released(self):
+        get_token_visits, = self.simulator.observe(token_visits=100)
+        self.simulator.simulate()
+        plugin = self.simulator._meters["token_visits"]
+        live_tokens = sum(len(list(place.tokens)) for place in self.simulator.net.places)
+        self.assertEqual(len(plugin._token_observers), live_tokens)
+        self.assertLess(live_tokens, 10)
+
+    def test_seeded_simulators_are_reproducible(self):
+        def simulate(seed):
+            simulator = Simulator("test net", seed)
+            simulator.add_place("waiting")
+            simulator.add_timed_transition("arrival", Exponential(1.0))
+            simulator.add_constructor("arrivals", "arrival", "waiting")
+            simulator.add_timed_transition("service", Uniform(0.5, 1.0))
+            simulator.add_destructor("departures", "waiting", "service")
+            get_token_visits, = simulator.observe(token_visits=100)
+            simulator.simulate()
+            return list(get_token_visits()["duration"])
+
+        self.assertEqual(simulate(42), simulate(42))
+        self.assertNotEqual(simulate(42), simulate(43))
+
+    def test_simulate_until_precision(self):
+        simulator = Simulator("open queue", 42)
+        simulator.add_place("waiting")
+        simulator.add_timed_transition("arrival", Exponential(1.0))
+        simulator.add_constructor("arrivals", "arrival", "waiting")
+        simulator.add_timed_transition("service", Exponential(2.0))
+        simulator.add_destructor("departures", "waiting", "service")
+        simulator.estimate(mean_sojourn_times=["waiting"], throughputs=["arrival"])
+
+        with self.assertRaises(ValueError):
+            simulator.estimate(throughputs=["service"])
+
+        simulator.simulate(until_precision=0.05)
+        estimates = simulator.estimates()
+        throughput = estimates["throughput"]["arrival"]
+        sojourn_time = estimates["mean_sojourn_time"]["waiting"]
+        self.assertLessEqual(throughput.relative_half_width, 0.05)
+        self.assertLessEqual(sojourn_time.relative_half_width, 0.05)
+        self.assertGreaterEqual(throughput.batches, 20)
+        self.assertAlmostEqual(throughput.mean, 1.0, delta=0.1)
+        self.assertAlmostEqual(sojourn_time.mean, 1.0, delta=0.15)   # M/M/1 with rho = 0.5
+
+        simulator.simulate(until_precision=1e-6, max_time=50.0)
+        self.assertGreaterEqual(simulator._auto_fire.clock.read(), 50.0)
+        self.assertGreater(simulator.estimates()["throughput"]["arrival"].relative_half_width, 1e-6)
+
+    def test_simulate_until_precision_needs_metrics(self):
+        with self.assertRaises(ValueError):
+            self.simulator.simulate(until_precision=0.1)
+
+    def test_warm_up_detection(self):
+        simulator = Simulator("congested queue", 1)
+        simulator.add_place("waiting")
+        simulator.add_timed_transition("arrival", Exponential(1.0))
+        simulator.add_constructor("arrivals", "arrival", "waiting")
+        simulator.add_timed_transition("service", Exponential(1.1))
+        simulator.add_destructor("departures", "waiting", "service")
+        get_population, = simulator.observe(detect_warm_up=True, place_population=5000)
+
+        simulator.simulate()
+        population = get_population()
+        truncated = simulator.truncated_observations()["place_population"]
+        self.assertGreater(truncated, 0)
+        self.assertGreaterEqual(len(population["count"]), 5000)
+        # The queue starts empty; the observations kept start later
+        self.assertGreater(population["start_time"][0], 0.0)
+
+        with self.assertRaises(ValueError):
+            Simulator("net").observe(summary=True, detect_warm_up=True, token_visits=10)
+
+    def test_warm_up_detection_with_few_required_observations(self):
+        simulator = Simulator("congested queue", 1)
+        simulator.add_place("waiting")
+        simulator.add_timed_transition("arrival", Exponential(1.0))
+        simulator.add_constructor("arrivals", "arrival", "waiting")
+        simulator.add_timed_transition("service", Exponential(1.1))
+        simulator.add_destructor("departures", "waiting", "service")
+        get_population, = simulator.observe(detect_warm_up=True, place_population=DEFAULT_WARM_UP_CHECK - 100)
+
+        simulator.simulate()
+        population = get_population()
+        self.assertGreater(simulator.truncated_observations()["place_population"], 0)
+        self.assertGreaterEqual(len(population["count"]), DEFAULT_WARM_UP_CHECK - 100)
+
+    def test_warm_up_detection_gives_up_on_unstable_systems(self):
+        simulator = Simulator("unstable queue", 0)
+        simulator.add_place("queue")
+        simulator.add_timed_transition("arrive", Exponential(2.0))
+        simulator.add_constructor("arrivals", "arrive", "queue")
+        simulator.add_timed_transition("serve", Exponential(1.0))
+        simulator.add_destructor("departures", "queue", "serve")
+        get_visits, = simulator.observe(places=["queue"], detect_warm_up=True, token_visits=2000)
+
+        # The queue keeps growing, so its sojourn times have no steady state to detect
+        with self.assertWarns(RuntimeWarning):
+            simulator.simulate()
+
+        visits = get_visits()
+        self.assertEqual(simulator.truncated_observations()["token_visits"], 0)
+        self.assertGreaterEqual(len(visits["duration"]), DEFAULT_MAX_WARM_UP_CHECK)
+
+        with self.assertRaises(ValueError):
+            simulator._meters["token_visits"].detect_warm_up(first_check=1000, max_check=500)
+
+    def test_observations_of_undetected_warm_up_period_warn(self):
+        simulator = Simulator("congested queue", 0)
+        simulator.add_place("waiting")
+        simulator.add_timed_transition("arrival", Exponential(1.0))
+        simulator.add_constructor("arrivals", "arrival", "waiting")
+        simulator.add_timed_transition("service", Exponential(1.1))
+        simulator.add_destructor("departures", "waiting", "service")
+        get_population, = simulator.observe(detect_warm_up=True, place_population=10)
+        simulator.estimate(throughputs=["arrival"])
+
+        # Too short for the first attempt to detect the end of the warm-up period
+        simulator.simulate(until_precision=1e-6, max_time=20.0)
+
+        with self.assertWarns(RuntimeWarning):
+            population = get_population()
+
+        self.assertGreater(len(population["count"]), 10)
+        self.assertEqual(simulator.truncated_observations()["place_population"], 0)
+
+    def test_spawned_streams_are_independent(self):
+        first, second = self.simulator.random_streams.spawn(2)
+        self.assertNotEqual(first.generator().random(), second.generator().random())
+
+
+def create_open_queue() -> Simulator:
+    simulator = Simulator("open queue")
+    simulator.add_place("waiting")
+    simulator.add_timed_transition("arrival", Exponential(1.0))
+    simulator.add_constructor("arrivals", "arrival", "waiting")
+    simulator.add_timed_transition("service", Uniform(0.5, 1.0))
+    simulator.add_destructor("departures", "waiting", "service")
+    simulator.observe(token_visits=50)
+    return simulator
+
+
+def create_routed_queues(seed=None) -> Simulator:
+    simulator = Simulator("routed queues", seed)
+    simulator.add_type("job")
+    simulator.add_place("entrance", "job")
+    simulator.add_place("first queue", "job")
+    simulator.add_place("second queue", "job", "LIFO")
+    simulator.add_timed_transition("arrival", Exponential(1.0))
+    simulator.add_constructor("arrivals", "arrival", "entrance")
+    simulator.add_immediate_transition("to first", 1, 2.0)
+    simulator.add_transfer("route first", "entrance", "to first", "first queue")
+    simulator.add_immediate_transition("to second", 1, 1.0)
+    simulator.add_transfer("route second", "entrance", "to second", "second queue")
+    simulator.add_timed_transition("first service", Exponential(0.8))
+    simulator.add_destructor("first departures", "first queue", "first service")
+    simulator.add_timed_transition("second service", Uniform(0.5, 2.5))
+    simulator.add_destructor("second departures", "second queue", "second service")
+    simulator.observe(token_visits=200, place_population=200)
+    simulator.observe(summary=True, transition_firing=200)
+    simulator.estimate(mean_sojourn_times=["first queue"], throughputs=["arrival"])
+    return simulator
+
+
+class CheckpointTest(TestCase):
+    def test_restored_simulation_continues_the_same_way(self):
+        simulator = create_routed_queues(1)
+        simulator.simulate()
+        simulator.get_observations()
+        tokens = [token for place in simulator.net.places for token in place.tokens]
+        self.assertGreater(len(tokens), 0)
+        tokens[0].tags["priority"] = "high"
+        checkpoint = simulator.checkpoint()
+        self.assertIsInstance(checkpoint, bytes)
+
+        simulator.simulate(resume=True)
+        continued = simulator.get_observations()
+
+        restored = create_routed_queues(2)
+        restored.restore(checkpoint)
+        self.assertEqual([token.tags.get("priority") for place in restored.net.places for token in place.tokens],
+                         ["high"] + [None] * (len(tokens) - 1))
+        restored.simulate(resume=True)
+        self.assertEqual(restored.get_observations(), continued)
+
+    def test_restore_keeps_the_observations_not_retrieved(self):
+        simulator = create_routed_queues(3)
+        simulator.simulate()
+        checkpoint = simulator.checkpoint()
+
+        restored = create_routed_queues()
+        restored.restore(checkpoint)
+        self.assertEqual(restored.get_observations(), simulator.get_observations())
+        self.assertEqual(restored._auto_fire.clock.read(), simulator._auto_fire.clock.read())
+
+    def test_restore_checks_the_net(self):
+        simulator = create_routed_queues(4)
+        simulator.simulate()
+        checkpoint = simulator.checkpoint()
+
+        with self.assertRaises(ValueError):
+            create_open_queue().restore(checkpoint)
+
+        with self.assertRaises(ValueError):
+            Simulator.from_spec(simulator.to_spec()).restore(checkpoint)
+
+
+class ParallelTest(TestCase):
+    def test_run_replications(self):
+        sequential = run_replications(create_open_queue, 4, seed=42, processes=1)
+        parallel = run_replications(create_open_queue, 4, seed=42, processes=2)
+        self.assertEqual(set(parallel), {"token_visits"})
+        self.assertGreaterEqual(len(parallel["token_visits"]["duration"]), 4 * 50)
+        self.assertEqual(sequential["token_visits"]["duration"], parallel["token_visits"]["duration"])
+
+    def test_run_replications_in_shared_memory(self):
+        pickled = run_replications(create_open_queue, 4, seed=42, processes=2)
+        shared = run_replications(create_open_queue, 4, seed=42, processes=2, shared_memory=True)
+        self.assertEqual(pickled["token_visits"]["duration"], shared["token_visits"]["duration"])
+        self.assertEqual(pickled["token_visits"]["place"], shared["token_visits"]["place"])
+
+    def test_replications_from_a_warmed_up_state(self):
+        sequential = run_replications(create_open_queue, 4, seed=42, processes=1, warm_up=30.0)
+        parallel = run_replications(create_open_queue, 4, seed=42, processes=2, warm_up=30.0)
+        self.assertEqual(sequential, parallel)
+        self.assertNotEqual(sequential["token_visits"]["duration"],
+                            run_replications(create_open_queue, 4, seed=42, processes=1)["token_visits"]["duration"])
+
+        # The replications start around the end of the warm-up period
+        starts = sequential["token_visits"]["start_time"]
+        self.assertGreater(min(starts), 20.0)
+        self.assertGreaterEqual(len(starts), 4 * 50)
+
+    def test_warm_up(self):
+        simulator = create_open_queue()
+        simulator.reseed(1)
+        checkpoint = simulator.warm_up(20.0)
+        self.assertGreaterEqual(simulator._auto_fire.clock.read(), 20.0)
+        self.assertEqual(len(simulator.get_observations()["token_visits"]["duration"]), 0)
+
+        def replicate(seed):
+            simulator.restore(checkpoint)
+            simulator.reseed(seed)
+            simulator.simulate(resume=True)
+            return list(simulator.get_observations()["token_visits"]["duration"])
+
+        self.assertEqual(replicate(2), replicate(2))
+        self.assertNotEqual(replicate(2), replicate(3))
+
+    def test_shared_observations(self):
+        observations = dict(count=array('Q', [1, 2, 3]), flag=array('b', [1]), duration=array('d', [0.5, 1.5]))
+        shared = pickle.loads(pickle.dumps(SharedObservations.share(observations)))
+        views = shared.attach()
+        self.assertEqual(views["count"].tolist(), [1, 2, 3])
+        self.assertEqual(views["duration"].tolist(), [0.5, 1.5])
+        self.assertTrue(views["flag"].readonly)
+        del views
+        self.assertEqual(shared.to_arrays(), observations)
+        shared.release()
+
+    def test_reseeded_simulator_matches_a_fresh_one(self):
+        simulator = create_open_queue()
+        simulator.reseed(7)
+        simulator.simulate()
+        reseeded = simulator.get_observations()
+
+        simulator = Simulator("open queue", 7)
+        simulator.add_place("waiting")
+        simulator.add_timed_transition("arrival", Exponential(1.0))
+        simulator.add_constructor("arrivals", "arrival", "waiting")
+        simulator.add_timed_transition("service", Uniform(0.5, 1.0))
+        simulator.add_destructor("departures", "waiting", "service")
+        simulator.observe(token_visits=50)
+        simulator.simulate()
+        self.assertEqual(simulator.get_observations(), reseeded)
+
+    def test_reseeding_covers_compiled_nets(self):
+        def create_router(seed):
+            simulator = Simulator("router", seed)
+            simulator.add_place("queue")
+            simulator.add_timed_transition("arrival", Exponential(1.0))
+            simulator.add_constructor("arrivals", "arrival", "queue")
+            simulator.add_immediate_transition("left")
+            simulator.add_destructor("to the left", "queue", "left")
+            simulator.add_immediate_transition("right")
+            simulator.add_destructor("to the right", "queue", "right")
+            compiled = simulator.compile()
+            late = simulator.add_timed_transition("late", Exponential(1.0))
+            return simulator, compiled, late
+
+        simulator, reseeded, reseeded_late = create_router(0)
+        simulator.reseed(7)
+        _, fresh, fresh_late = create_router(7)
+
+        reseeded.fire_until(100.0)
+        fresh.fire_until(100.0)
+        self.assertEqual(reseeded.firing_counts, fresh.firing_counts)
+        self.assertEqual([reseeded_late.sampler.sample() for _ in range(5)],
+                         [fresh_late.sampler.sample() for _ in range(5)])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            run_replications(create_open_queue, 0)
+        with self.assertRaises(ValueError):
+            run_replications(create_open_queue, 1, processes=0)
+        with self.assertRaises(ValueError):
+            run_replications(create_open_queue, 1, warm_up=-1.0)
+
+
+class ChunkedObservationsTest(TestCase):
+    def setUp(self):
+        self.batches = [dict(place=array('L', [1, 2]), duration=array('d', [0.5, 1.5])),
+                        dict(place=array('L', []), duration=array('d', [])),
+                        dict(place=array('L', [3]), duration=memoryview(array('d', [2.5])))]
+
+    def test_concatenated_view(self):
+        observations = ChunkedObservations(self.batches)
+        self.assertEqual(len(observations), 3)
+        durations = observations.columns["duration"]
+        self.assertEqual(list(durations), [0.5, 1.5, 2.5])
+        self.assertEqual((durations[0], durations[2], durations[-1]), (0.5, 2.5, 2.5))
+
+        with self.assertRaises(IndexError):
+            durations[3]
+
+    def test_materialize(self):
+        flat = ChunkedObservations(self.batches).materialize()
+        self.assertEqual(flat, dict(place=array('L', [1, 2, 3]), duration=array('d', [0.5, 1.5, 2.5])))
+
+    def test_inputs_are_not_modified(self):
+        flat = flatten_observations(self.batches)
+        self.assertEqual(len(flat["place"]), 3)
+        self.assertEqual(self.batches[0]["place"], array('L', [1, 2]))
+
+    def test_mismatching_batches(self):
+        observations = ChunkedObservations(self.batches)
+
+        with self.assertRaises(ValueError):
+            observations.append(dict(place=array('L', [4])))
+
+        with self.assertRaises(ValueError):
+            observations.append(dict(place=array('d', [4]), duration=array('d', [4])))
+
+
+class SummaryTest(TestCase):
+    def test_online_statistics(self):
+        values = [Random(i).expovariate(1.0) for i in range(10001)]
+        table = SummaryTable("place")
+
+        for value in values:
+            table.add(2, value, 1.0)
+
+        summary = table.get_observations()
+        self.assertEqual(list(summary["place"]), [2])
+        self.assertEqual(summary["count"][0], len(values))
+        self.assertAlmostEqual(summary["mean"][0], statistics.mean(values))
+        self.assertAlmostEqual(summary["variance"][0], statistics.variance(values))
+        self.assertEqual((summary["minimum"][0], summary["maximum"][0]), (min(values), max(values)))
+
+        for column_name, probability in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+            exact = sorted(values)[int(probability * len(values))]
+            self.assertAlmostEqual(summary[column_name][0], exact, delta=0.05 * exact)
+
+    def test_mser_truncation_point(self):
+        generator = Random(1)
+        transient = [10.0 * 0.99 ** i + generator.random() for i in range(500)]
+        stationary = [generator.random() for _ in range(4500)]
+        truncation_point = mser_truncation_point(transient + stationary)
+        self.assertIsNotNone(truncation_point)
+        self.assertEqual(truncation_point % 5, 0)
+        self.assertTrue(200 <= truncation_point <= 800, truncation_point)
+
+        self.assertIsNone(mser_truncation_point(stationary[:45]))
+        # A trend lasting till the end of the series is not a warm-up period
+        self.assertIsNone(mser_truncation_point([float(i) for i in range(1000)]))
+
+    def test_buckets(self):
+        linear = Buckets(0.0, 1.0, 4)
+        self.assertEqual([linear.bucket_of(x) for x in (-1.0, 0.0, 0.3, 0.99, 1.0)], [0, 1, 2, 4, 5])
+        self.assertEqual(linear.bounds(2), (0.25, 0.5))
+
+        logarithmic = Buckets(1.0, 1000.0, 3, logarithmic=True)
+        self.assertEqual([logarithmic.bucket_of(x) for x in (0.5, 1.0, 9.0, 10.0, 999.0, 1000.0)], [0, 1, 1, 2, 3, 4])
+        self.assertEqual(logarithmic.bounds(4)[1], float("inf"))
+
+        with self.assertRaises(ValueError):
+            Buckets(0.0, 1.0, 4, logarithmic=True)
+
+    def test_weighted_statistics(self):
+        table = SummaryTable("place", weighted=True)
+
+        for count, duration in ((0, 1.0), (2, 3.0), (1, 0.0)):
+            table.add(0, count, duration)
+
+        summary = table.get_observations()
+        self.assertEqual(summary["count"][0], 3)
+        self.assertAlmostEqual(summary["mean"][0], 1.5)
+        self.assertAlmostEqual(summary["variance"][0], 0.75)
+
+
+class DistributionTest(TestCase):
+    def assert_mean_is(self, distribution, mean, delta):
+        samples = [distribution() for _ in range(5000)]
+        self.assertAlmostEqual(sum(samples) / len(samples), mean, delta=delta)
+
+    def test_means(self):
+        for generator in (None, Random(1)):
+            with self.subTest(generator=generator):
+                self.assert_mean_is(Exponential(2.0, generator), 0.5, 0.05)
+                self.assert_mean_is(Deterministic(1.5, generator), 1.5, 0.0)
+                self.assert_mean_is(Uniform(1.0, 3.0, generator, block_size=7), 2.0, 0.05)
+                self.assert_mean_is(Erlang(3, 2.0, generator), 1.5, 0.1)
+                self.assert_mean_is(LogNormal(0.0, 0.5, generator), 1.133, 0.05)
+                self.assert_mean_is(Empirical([1, 2, 2, 3], generator), 2.0, 0.05)
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            Exponential(0.0)
+        with self.assertRaises(ValueError):
+            Erlang(1.5, 1.0)
+        with self.assertRaises(ValueError):
+            Empirical([])
+        with self.assertRaises(ValueError):
+            Uniform(0.0, 1.0, block_size=0)
+
+    def test_transitions_sample_distributions(self):
+        net = Net("test net")
+        function = net.add_timed_transition("function", lambda: 2.5)
+        self.assertIsInstance(function.sampler, FunctionDistribution)
+        self.assertEqual(function.sampler(), 2.5)
+
+        exponential = Exponential(1.0)
+        transition = net.add_timed_transition("exponential", exponential)
+        self.assertIs(transition.distribution, exponential)
+        self.assertIs(transition.sampler, exponential)
+
 
 if __name__ == '__main__':
     main()
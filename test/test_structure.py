@@ -1,5 +1,8 @@
-from petsi._structure import Net, Place
+from petsi._structure import Net, Place, CounterPlace
+from petsi.distributions import Deterministic, Erlang, Empirical
 from inspect import cleandoc
+import json
+import pickle
 from unittest import TestCase, main
 from unittest.mock import Mock
 
@@ -100,6 +103,12 @@ class StructureTest(TestCase):
         observer2.observe_transition.assert_called_with(t1)
         self.assertTrue(observer2.observe_transition.return_value in t1._transition_observers)
 
+        # Observers are notified in the order of registration
+        self.assertEqual(p1._place_observers,
+                         (observer.observe_place.return_value, observer2.observe_place.return_value))
+        self.assertEqual(t1._transition_observers,
+                         (observer.observe_transition.return_value, observer2.observe_transition.return_value))
+
         self.assertEqual(join(observer2.mock_calls),
                          cleandoc("""observe_transition
                                      observe_transition().got_enabled
@@ -133,6 +142,29 @@ class StructureTest(TestCase):
         self.assertTrue(p1.is_empty)
         self.assertTrue(p2.is_empty)
 
+    def test_destroyed_tokens_are_recycled(self):
+        net = Net("test net")
+        net.add_type("my type")
+        p1 = net.add_place("place 1", "my type", "FIFO")
+        source = net.add_immediate_transition("source", 1, 1.)
+        sink = net.add_immediate_transition("sink", 1, 1.)
+        net.add_constructor("arrivals", "source", "place 1")
+        net.add_destructor("departures", "place 1", "sink", )
+
+        source.fire()
+        token, = p1.tokens
+        token.tags["color"] = "red"
+        sink.fire()
+        source.fire()
+        recycled_token, = p1.tokens
+        self.assertIs(recycled_token, token)
+        self.assertEqual(recycled_token.tags, dict())
+
+        # Tokens removed by reset() are recycled, too
+        net.reset()
+        source.fire()
+        self.assertIs(next(p1.tokens), token)
+
     def test_firing_notifies_observers(self):
 
         net = Net("test net")
@@ -263,5 +295,201 @@ class PlaceStabilityTest(TestCase):
             self.net.add_test("d1", "place", "timed_transition")
 
 
+class CounterPlaceTest(TestCase):
+    def setUp(self):
+        self.net = Net("test net")
+        self.idle = self.net.add_place("idle")
+        self.busy = self.net.add_place("busy", queueing_policy_name="LIFO")
+        self.source = self.net.add_immediate_transition("source", 1, 1.)
+        self.seize = self.net.add_immediate_transition("seize", 1, 1.)
+        self.sink = self.net.add_immediate_transition("sink", 1, 1.)
+        self.net.add_constructor("arrivals", "source", "idle")
+        self.net.add_transfer("transfers", "idle", "seize", "busy")
+        self.net.add_destructor("departures", "busy", "sink", )
+
+    def test_black_dot_places_count_tokens(self):
+        self.assertIsInstance(self.idle, CounterPlace)
+        self.assertIsInstance(self.busy, CounterPlace)
+        self.assertNotIsInstance(self.net.add_place("typed", self.net.add_type("my type").name), CounterPlace)
+
+        self.source.fire()
+        self.source.fire()
+        self.assertFalse(self.idle.is_empty)
+        self.assertTrue(self.idle.is_counting)
+        self.seize.fire()
+        self.seize.fire()
+        self.assertTrue(self.idle.is_empty)
+        self.assertTrue(self.sink.is_enabled)
+        self.sink.fire()
+        self.sink.fire()
+        self.assertTrue(self.busy.is_empty)
+        self.assertFalse(self.sink.is_enabled)
+
+    def test_counter_places_notify_observers(self):
+        plugin = Mock()
+        plugin.configure_mock(name='place observer', **{'observes_tokens_of.return_value': False})
+        self.net.register_plugin(plugin)
+        self.assertTrue(self.idle.is_counting)
+
+        self.source.fire()
+        self.seize.fire()
+        place_observer = plugin.observe_place.return_value
+        self.assertEqual(place_observer.report_arrival_of.call_count, 2)
+        self.assertEqual(place_observer.report_departure_of.call_count, 1)
+
+    def test_listing_the_tokens_materializes_the_place(self):
+        self.source.fire()
+        self.source.fire()
+        self.assertEqual(len(list(self.idle.tokens)), 2)
+        self.assertFalse(self.idle.is_counting)
+        self.assertTrue(self.busy.is_counting)
+
+        self.seize.fire()
+        self.assertEqual(len(list(self.idle.tokens)), 1)
+        self.seize.fire()
+        self.assertTrue(self.idle.is_empty)
+        self.assertEqual(list(self.idle.tokens), [])
+
+    def test_plugins_registered_before_the_places_observe_black_dots(self):
+        net = Net("plugin first")
+        plugin = Mock()
+        plugin.configure_mock(name='token observer')
+        net.register_plugin(plugin)
+
+        place = net.add_place("idle")
+        self.assertNotIsInstance(place, CounterPlace)
+        net.add_immediate_transition("source", 1, 1.)
+        net.add_constructor("arrivals", "source", "idle").transition.fire()
+        self.assertEqual(plugin.observe_token.call_count, 1)
+        self.assertEqual(plugin.observe_token.return_value.report_arrival_at.call_count, 1)
+
+    def test_token_observers_materialize_counter_places(self):
+        self.source.fire()
+        self.source.fire()
+
+        plugin = Mock()
+        plugin.configure_mock(name='token observer')
+        self.net.register_plugin(plugin)
+        self.assertFalse(self.idle.is_counting)
+        self.assertEqual(len(list(self.idle.tokens)), 2)
+        self.assertEqual(plugin.observe_token.call_count, 2)
+
+        # New black dot places are not counter places any more
+        self.assertNotIsInstance(self.net.add_place("another"), CounterPlace)
+
+        self.seize.fire()
+        self.sink.fire()
+        token_observer = plugin.observe_token.return_value
+        self.assertEqual(token_observer.report_departure_from.call_count, 2)
+        self.assertEqual(token_observer.report_destruction.call_count, 1)
+
+
+class CompiledNetTest(TestCase):
+    def setUp(self):
+        self.net = Net("test net")
+        self.net.add_place("queue")
+        self.net.add_place("server idle")
+        self.net.add_place("in service")
+        self.net.add_timed_transition("arrival", lambda: 1.0)
+        self.net.add_constructor("arrivals", "arrival", "queue")
+        self.net.add_immediate_transition("open", 2)
+        self.net.add_inhibitor("only once", "server idle", "open")
+        self.net.add_inhibitor("not while serving", "in service", "open")
+        self.net.add_constructor("server", "open", "server idle")
+        self.net.add_immediate_transition("start", 1)
+        self.net.add_transfer("enter", "queue", "start", "in service")
+        self.net.add_destructor("seize", "server idle", "start")
+        self.net.add_timed_transition("service", lambda: 0.5)
+        self.net.add_destructor("leave", "in service", "service")
+        self.net.add_constructor("release", "service", "server idle")
+
+    def test_compile_builds_empty_marking(self):
+        compiled = self.net.compile()
+        self.assertEqual(compiled.place_names, ["queue", "server idle", "in service"])
+        self.assertEqual(compiled.transition_names, ["arrival", "open", "start", "service"])
+        self.assertEqual(compiled.marking, {"queue": 0, "server idle": 0, "in service": 0})
+        self.assertEqual(compiled.current_time, 0.0)
+
+    def test_firing_follows_the_firing_rules(self):
+        compiled = self.net.compile()
+
+        # The immediate transition opens the server, then the first arrival happens at t=1.0
+        self.assertEqual(compiled.fire_repeatedly(2), 2)
+        self.assertEqual(compiled.marking, {"queue": 1, "server idle": 1, "in service": 0})
+        self.assertEqual(compiled.current_time, 1.0)
+
+        # The customer seizes the server and leaves 0.5 time units later
+        compiled.fire_repeatedly(1)
+        self.assertEqual(compiled.marking, {"queue": 0, "server idle": 0, "in service": 1})
+        compiled.fire_repeatedly(1)
+        self.assertEqual(compiled.marking, {"queue": 0, "server idle": 1, "in service": 0})
+        self.assertEqual(compiled.current_time, 1.5)
+        self.assertEqual(compiled.firing_counts, {"arrival": 1, "open": 1, "start": 1, "service": 1})
+
+        compiled.fire_until(10.0)
+        self.assertEqual(compiled.current_time, 10.0)
+        self.assertEqual(compiled.firing_counts, {"arrival": 10, "open": 1, "start": 9, "service": 9})
+        self.assertEqual(compiled.marking, {"queue": 1, "server idle": 1, "in service": 0})
+
+        compiled.reset()
+        self.assertEqual(compiled.current_time, 0.0)
+        self.assertEqual(compiled.marking, {"queue": 0, "server idle": 0, "in service": 0})
+        self.assertEqual(sum(compiled.firing_counts.values()), 0)
+
+    def test_firing_stops_when_transitions_are_exhausted(self):
+        net = Net("test net")
+        net.add_place("place")
+        net.add_immediate_transition("source")
+        net.add_inhibitor("once", "place", "source")
+        net.add_constructor("token", "source", "place")
+        compiled = net.compile()
+        self.assertEqual(compiled.fire_repeatedly(10), 1)
+        self.assertEqual(compiled.marking, {"place": 1})
+
+
+class SpecTest(TestCase):
+    def setUp(self):
+        self.net = Net("test net")
+        self.net.add_type("job")
+        self.net.add_place("queue", "job", "LIFO")
+        self.net.add_place("server idle")
+        self.net.add_place("in service", "job")
+        self.net.add_timed_transition("arrival", Erlang(2, 4.0))
+        self.net.add_constructor("arrivals", "arrival", "queue")
+        self.net.add_immediate_transition("open", 2, 0.5)
+        self.net.add_inhibitor("only once", "server idle", "open")
+        self.net.add_test("after arrival", "queue", "open")
+        self.net.add_constructor("server", "open", "server idle")
+        self.net.add_immediate_transition("start", 1)
+        self.net.add_transfer("enter", "queue", "start", "in service")
+        self.net.add_destructor("seize", "server idle", "start")
+        self.net.add_timed_transition("service", Empirical([0.25, 0.5]))
+        self.net.add_destructor("leave", "in service", "service")
+        self.net.add_constructor("release", "service", "server idle")
+
+    def test_round_trip(self):
+        spec = self.net.to_spec()
+        self.assertEqual(spec["types"], ["job"])
+        self.assertEqual(spec["places"][0], dict(name="queue", type="job", queueing_policy="LIFO"))
+        self.assertEqual(spec["transitions"][0]["distribution"], dict(type="erlang", k=2, rate=4.0))
+
+        # The spec survives JSON and pickle
+        self.assertEqual(json.loads(json.dumps(spec)), spec)
+        self.assertEqual(pickle.loads(pickle.dumps(spec)), spec)
+
+        net = Net.from_spec(spec)
+        self.assertEqual(net.to_spec(), spec)
+        self.assertEqual([t.name for t in net.transitions], ["arrival", "open", "start", "service"])
+        self.assertEqual(net.compile().fire_repeatedly(10), self.net.compile().fire_repeatedly(10))
+
+    def test_callables_are_not_declarative(self):
+        self.net.add_timed_transition("timer", lambda: 1.0)
+        with self.assertRaises(ValueError):
+            self.net.to_spec()
+
+        self.net.add_timed_transition("other timer", Deterministic(1.0))
+        self.assertEqual(self.net.transition("other timer").sampler.to_spec(), dict(type="deterministic", value=1.0))
+
+
 if __name__ == '__main__':
     main()